@@ -93,13 +93,21 @@ JWT_AUTH = {
 
     'JWT_ALLOW_REFRESH': False,
     'JWT_REFRESH_EXPIRATION_DELTA': datetime.timedelta(days=7),
-    'JWT_GET_USER_SECRET_KEY': lambda user: user.secret_key
+    'JWT_GET_USER_SECRET_KEY': lambda user: user.secret_key,
+    'JWT_DECODE_HANDLER': 'odin.authentication.utils.jwt_decode_handler',
 }
 
+# How long an authenticated user stays in the cache between writes to its row
+USER_PRINCIPAL_CACHE_TIMEOUT = env.int('USER_PRINCIPAL_CACHE_TIMEOUT', default=60 * 15)
+
 REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'odin.apis.utils.exception_errors_format_handler',
 }
 
+# Keyset pagination, clients can ask for a different page size with `?page_size=`
+API_PAGE_SIZE = env.int('API_PAGE_SIZE', default=20)
+API_MAX_PAGE_SIZE = env.int('API_MAX_PAGE_SIZE', default=100)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -219,6 +227,8 @@ EMAIL_TEMPLATES = {
 TASK_PASSED = "Passed"
 TASK_FAILED = "Failed"
 
+SOLUTION_CODE_COMPRESSION = env.bool('SOLUTION_CODE_COMPRESSION', default=True)
+
 from .grader import *
 
 TINYMCE_DEFAULT_CONFIG = {
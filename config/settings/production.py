@@ -89,6 +89,14 @@ TEMPLATES[0]['OPTIONS']['loaders'] = [
 # Raises ImproperlyConfigured exception if DATABASE_URL not in os.environ
 DATABASES['default'] = env.db('DATABASE_URL')
 
+# CACHING
+# ------------------------------------------------------------------------------
+# The JWT principal cache is invalidated on logout / password change,
+# so every web process has to share the same cache.
+CACHES = {
+    'default': env.cache('REDIS_URL')
+}
+
 # Custom Admin URL, use {% url 'admin:index' %}
 ADMIN_URL = env('DJANGO_ADMIN_URL')
 
@@ -5,7 +5,11 @@ EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': ''
+        'LOCATION': '',
+        # Culling would evict version stamps at random and make query counts flaky.
+        'OPTIONS': {
+            'MAX_ENTRIES': 100000,
+        },
     }
 }
 
@@ -0,0 +1,173 @@
+import json
+import re
+from unittest import mock
+
+from rest_framework_jwt.settings import api_settings
+
+from django.test import Client
+from django.urls import RegexURLResolver, get_resolver, resolve
+
+from odin.common.benchmarks import benchmark
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+from odin.users.models import PasswordResetToken
+
+from odin.education.benchmarks import BENCHMARK_PASSWORD, seed_platform
+from odin.education.datasets import generate_lectures
+from odin.education.factories import ProgrammingLanguageFactory
+from odin.education.models import Certificate, CourseAssignment
+
+
+API_URLCONF = 'odin.apis.urls'
+API_PREFIX = '/api/'
+
+
+def _route_key(view, kwargs) -> tuple:
+    return (getattr(view, 'view_class', view), tuple(sorted(kwargs)))
+
+
+def _get_route_keys(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, RegexURLResolver):
+            yield from _get_route_keys(pattern.url_patterns)
+        else:
+            yield _route_key(pattern.callback, pattern.regex.groupindex)
+
+
+def _get_token(user) -> str:
+    payload = api_settings.JWT_PAYLOAD_HANDLER(user)
+
+    return api_settings.JWT_ENCODE_HANDLER(payload)
+
+
+class RouteBenchmark:
+    """
+    Measures requests through the whole middleware stack and remembers which routes were covered.
+    """
+    def __init__(self, runner):
+        self.runner = runner
+        self.client = Client(SERVER_NAME='localhost')
+        self.covered = set()
+
+    def measure(self, method: str, path: str, *, user=None, data=None, expected_status=None, rollback=False):
+        url = f'{API_PREFIX}{path}'
+        match = resolve(url)
+        self.covered.add(_route_key(match.func, match.kwargs))
+
+        headers = {}
+        if user is not None:
+            headers['HTTP_AUTHORIZATION'] = f'JWT {_get_token(user)}'
+
+        if method == 'get':
+            kwargs = {'data': data}
+        else:
+            kwargs = {'data': json.dumps(data or {}), 'content_type': 'application/json'}
+
+        def request():
+            response = getattr(self.client, method)(url, **kwargs, **headers)
+
+            if response.streaming:
+                b''.join(response.streaming_content)
+
+            if expected_status is None:
+                assert response.status_code < 400, f'{method.upper()} {url}: {response.status_code}'
+            else:
+                assert response.status_code == expected_status, f'{method.upper()} {url}: {response.status_code}'
+
+        # Ids and tokens change between runs, labels have to stay comparable with older baselines.
+        label = f'{method.upper()} {API_PREFIX}{re.sub("/([0-9]+|[0-9a-f-]{36})/", "/<id>/", path)}'
+
+        return self.runner.measure(label, request, rollback=rollback)
+
+    def get_uncovered_routes(self) -> set:
+        return set(_get_route_keys(get_resolver(API_URLCONF).url_patterns)) - self.covered
+
+
+@benchmark('apis.routes')
+def routes(runner):
+    data = seed_platform(runner)
+    course, teacher, student, task, solution = (
+        data['course'], data['teacher'], data['student'], data['task'], data['solution']
+    )
+    language = ProgrammingLanguageFactory()
+    reset_token = PasswordResetToken.objects.create(user=student)
+    certificate = Certificate.objects.create(assignment=CourseAssignment.objects.get(course=course, student=student))
+    cohort = BaseUserFactory.create_bulk(runner.scaled(300))
+    lectures = generate_lectures(course=course)
+    course_student_ids = list(course.students.values_list('id', flat=True))
+    routes = RouteBenchmark(runner)
+
+    routes.measure('get', 'education/courses/', user=student)
+    routes.measure('get', f'education/courses/{course.id}/', user=student)
+    routes.measure('get', f'education/task/{task.id}/', user=student)
+    routes.measure('get', f'education/solution/{solution.id}/', user=student)
+    routes.measure(
+        'post',
+        'education/solution/',
+        user=student,
+        data={'task': task.id, 'code': faker.text()},
+        rollback=True
+    )
+    routes.measure('get', f'education/courses/{course.id}/weeks/', user=teacher)
+    routes.measure('get', f'education/courses/{course.id}/teachers/', user=teacher)
+    routes.measure('get', f'education/courses/{course.id}/solutions/export/', user=teacher)
+    routes.measure('get', f'education/courses/{course.id}/attendance/', user=teacher)
+    routes.measure(
+        'post',
+        f'education/courses/{course.id}/attendance/',
+        user=teacher,
+        data={'lectures': [{'lecture': lecture.id, 'students': course_student_ids} for lecture in lectures]},
+        rollback=True
+    )
+    routes.measure('get', f'education/courses/{course.id}/leaderboard/', user=student)
+    routes.measure('get', f'education/courses/{course.id}/statistics/', user=teacher)
+    routes.measure('get', f'education/certificates/{certificate.token}/')
+    routes.measure(
+        'post',
+        f'education/courses/{course.id}/students/',
+        user=teacher,
+        data={'emails': [user.email for user in cohort]},
+        rollback=True
+    )
+
+    # The description is fetched after commit, which the rollback never reaches.
+    routes.measure(
+        'post',
+        f'education/courses/{course.id}/tasks/',
+        user=teacher,
+        data={
+            'name': faker.word(),
+            'code': faker.text(),
+            'description_url': faker.url(),
+            'gradable': True,
+            'language': language.id,
+            'week': task.week_id,
+        },
+        rollback=True
+    )
+
+    routes.measure('post', 'auth/login/', data={'email': student.email, 'password': BENCHMARK_PASSWORD})
+    routes.measure('get', 'auth/me/', user=student)
+    # Token refreshing is turned off, this measures how fast it is rejected.
+    routes.measure('post', 'auth/token-refresh/', data={'token': _get_token(student)}, expected_status=400)
+    routes.measure('post', 'auth/logout/', user=student, rollback=True)
+    routes.measure(
+        'post',
+        'auth/change-password/',
+        user=student,
+        data={'old_password': BENCHMARK_PASSWORD, 'new_password': BENCHMARK_PASSWORD},
+        rollback=True
+    )
+
+    with mock.patch('odin.authentication.services.send_mail'):
+        routes.measure('post', 'auth/forgot-password/reset/', data={'user': student.email}, rollback=True)
+
+    routes.measure(
+        'post',
+        'auth/forgot-password/set/',
+        data={'token': str(reset_token.token), 'password': BENCHMARK_PASSWORD},
+        rollback=True
+    )
+
+    uncovered = routes.get_uncovered_routes()
+    assert not uncovered, f'Routes without a benchmark: {uncovered}'
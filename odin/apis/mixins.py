@@ -27,3 +27,42 @@ class ServiceExceptionHandlerMixin:
             return super().handle_exception(drf_exception)
 
         return super().handle_exception(exc)
+
+
+class SparseFieldsetsMixin:
+    '''
+    Mixin that reads sparse fieldset query params for the view's serializers.
+
+    `?fields=id,name` limits the response to the listed top-level fields.
+    `?expand=description,code` includes heavy fields, which are left out by default.
+    Views should also defer the heavy columns they are not going to serialize.
+    '''
+    fields_query_param = 'fields'
+    expand_query_param = 'expand'
+
+    def _get_query_param_values(self, param):
+        value = self.request.query_params.get(param)
+
+        if not value:
+            return None
+
+        return {field.strip() for field in value.split(',') if field.strip()}
+
+    def get_requested_fields(self):
+        return self._get_query_param_values(self.fields_query_param)
+
+    def get_expanded_fields(self):
+        return self._get_query_param_values(self.expand_query_param) or set()
+
+    def is_expanded(self, field):
+        return field in self.get_expanded_fields()
+
+    def get_serializer_context(self):
+        context = {}
+        if hasattr(super(), 'get_serializer_context'):
+            context = super().get_serializer_context()
+
+        context['fields'] = self.get_requested_fields()
+        context['expand'] = self.get_expanded_fields()
+
+        return context
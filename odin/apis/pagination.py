@@ -0,0 +1,16 @@
+from django.conf import settings
+
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination over `-id`.
+
+    Each page is a single `WHERE id < cursor ORDER BY id DESC LIMIT n` query,
+    so the cost does not grow with how deep the client pages.
+    """
+    ordering = '-id'
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.API_MAX_PAGE_SIZE
@@ -0,0 +1,153 @@
+from collections import Mapping
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+
+from rest_framework import serializers
+from rest_framework.fields import Field, SkipField, is_simple_callable
+from rest_framework.relations import PKOnlyObject
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Applies the `fields` / `expand` context set up by `SparseFieldsetsMixin`.
+
+    Fields listed in `Meta.expandable_fields` are dropped unless expanded.
+    When `fields` is given, every other top-level field is dropped as well.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        requested = self.context.get('fields')
+        expandable = getattr(getattr(self, 'Meta', None), 'expandable_fields', ())
+
+        for field_name in list(self.fields):
+            if field_name in expandable and not self.is_expanded(field_name):
+                self.fields.pop(field_name)
+            elif requested is not None and field_name not in requested:
+                self.fields.pop(field_name)
+
+    def is_expanded(self, field):
+        return field in self.context.get('expand', ())
+
+
+FAST_REPRESENTATIONS = {
+    serializers.IntegerField: int,
+    serializers.CharField: str,
+    serializers.FloatField: float,
+}
+
+
+def _compile_getter(field):
+    if type(field).get_attribute is not Field.get_attribute:
+        return field.get_attribute
+
+    source_attrs = field.source_attrs
+
+    def get_attribute(instance):
+        # Same lookups and errors as DRF, with the cheap checks first.
+        # A missing attribute or key falls back to the field for its default / allow_null / required handling.
+        value = instance
+
+        for attr in source_attrs:
+            try:
+                if isinstance(value, dict) or isinstance(value, Mapping):
+                    value = value[attr]
+                else:
+                    value = getattr(value, attr)
+            except ObjectDoesNotExist:
+                return None
+            except (KeyError, AttributeError):
+                return field.get_attribute(instance)
+
+            if callable(value) and is_simple_callable(value):
+                try:
+                    value = value()
+                except (KeyError, AttributeError) as exc:
+                    raise ValueError(f'Exception raised in callable attribute "{attr}"; original exception was: {exc}')
+
+        return value
+
+    return get_attribute
+
+
+def _compile_list(serializer):
+    if type(serializer).to_representation is not serializers.ListSerializer.to_representation:
+        return None
+
+    child = _compile_serializer(serializer.child)
+    if child is None:
+        return None
+
+    def to_representation(data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+
+        return [child(item) for item in iterable]
+
+    return to_representation
+
+
+def _compile_field(field):
+    compiled = None
+
+    if isinstance(field, serializers.ListSerializer):
+        compiled = _compile_list(field)
+    elif isinstance(field, serializers.Serializer):
+        compiled = _compile_serializer(field)
+
+    return compiled or FAST_REPRESENTATIONS.get(type(field), field.to_representation)
+
+
+def _compile_serializer(serializer):
+    if type(serializer).to_representation not in COMPILABLE_REPRESENTATIONS:
+        return None
+
+    plan = [
+        (field.field_name, _compile_getter(field), _compile_field(field))
+        for field in serializer._readable_fields
+    ]
+
+    def to_representation(instance):
+        ret = {}
+
+        for field_name, get_attribute, field_to_representation in plan:
+            try:
+                attribute = get_attribute(instance)
+            except SkipField:
+                continue
+
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field_name] = None
+            else:
+                ret[field_name] = field_to_representation(attribute)
+
+        return ret
+
+    return to_representation
+
+
+class CompiledSerializerMixin:
+    """
+    Read-only fast path for serializers that render many objects.
+
+    The bound fields, including the nested serializers, are compiled once per serializer instance
+    into a flat plan, so every rendered object skips the per-field lookups DRF repeats.
+    Primitive fields are converted directly and plain dicts are returned instead of OrderedDicts.
+
+    Nested serializers that override `to_representation` keep going through it.
+    """
+    def to_representation(self, instance):
+        compiled = getattr(self, '_compiled_representation', None)
+
+        if compiled is None:
+            compiled = _compile_serializer(self)
+            self._compiled_representation = compiled
+
+        return compiled(instance)
+
+
+COMPILABLE_REPRESENTATIONS = (
+    serializers.Serializer.to_representation,
+    CompiledSerializerMixin.to_representation,
+)
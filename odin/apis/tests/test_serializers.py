@@ -0,0 +1,102 @@
+from test_plus import TestCase
+
+from django.core.exceptions import ObjectDoesNotExist
+
+from rest_framework import serializers
+
+from odin.common.utils import inline_serializer
+
+from odin.apis.serializers import CompiledSerializerMixin
+
+
+class TestInlineSerializer(TestCase):
+    def make_fields(self):
+        return {
+            'id': serializers.IntegerField(),
+            'tasks': inline_serializer(many=True, fields={
+                'name': serializers.CharField(source='task_name'),
+            }),
+        }
+
+    def test_equal_field_specs_reuse_the_serializer_class(self):
+        first = inline_serializer(fields=self.make_fields())
+        second = inline_serializer(fields=self.make_fields())
+
+        self.assertIs(first.__class__, second.__class__)
+
+    def test_different_field_specs_get_different_classes(self):
+        first = inline_serializer(fields={'id': serializers.IntegerField()})
+        second = inline_serializer(fields={'id': serializers.IntegerField(source='pk')})
+
+        self.assertIsNot(first.__class__, second.__class__)
+
+    def test_unhashable_field_specs_still_work(self):
+        fields = {'ids': serializers.MultipleChoiceField(choices={1, 2})}
+
+        first = inline_serializer(fields=fields, data={'ids': [1]})
+        second = inline_serializer(fields=fields, data={'ids': [1]})
+
+        self.assertIsNot(first.__class__, second.__class__)
+        self.assertTrue(first.is_valid())
+
+
+class TestCompiledSerializerMixin(TestCase):
+    class Serializer(serializers.Serializer):
+        id = serializers.IntegerField()
+        name = serializers.CharField(source='user.name')
+        missing = serializers.CharField(required=False)
+        nothing = serializers.CharField(allow_null=True)
+        upper = serializers.SerializerMethodField()
+        items = inline_serializer(many=True, fields={
+            'value': serializers.IntegerField(),
+            'extra': serializers.DictField(required=False),
+        })
+
+        def get_upper(self, obj):
+            return obj['user']['name'].upper()
+
+    class CompiledSerializer(CompiledSerializerMixin, Serializer):
+        pass
+
+    def test_renders_the_same_data_as_drf(self):
+        instances = [
+            {
+                'id': index,
+                'user': {'name': f'name {index}'},
+                'nothing': None,
+                'items': [{'value': index}, {'value': '2', 'extra': {'a': 1}}],
+            }
+            for index in range(3)
+        ]
+
+        self.assertEqual(
+            self.Serializer(instances, many=True).data,
+            self.CompiledSerializer(instances, many=True).data
+        )
+
+    def test_errors_raised_by_attributes_are_not_retried(self):
+        calls = []
+
+        class User:
+            @property
+            def name(self):
+                calls.append(1)
+                raise ValueError('broken')
+
+        instance = {'id': 1, 'user': User(), 'nothing': None, 'items': []}
+
+        with self.assertRaises(ValueError):
+            self.CompiledSerializer(instance).data
+
+        self.assertEqual(1, len(calls))
+
+    def test_missing_related_objects_are_rendered_as_null(self):
+        class User:
+            @property
+            def name(self):
+                raise ObjectDoesNotExist
+
+        class CompiledSerializer(CompiledSerializerMixin, serializers.Serializer):
+            name = serializers.CharField(source='user.name')
+
+        self.assertEqual({'name': None}, CompiledSerializer({'user': User()}).data)
@@ -1,3 +1,10 @@
+import hashlib
+from functools import wraps
+
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
 from rest_framework.views import exception_handler
 from .formatters import ErrorsFormatter
 
@@ -36,3 +43,29 @@ def get_error_message(exc):
         error_msg = str(exc)
 
     return error_msg
+
+
+def conditional_get(etag_func):
+    """
+    Method decorator for `get` handlers of API views.
+
+    Answers `If-None-Match` with 304 when `etag_func(request, *args, **kwargs)`
+    matches, without calling the handler. Runs after authentication and permissions.
+    """
+    def decorator(func):
+        conditional_func = condition(etag_func=etag_func)(func)
+
+        @wraps(func)
+        def inner(request, *args, **kwargs):
+            response = conditional_func(request, *args, **kwargs)
+            patch_cache_control(response, private=True, no_cache=True)
+
+            return response
+
+        return inner
+
+    return method_decorator(decorator)
+
+
+def make_etag(*parts) -> str:
+    return hashlib.md5(':'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
@@ -3,6 +3,7 @@ import factory
 from django.utils import timezone
 
 from odin.common.faker import faker
+from odin.common.factories import BulkCreateFactoryMixin
 from odin.education.factories import CourseFactory
 from odin.users.factories import BaseUserFactory
 
@@ -12,7 +13,7 @@ from .models import (
 )
 
 
-class ApplicationInfoFactory(factory.DjangoModelFactory):
+class ApplicationInfoFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     start_date = factory.LazyAttribute(lambda _: timezone.now().date() + timezone.timedelta(days=faker.pyint()))
     end_date = factory.LazyAttribute(lambda _: timezone.now().date() + timezone.timedelta(days=faker.pyint()))
     course = factory.SubFactory(CourseFactory)
@@ -25,7 +26,7 @@ class ApplicationInfoFactory(factory.DjangoModelFactory):
         model = ApplicationInfo
 
 
-class ApplicationFactory(factory.DjangoModelFactory):
+class ApplicationFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     application_info = factory.SubFactory(ApplicationInfoFactory)
     user = factory.SubFactory(BaseUserFactory)
     phone = factory.LazyAttribute(lambda _: faker.phone_number())
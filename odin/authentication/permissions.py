@@ -1,7 +1,44 @@
+from django.utils.translation import ugettext as _
+
+from rest_framework import exceptions
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_jwt.authentication import JSONWebTokenAuthentication
+from rest_framework_jwt.settings import api_settings
+
+from odin.users.models import BaseUser
+from odin.users.cache import get_cached_user
+
+
+jwt_get_username_from_payload = api_settings.JWT_PAYLOAD_GET_USERNAME_HANDLER
+
+
+class CachedJSONWebTokenAuthentication(JSONWebTokenAuthentication):
+    """
+    Resolves the token's user through the principal cache.
+
+    The token signature is already verified against the cached secret key,
+    so a rotated key invalidates both lookups at once.
+    """
+    def authenticate_credentials(self, payload):
+        username = jwt_get_username_from_payload(payload)
+
+        if not username:
+            raise exceptions.AuthenticationFailed(_('Invalid payload.'))
+
+        try:
+            user = get_cached_user(user_id=payload.get('user_id'))
+        except BaseUser.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid signature.'))
+
+        if user.get_username() != username:
+            raise exceptions.AuthenticationFailed(_('Invalid signature.'))
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User account is disabled.'))
+
+        return user
 
 
 class JSONWebTokenAuthenticationMixin:
-    authentication_classes = (JSONWebTokenAuthentication,)
+    authentication_classes = (CachedJSONWebTokenAuthentication,)
     permission_classes = (IsAuthenticated, )
@@ -14,11 +14,7 @@ from odin.users.models import (
     PasswordResetToken
 )
 
-from odin.education.models import (
-    Student,
-    Teacher,
-    Course,
-)
+from odin.education.models import CourseAssignment
 
 
 class _ProfileSerializer(serializers.ModelSerializer):
@@ -44,14 +40,18 @@ TEACHER_TYPE = 'teacher'
 
 
 def get_user_courses_per_user_type(*, user: BaseUser) -> str:
-    teacher = user.downcast(Teacher)
-    student = user.downcast(Student)
-
-    teacher_courses = Course.objects.filter(
-        teachers__in=[teacher]).values_list('id', flat=True)
-
-    student_courses = Course.objects.filter(
-        students__in=[student]).values_list('id', flat=True)
+    assignments = CourseAssignment.objects.filter(
+        Q(student_id=user.id) | Q(teacher_id=user.id)
+    ).order_by('course_id').values_list('course_id', 'student_id', 'teacher_id')
+
+    student_courses = []
+    teacher_courses = []
+
+    for course_id, student_id, teacher_id in assignments:
+        if student_id == user.id:
+            student_courses.append(course_id)
+        if teacher_id == user.id:
+            teacher_courses.append(course_id)
 
     return {
         STUDENT_TYPE: student_courses,
@@ -1,5 +1,5 @@
 from test_plus import TestCase
-from django.test import Client
+from django.test import Client, RequestFactory
 
 import jwt
 
@@ -7,6 +7,10 @@ from jwt.exceptions import InvalidSignatureError
 
 from django.shortcuts import reverse
 
+from rest_framework.exceptions import AuthenticationFailed
+
+from odin.authentication.permissions import CachedJSONWebTokenAuthentication
+
 from odin.users.factories import BaseUserFactory
 
 from odin.common.faker import faker
@@ -100,3 +104,49 @@ class TestJWTSecret(TestCase):
         self.user.refresh_from_db()
 
         self.assertNotEqual(self.init_secret_key, self.user.secret_key)
+
+
+class TestCachedJWTAuthentication(TestCase):
+    def setUp(self):
+        self.test_password = faker.password()
+        self.user = BaseUserFactory()
+        self.user.set_password(self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.login_url = reverse('api:auth:login')
+        self.user_detail_url = reverse('api:auth:user-detail')
+        self.data = {
+            'email': self.user.email,
+            'password': self.test_password,
+        }
+        self.token = self.post(self.login_url, data=self.data).data['token']
+
+    def authenticate(self):
+        request = RequestFactory().get(self.user_detail_url, HTTP_AUTHORIZATION=f'JWT {self.token}')
+
+        return CachedJSONWebTokenAuthentication().authenticate(request)
+
+    def test_authenticated_user_is_served_from_cache(self):
+        user, _ = self.authenticate()
+
+        with self.assertNumQueries(0):
+            cached_user, _ = self.authenticate()
+
+        self.assertEqual(user, cached_user)
+
+    def test_rotating_secret_key_invalidates_cached_principal(self):
+        self.authenticate()
+
+        self.user.rotate_secret_key()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deactivating_user_invalidates_cached_principal(self):
+        self.authenticate()
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
@@ -0,0 +1,66 @@
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.common.testing import QueryBudgetAssertionsMixin
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Student, Teacher
+from odin.education.services import add_student, add_teacher
+from odin.education.factories import CourseFactory
+
+
+class TestAuthenticationApiQueryBudgets(QueryBudgetAssertionsMixin, TestCase):
+    """
+    Every endpoint is measured for a user in a single course and again after
+    the user joined more courses, so the budgets do not depend on the course count.
+    """
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.student = Student.objects.create_from_user(self.user)
+        self.teacher = Teacher.objects.create_from_user(self.user)
+
+        self.join_courses(courses=1)
+
+        self.login_data = {'email': self.user.email, 'password': self.test_password}
+
+    def join_courses(self, *, courses):
+        for _ in range(courses):
+            add_student(course=CourseFactory(), student=self.student)
+            add_teacher(CourseFactory(), self.teacher)
+
+    def get_auth(self):
+        token = self.client.post(self.reverse('api:auth:login'), data=self.login_data).data['token']
+
+        return {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def assertRequestBudget(self, budget, method, url, **kwargs):
+        getattr(self.client, method)(url, **kwargs)
+
+        for grow in (False, True):
+            if grow:
+                self.join_courses(courses=5)
+
+            with self.assertQueryBudget(budget):
+                response = getattr(self.client, method)(url, **kwargs)
+
+            self.assertLess(response.status_code, 400)
+
+    def test_login(self):
+        self.assertRequestBudget(5, 'post', self.reverse('api:auth:login'), data=self.login_data)
+
+    def test_user_detail(self):
+        self.assertRequestBudget(3, 'get', self.reverse('api:auth:user-detail'), **self.get_auth())
+
+    def test_forgot_password_reset(self):
+        self.assertRequestBudget(
+            4,
+            'post',
+            self.reverse('api:auth:forgot-password-reset'),
+            data={'user': self.user.email}
+        )
@@ -0,0 +1,40 @@
+import jwt
+
+from rest_framework_jwt.settings import api_settings
+
+from odin.users.models import BaseUser
+from odin.users.cache import get_cached_user
+
+
+def jwt_get_secret_key(payload: dict) -> str:
+    """
+    Same as `rest_framework_jwt.utils.jwt_get_secret_key`,
+    but reads the user from the principal cache instead of hitting the database.
+    """
+    try:
+        user = get_cached_user(user_id=payload.get('user_id'))
+    except BaseUser.DoesNotExist:
+        raise jwt.InvalidTokenError('User does not exist.')
+
+    return str(api_settings.JWT_GET_USER_SECRET_KEY(user))
+
+
+def jwt_decode_handler(token: str) -> dict:
+    options = {
+        'verify_exp': api_settings.JWT_VERIFY_EXPIRATION,
+    }
+
+    # We need the user before verification, to get their secret key
+    unverified_payload = jwt.decode(token, None, False)
+    secret_key = jwt_get_secret_key(unverified_payload)
+
+    return jwt.decode(
+        token,
+        api_settings.JWT_PUBLIC_KEY or secret_key,
+        api_settings.JWT_VERIFY,
+        options=options,
+        leeway=api_settings.JWT_LEEWAY,
+        audience=api_settings.JWT_AUDIENCE,
+        issuer=api_settings.JWT_ISSUER,
+        algorithms=[api_settings.JWT_ALGORITHM]
+    )
@@ -0,0 +1,153 @@
+import statistics
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+from django.db import connection, reset_queries, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.module_loading import autodiscover_modules
+
+
+registry = OrderedDict()
+
+
+class BenchmarkRollback(Exception):
+    pass
+
+
+def benchmark(name: str):
+    """
+    Registers a benchmark suite.
+
+    Suites live in the `benchmarks` module of each app and receive a `BenchmarkRunner`.
+    They run in a transaction that is rolled back, so the seeded data never stays in the database.
+    """
+    def decorator(suite):
+        registry[name] = suite
+        return suite
+
+    return decorator
+
+
+def autodiscover():
+    autodiscover_modules('benchmarks')
+
+
+def rolled_back(func: Callable) -> Callable:
+    """
+    Wraps `func` in a savepoint that is rolled back,
+    so benchmarks of writes measure the same work on every run.
+    """
+    def wrapper():
+        sid = transaction.savepoint()
+        try:
+            return func()
+        finally:
+            transaction.savepoint_rollback(sid)
+
+    return wrapper
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = round(percent / 100 * (len(ordered) - 1))
+
+    return ordered[index]
+
+
+def compare_results(baseline: Dict, results: Dict, *, tolerance: float) -> List[Dict]:
+    """
+    Returns the measurements of `results` that are slower than the same measurement of `baseline`
+    by more than `tolerance` (0.2 is 20%), or run more queries.
+    Measurements missing from either side are skipped.
+    """
+    regressions = []
+
+    for suite, measurements in results.items():
+        baseline_measurements = {result['label']: result for result in baseline.get(suite, [])}
+
+        for result in measurements:
+            previous = baseline_measurements.get(result['label'])
+            if previous is None:
+                continue
+
+            slower = result['p50_ms'] > previous['p50_ms'] * (1 + tolerance)
+            more_queries = result['queries'] > previous['queries']
+
+            if slower or more_queries:
+                regressions.append(OrderedDict([
+                    ('suite', suite),
+                    ('label', result['label']),
+                    ('baseline_p50_ms', previous['p50_ms']),
+                    ('p50_ms', result['p50_ms']),
+                    ('baseline_queries', previous['queries']),
+                    ('queries', result['queries']),
+                ]))
+
+    return regressions
+
+
+class BenchmarkRunner:
+    """
+    `scale` shrinks or grows the seeded volumes of every suite that sizes its data with `scaled`.
+    """
+    def __init__(self, *, repeat: int=20, scale: float=1.0, stdout=None):
+        self.repeat = repeat
+        self.scale = scale
+        self.stdout = stdout
+        self.results = []
+
+    def scaled(self, count: int) -> int:
+        return max(1, int(count * self.scale))
+
+    def measure(self, label: str, func: Callable, *, repeat: int=None, rollback: bool=False) -> dict:
+        repeat = repeat or self.repeat
+        timings = []
+
+        if rollback:
+            func = rolled_back(func)
+
+        # Warm up caches and lazy imports outside of the measured runs.
+        func()
+
+        # The query log is capped, seeding can fill it up.
+        reset_queries()
+        with CaptureQueriesContext(connection) as queries:
+            func()
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        result = OrderedDict([
+            ('label', label),
+            ('runs', repeat),
+            ('queries', len(queries)),
+            ('mean_ms', round(statistics.mean(timings), 3)),
+            ('p50_ms', round(_percentile(timings, 50), 3)),
+            ('p95_ms', round(_percentile(timings, 95), 3)),
+            ('max_ms', round(max(timings), 3)),
+            ('throughput_per_s', round(len(timings) / sum(timings) * 1000, 2)),
+        ])
+        self.results.append(result)
+
+        if self.stdout is not None:
+            self.stdout.write(
+                '{label}: {queries} queries, p50 {p50_ms}ms, p95 {p95_ms}ms, max {max_ms}ms, '
+                '{throughput_per_s}/s'.format(**result)
+            )
+
+        return result
+
+    def run(self, name: str):
+        suite = registry[name]
+
+        try:
+            with transaction.atomic():
+                suite(self)
+                raise BenchmarkRollback
+        except BenchmarkRollback:
+            pass
+
+        return self.results
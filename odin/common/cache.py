@@ -0,0 +1,120 @@
+import uuid
+from typing import Callable, Iterable
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import post_save, post_delete
+
+
+VERSION_CACHE_KEY = 'versions:{key}'
+
+
+def _new_version() -> str:
+    # Random stamps instead of counters,
+    # so an evicted key can never come back with an already used value.
+    return uuid.uuid4().hex
+
+
+def get_versions(*keys: str) -> list:
+    """
+    Returns the current version stamp for each of `keys`, creating the missing ones.
+    Costs a single cache round trip when all stamps exist.
+    """
+    cache_keys = [VERSION_CACHE_KEY.format(key=key) for key in keys]
+    versions = cache.get_many(cache_keys)
+
+    for cache_key in cache_keys:
+        if cache_key not in versions:
+            cache.add(cache_key, _new_version(), None)
+            versions[cache_key] = cache.get(cache_key)
+
+    return [versions[cache_key] for cache_key in cache_keys]
+
+
+def get_version(key: str) -> str:
+    return get_versions(key)[0]
+
+
+def _set_new_versions(keys):
+    cache.set_many({VERSION_CACHE_KEY.format(key=key): _new_version() for key in keys}, None)
+
+
+def bump_versions(*keys: str):
+    """
+    Moves each of `keys` to a new version stamp.
+
+    The stamps are bumped once right away and once more when the surrounding transaction commits,
+    so a reader that picked up the new stamp together with not yet committed data cannot keep it.
+    """
+    if not keys:
+        return
+
+    _set_new_versions(keys)
+
+    transaction.on_commit(lambda: _set_new_versions(keys))
+
+
+class ReferenceData:
+    """
+    Process-local cache for small, near-static tables.
+
+    Every process keeps its own copy of the loaded value, tagged with the version stamp
+    it was loaded under. A read costs one cache round trip to compare stamps;
+    the loader only runs again after `invalidate` bumped the stamp in any process.
+
+    `models` get their post_save / post_delete signals connected to `invalidate`
+    until `disconnect` is called. A second instance with the same key replaces those receivers.
+    """
+    def __init__(self, *, key: str, loader: Callable, models: Iterable=()):
+        self.key = key
+        self.loader = loader
+        self.models = tuple(models)
+
+        self._entry = None
+
+        for model in self.models:
+            post_save.connect(self._handle_change, sender=model, weak=False, dispatch_uid=self._dispatch_uid)
+            post_delete.connect(self._handle_change, sender=model, weak=False, dispatch_uid=self._dispatch_uid)
+
+    @property
+    def _dispatch_uid(self) -> str:
+        return f'reference-data:{self.key}'
+
+    def disconnect(self):
+        for model in self.models:
+            post_save.disconnect(sender=model, dispatch_uid=self._dispatch_uid)
+            post_delete.disconnect(sender=model, dispatch_uid=self._dispatch_uid)
+
+    def _handle_change(self, sender, **kwargs):
+        self.invalidate()
+
+    def _changes_committed(self):
+        pass
+
+    def _has_uncommitted_changes(self):
+        # A transaction with uncommitted changes to the data must not cache what it reads,
+        # since it disappears if the transaction rolls back.
+        # Until it commits, its connection keeps `_changes_committed` queued.
+        return any(func == self._changes_committed for _, func in connection.run_on_commit)
+
+    @property
+    def version(self) -> str:
+        return get_version(self.key)
+
+    def get(self):
+        if self._has_uncommitted_changes():
+            return self.loader()
+
+        version = self.version
+        entry = self._entry
+
+        if entry is None or entry[0] != version:
+            entry = (version, self.loader())
+            self._entry = entry
+
+        return entry[1]
+
+    def invalidate(self):
+        bump_versions(self.key)
+
+        transaction.on_commit(self._changes_committed)
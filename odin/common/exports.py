@@ -0,0 +1,75 @@
+import csv
+import json
+from typing import Iterable, Iterator, Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+
+EXPORT_CONTENT_TYPES = {
+    CSV: 'text/csv',
+    NDJSON: 'application/x-ndjson',
+}
+
+
+def iterate_in_chunks(queryset: QuerySet, *, chunk_size: int=EXPORT_CHUNK_SIZE) -> Iterator:
+    """
+    Yields the rows of `queryset` (a `.values()` queryset) in primary key order,
+    fetching `chunk_size` rows per query, so memory stays flat no matter how many rows there are.
+    """
+    last_id = None
+
+    while True:
+        chunk = queryset.order_by('id')
+        if last_id is not None:
+            chunk = chunk.filter(id__gt=last_id)
+
+        rows = 0
+        for row in chunk[:chunk_size].iterator():
+            rows += 1
+            last_id = row['id']
+            yield row
+
+        if rows < chunk_size:
+            return
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows: Iterable[dict], *, fields: Sequence[str]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+
+    yield writer.writerow(fields)
+
+    for row in rows:
+        yield writer.writerow([_to_csv_value(row[field]) for field in fields])
+
+
+def _to_csv_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+
+    return value
+
+
+def stream_ndjson(rows: Iterable[dict], *, fields: Sequence[str]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps({field: row[field] for field in fields}, cls=DjangoJSONEncoder) + '\n'
+
+
+def stream_export(rows: Iterable[dict], *, fields: Sequence[str], export_format: str) -> Iterator[str]:
+    if export_format == CSV:
+        return stream_csv(rows, fields=fields)
+
+    if export_format == NDJSON:
+        return stream_ndjson(rows, fields=fields)
+
+    raise ValueError(f'Unknown export format: {export_format}')
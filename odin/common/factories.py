@@ -0,0 +1,45 @@
+from typing import List
+
+
+BULK_CREATE_BATCH_SIZE = 5000
+
+
+class BulkCreateFactoryMixin:
+    """
+    Adds `create_bulk` to a `DjangoModelFactory`.
+
+    The instances are built from the factory declarations and inserted with `bulk_create`,
+    which skips `save`, `full_clean` and the model signals.
+    Factories replay the signal side effects their data depends on in `_after_create_bulk`.
+
+    Sub factories are only built, so related objects have to be passed in.
+    `factory.Iterator` spreads a list of them over the instances.
+    """
+    @classmethod
+    def _to_bulk_instance(cls, built):
+        return built
+
+    @classmethod
+    def _before_create_bulk(cls, instances: List):
+        pass
+
+    @classmethod
+    def _after_create_bulk(cls, instances: List):
+        pass
+
+    @classmethod
+    def create_bulk(cls, size: int, *, batch_size: int=BULK_CREATE_BATCH_SIZE, **kwargs) -> List:
+        model = cls._meta.model
+        created = []
+
+        for start in range(0, size, batch_size):
+            built = cls.build_batch(min(batch_size, size - start), **kwargs)
+            instances = [cls._to_bulk_instance(instance) for instance in built]
+
+            cls._before_create_bulk(instances)
+            instances = model.objects.bulk_create(instances)
+            cls._after_create_bulk(instances)
+
+            created.extend(instances)
+
+        return created
@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from odin.education.datasets import generate_education_dataset
+from odin.interviews.datasets import generate_interviews_dataset
+
+
+class Command(BaseCommand):
+    help = 'Generates a large, coherent dataset of users, courses, solutions, applications and interviews.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--courses', type=int, default=50)
+        parser.add_argument('--students', type=int, default=10000)
+        parser.add_argument('--tasks', type=int, default=500)
+        parser.add_argument('--solutions', type=int, default=2000000)
+        parser.add_argument('--applications', type=int, default=5000)
+        parser.add_argument('--interviewers', type=int, default=50)
+        parser.add_argument('--password', help='Password of every generated user. Random if omitted.')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+
+        with transaction.atomic():
+            education = generate_education_dataset(
+                courses_count=options['courses'],
+                students_count=options['students'],
+                tasks_count=options['tasks'],
+                solutions_count=options['solutions'],
+                password=options['password']
+            )
+            self.stdout.write(f'Education data generated in {time.perf_counter() - start:.1f}s')
+
+            interviews = generate_interviews_dataset(
+                courses=education['courses'],
+                applications_count=options['applications'],
+                interviewers_count=options['interviewers'],
+                password=options['password']
+            )
+            self.stdout.write(f'Interview data generated in {time.perf_counter() - start:.1f}s')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(education["courses"])} courses, '
+            f'{sum(len(students) for students in education["students_per_course"].values())} students, '
+            f'{len(interviews["applications"])} applications and '
+            f'{len(interviews["interviews"])} interview slots generated in {time.perf_counter() - start:.1f}s'
+        ))
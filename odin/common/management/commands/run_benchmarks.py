@@ -0,0 +1,61 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from odin.common.benchmarks import BenchmarkRunner, autodiscover, compare_results, registry
+
+
+class Command(BaseCommand):
+    help = 'Runs the registered benchmark suites against the configured database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('suites', nargs='*', help='Names of the suites to run. Runs all if omitted.')
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--scale', type=float, default=1.0, help='Multiplier for the seeded data volumes.')
+        parser.add_argument('--output', help='Path of a JSON file to store the results in.')
+        parser.add_argument('--baseline', help='Path of a JSON file with earlier results to compare against.')
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.2,
+            help='Allowed p50 slowdown against the baseline, as a fraction.'
+        )
+        parser.add_argument('--list', action='store_true', help='Lists the available suites.')
+
+    def handle(self, *args, **options):
+        autodiscover()
+
+        if options['list']:
+            for name in registry:
+                self.stdout.write(name)
+            return
+
+        names = options['suites'] or list(registry)
+        unknown = [name for name in names if name not in registry]
+        if unknown:
+            raise CommandError(f'Unknown benchmark suites: {", ".join(unknown)}')
+
+        results = {}
+        for name in names:
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            runner = BenchmarkRunner(repeat=options['repeat'], scale=options['scale'], stdout=self.stdout)
+            results[name] = runner.run(name)
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2)
+
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                baseline = json.load(f)
+
+            regressions = compare_results(baseline, results, tolerance=options['tolerance'])
+
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(
+                    '{suite} / {label}: p50 {baseline_p50_ms}ms -> {p50_ms}ms, '
+                    'queries {baseline_queries} -> {queries}'.format(**regression)
+                ))
+
+            if regressions:
+                raise CommandError(f'{len(regressions)} benchmarks regressed against {options["baseline"]}')
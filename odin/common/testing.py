@@ -0,0 +1,110 @@
+import os
+import traceback
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.backends.utils import CursorDebugWrapper
+
+import odin
+
+
+PROJECT_DIR = os.path.dirname(odin.__file__)
+
+IGNORED_STATEMENTS = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+
+
+def get_query_plan(queryset) -> str:
+    """
+    Returns the plan Postgres picks for `queryset` with sequential scans disabled.
+    The planner only falls back to a sequential scan then when no index can serve the query.
+    """
+    sql, params = queryset.query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+        cursor.execute(f'EXPLAIN {sql}', params)
+        plan = '\n'.join(row[0] for row in cursor.fetchall())
+        cursor.execute('RESET enable_seqscan')
+
+    return plan
+
+
+class QueryPlanAssertionsMixin:
+    def assertUsesIndexes(self, queryset, *, index: str=None):
+        plan = get_query_plan(queryset)
+
+        self.assertNotIn('Seq Scan', plan, msg=f'The query falls back to a sequential scan:\n{plan}')
+
+        if index is not None:
+            self.assertIn(index, plan, msg=f'The query does not use {index}:\n{plan}')
+
+
+class QueryRecorder:
+    """
+    Records the SQL run on the `using` database together with the stack that issued it.
+
+    Django 1.11 has no `execute_wrapper`, so the debug cursor is patched while recording.
+    Savepoint statements are left out, since they only come from transaction management.
+    """
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.db = connections[using]
+        self.queries = []
+
+    def _wrap(self, execute):
+        recorder = self
+
+        def wrapper(cursor, sql, params=None):
+            if cursor.db.alias == recorder.db.alias and not sql.startswith(IGNORED_STATEMENTS):
+                recorder.queries.append((sql, traceback.extract_stack()[:-1]))
+
+            return execute(cursor, sql, params)
+
+        return wrapper
+
+    def __enter__(self):
+        self._force_debug_cursor = self.db.force_debug_cursor
+        self._execute = CursorDebugWrapper.execute
+        self._executemany = CursorDebugWrapper.executemany
+
+        self.db.force_debug_cursor = True
+        CursorDebugWrapper.execute = self._wrap(self._execute)
+        CursorDebugWrapper.executemany = self._wrap(self._executemany)
+
+        return self
+
+    def __exit__(self, *args):
+        CursorDebugWrapper.execute = self._execute
+        CursorDebugWrapper.executemany = self._executemany
+        self.db.force_debug_cursor = self._force_debug_cursor
+
+    def __len__(self):
+        return len(self.queries)
+
+    def format(self) -> str:
+        """
+        Every query with the project frames of the stack that ran it.
+        """
+        lines = []
+
+        for index, (sql, stack) in enumerate(self.queries, start=1):
+            lines.append(f'{index}. {sql}')
+
+            for frame in stack:
+                if frame.filename.startswith(PROJECT_DIR) and frame.filename != __file__:
+                    lines.append(f'    {os.path.relpath(frame.filename, PROJECT_DIR)}:{frame.lineno} in {frame.name}')
+                    lines.append(f'        {frame.line}')
+
+        return '\n'.join(lines)
+
+
+class QueryBudgetAssertionsMixin:
+    @contextmanager
+    def assertQueryBudget(self, budget: int):
+        """
+        Fails when the block runs more than `budget` queries and reports where each of them came from.
+        """
+        with QueryRecorder() as recorder:
+            yield recorder
+
+        if len(recorder) > budget:
+            self.fail(f'{len(recorder)} queries executed, the budget is {budget}:\n{recorder.format()}')
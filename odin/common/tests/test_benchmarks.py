@@ -0,0 +1,58 @@
+from test_plus import TestCase
+
+from odin.users.models import BaseUser
+from odin.users.factories import BaseUserFactory
+
+from ..benchmarks import BenchmarkRunner, compare_results
+
+
+class TestBenchmarkRunner(TestCase):
+    def test_measure_reports_queries_and_throughput(self):
+        runner = BenchmarkRunner(repeat=3)
+
+        result = runner.measure('count users', lambda: BaseUser.objects.count())
+
+        self.assertEqual(1, result['queries'])
+        self.assertEqual(3, result['runs'])
+        self.assertGreater(result['throughput_per_s'], 0)
+
+    def test_measure_with_rollback_leaves_no_writes_behind(self):
+        runner = BenchmarkRunner(repeat=3)
+        count = BaseUser.objects.count()
+
+        runner.measure('create user', lambda: BaseUserFactory(), rollback=True)
+
+        self.assertEqual(count, BaseUser.objects.count())
+
+    def test_scaled_never_goes_below_one(self):
+        runner = BenchmarkRunner(scale=0.001)
+
+        self.assertEqual(1, runner.scaled(50))
+        self.assertEqual(10, runner.scaled(10000))
+
+
+class TestCompareResults(TestCase):
+    def setUp(self):
+        self.baseline = {'suite': [{'label': 'route', 'p50_ms': 10.0, 'queries': 3}]}
+
+    def test_slower_than_the_tolerance_is_a_regression(self):
+        results = {'suite': [{'label': 'route', 'p50_ms': 12.5, 'queries': 3}]}
+
+        regressions = compare_results(self.baseline, results, tolerance=0.2)
+
+        self.assertEqual(['route'], [regression['label'] for regression in regressions])
+
+    def test_more_queries_is_a_regression(self):
+        results = {'suite': [{'label': 'route', 'p50_ms': 10.0, 'queries': 4}]}
+
+        self.assertEqual(1, len(compare_results(self.baseline, results, tolerance=0.2)))
+
+    def test_within_the_tolerance_and_new_measurements_are_not_regressions(self):
+        results = {
+            'suite': [
+                {'label': 'route', 'p50_ms': 11.5, 'queries': 3},
+                {'label': 'new route', 'p50_ms': 100.0, 'queries': 30},
+            ],
+        }
+
+        self.assertEqual([], compare_results(self.baseline, results, tolerance=0.2))
@@ -51,12 +51,52 @@ def transfer_POST_data_to_dict(data):
     return {key: data.get(key) for key in data}
 
 
+SERIALIZER_CLASS_CACHE_SIZE = 256
+
+_serializer_classes = {}
+
+
 def create_serializer_class(name, fields):
     return type(name, (serializers.Serializer, ), fields)
 
 
+def _freeze_field_spec(value):
+    if isinstance(value, serializers.Field):
+        return (value.__class__, _freeze_field_spec(value._args), _freeze_field_spec(value._kwargs))
+
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_field_spec(item)) for key, item in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_field_spec(item) for item in value)
+
+    return value
+
+
+def get_serializer_class(name, fields):
+    """
+    Same as `create_serializer_class`, but reuses the class created for an equal field spec.
+    Specs that cannot be hashed always get a new class.
+    """
+    key = (name, _freeze_field_spec(fields))
+
+    try:
+        serializer_class = _serializer_classes.get(key)
+    except TypeError:
+        return create_serializer_class(name=name, fields=fields)
+
+    if serializer_class is None:
+        if len(_serializer_classes) >= SERIALIZER_CLASS_CACHE_SIZE:
+            _serializer_classes.clear()
+
+        serializer_class = create_serializer_class(name=name, fields=fields)
+        _serializer_classes[key] = serializer_class
+
+    return serializer_class
+
+
 def inline_serializer(*, fields, data=None, **kwargs):
-    serializer_class = create_serializer_class(name='', fields=fields)
+    serializer_class = get_serializer_class(name='', fields=fields)
 
     if data is not None:
         return serializer_class(data=data, **kwargs)
@@ -12,7 +12,11 @@ from .models import (
     Solution,
     CourseAssignment,
     CourseDescription,
+    TaskDescription,
 )
+from .cache import course_slugs_and_names
+from .services import schedule_task_description_fetch
+from .tasks import issue_course_certificates
 
 
 class CoursesListFilter(SimpleListFilter):
@@ -21,7 +25,7 @@ class CoursesListFilter(SimpleListFilter):
 
     def lookups(self, request, model_admin):
 
-        return [lookup for lookup in Course.objects.values_list('slug_url', 'name')]
+        return course_slugs_and_names.get()
 
     def queryset(self, request, queryset):
 
@@ -39,6 +43,17 @@ class ProgrammingLanguageAdmin(admin.ModelAdmin):
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
     list_display = ('name', 'slug_url')
+    actions = ['issue_certificates']
+
+    def issue_certificates(self, request, queryset):
+        course_ids = list(queryset.values_list('id', flat=True))
+
+        for course_id in course_ids:
+            issue_course_certificates.delay(course_id)
+
+        self.message_user(request, f'Scheduled issuing certificates for {len(course_ids)} courses')
+
+    issue_certificates.short_description = 'Issue certificates to the students that completed the course'
 
 
 @admin.register(Task)
@@ -70,6 +85,9 @@ class SolutionAdmin(admin.ModelAdmin):
     search_fields = ('task__name', 'user__email', 'task__course__name', )
     list_filter = ['status', CoursesListFilter]
 
+    exclude = ('code_blob', )
+    readonly_fields = ('code', )
+
     def course(self, obj):
         return obj.task.course
 
@@ -96,3 +114,20 @@ class IncludedTestAdmin(admin.ModelAdmin):
 
     def get_week(self, obj):
         return obj.task.week.number
+
+
+@admin.register(TaskDescription)
+class TaskDescriptionAdmin(admin.ModelAdmin):
+    list_display = ('url', 'etag', 'updated_at')
+    search_fields = ('url', )
+    actions = ['refresh']
+
+    def refresh(self, request, queryset):
+        urls = list(queryset.values_list('url', flat=True))
+
+        for url in urls:
+            schedule_task_description_fetch(url=url)
+
+        self.message_user(request, f'Scheduled fetching {len(urls)} task descriptions')
+
+    refresh.short_description = 'Fetch the selected descriptions again'
@@ -0,0 +1,110 @@
+from rest_framework import serializers
+from rest_framework.views import APIView
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+
+from odin.apis.mixins import ServiceExceptionHandlerMixin
+
+from odin.education.models import Course
+from odin.education.services import get_course_attendance, mark_attendance
+
+from odin.education.apis.permissions import TeacherInCourseAuthenticationMixin
+
+
+MAX_ATTENDANCE_LECTURES = 50
+MAX_ATTENDANCE_STUDENTS = 5000
+
+
+def encode_attendance(attendance: int, lectures_count: int) -> str:
+    """
+    The bitset as a hex string, one digit for every four lectures. Bit `i` stands for `lectures[i]`.
+    """
+    if not lectures_count:
+        return ''
+
+    return format(attendance, f'0{(lectures_count + 3) // 4}x')
+
+
+class CourseAttendanceApi(
+    ServiceExceptionHandlerMixin,
+    TeacherInCourseAuthenticationMixin,
+    APIView
+):
+    """
+    The presence of every student in the course at each of its lectures.
+    `attendance` is a hex encoded bitset where bit `i` (counting from the least significant one)
+    is set if the student was present at `lectures[i]`.
+
+    Attendance is marked for many lectures at once, either with a list of students per lecture
+    or with a single list for every lecture of a `week`.
+    Unless `replace` is false, students missing from a list are marked absent.
+    """
+
+    class Serializer(serializers.Serializer):
+        class LectureAttendanceSerializer(serializers.Serializer):
+            lecture = serializers.IntegerField()
+            students = serializers.ListField(child=serializers.IntegerField(), max_length=MAX_ATTENDANCE_STUDENTS)
+
+        lectures = serializers.ListField(
+            child=LectureAttendanceSerializer(),
+            required=False,
+            max_length=MAX_ATTENDANCE_LECTURES
+        )
+        week = serializers.IntegerField(required=False)
+        students = serializers.ListField(
+            child=serializers.IntegerField(),
+            required=False,
+            max_length=MAX_ATTENDANCE_STUDENTS
+        )
+        replace = serializers.BooleanField(default=True)
+
+        def validate(self, data):
+            if ('lectures' in data) == ('week' in data):
+                raise serializers.ValidationError('Pass either `lectures` or `week`.')
+
+            if 'week' in data and 'students' not in data:
+                raise serializers.ValidationError('Pass the `students` present during the week.')
+
+            return data
+
+    def get(self, request, course_id):
+        course = get_object_or_404(Course, pk=course_id)
+
+        matrix = get_course_attendance(course=course)
+        lectures_count = len(matrix['lectures'])
+
+        data = {
+            'lectures': [
+                {'id': lecture['id'], 'date': lecture['date'], 'week': lecture['week__number']}
+                for lecture in matrix['lectures']
+            ],
+            'students': [
+                {
+                    'id': student['id'],
+                    'email': student['email'],
+                    'name': student['profile__full_name'],
+                    'attendance': encode_attendance(matrix['attendance'][student['id']], lectures_count),
+                    'attended': bin(matrix['attendance'][student['id']]).count('1'),
+                }
+                for student in matrix['students']
+            ],
+        }
+
+        return Response(data)
+
+    def post(self, request, course_id):
+        course = get_object_or_404(Course, pk=course_id)
+
+        serializer = self.Serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        if 'week' in data:
+            lecture_ids = course.lectures.filter(week__number=data['week']).values_list('id', flat=True)
+            attendance = {lecture_id: data['students'] for lecture_id in lecture_ids}
+        else:
+            attendance = {lecture['lecture']: lecture['students'] for lecture in data['lectures']}
+
+        result = mark_attendance(course=course, attendance=attendance, replace=data['replace'])
+
+        return Response(data={'lectures': len(attendance), **result})
@@ -0,0 +1,21 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import NotFound
+
+from odin.apis.mixins import ServiceExceptionHandlerMixin
+
+from odin.education.services import verify_certificate
+
+
+class CertificateVerificationApi(ServiceExceptionHandlerMixin, APIView):
+    """
+    Public, so anyone holding a certificate token can check who it was issued to and for which course.
+    """
+
+    def get(self, request, token):
+        data = verify_certificate(token=token)
+
+        if data is None:
+            raise NotFound('There is no certificate with this token.')
+
+        return Response({'token': token, **data})
@@ -1,4 +1,4 @@
-from django.db.models import Q
+from django.db.models import Prefetch
 
 from rest_framework import status
 from rest_framework import serializers
@@ -6,20 +6,24 @@ from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView, get_object_or_404
 from rest_framework.response import Response
 
-from odin.apis.mixins import ServiceExceptionHandlerMixin
+from odin.apis.mixins import ServiceExceptionHandlerMixin, SparseFieldsetsMixin
+from odin.apis.serializers import SparseFieldsetSerializerMixin, CompiledSerializerMixin
+from odin.apis.utils import conditional_get
+from odin.apis.pagination import KeysetPagination
 from odin.common.utils import inline_serializer
 
 from odin.education.models import (
     Course,
-    Student,
-    Teacher,
     Week,
+    IncludedTask,
     ProgrammingLanguage,
 )
 
 from odin.education.services import (
     create_included_task_with_test,
+    get_courses_for_user,
     get_gradable_tasks_for_course,
+    get_user_solution_summaries,
 )
 
 from odin.education.apis.permissions import (
@@ -27,16 +31,26 @@ from odin.education.apis.permissions import (
     TeacherCourseAuthenticationMixin,
     CourseDetailAuthenticationMixin,
 )
+from odin.education.cache import programming_languages
+from odin.education.apis.etags import (
+    course_detail_etag,
+    teacher_course_detail_etag,
+)
 
 
 class StudentCoursesApi(
     CourseAuthenticationMixin,
     ServiceExceptionHandlerMixin,
+    SparseFieldsetsMixin,
     ListAPIView
 ):
 
-    class Serializer(serializers.ModelSerializer):
-        students_count = serializers.SerializerMethodField()
+    class Serializer(
+        SparseFieldsetSerializerMixin,
+        CompiledSerializerMixin,
+        serializers.ModelSerializer
+    ):
+        students_count = serializers.IntegerField()
         description = serializers.CharField(source='description.verbose')
 
         class Meta:
@@ -50,30 +64,27 @@ class StudentCoursesApi(
                       'description',
                       'students_count')
 
-        def get_students_count(self, obj):
-            return obj.students.filter(is_active=True).count()
-
     serializer_class = Serializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
-        user = self.request.user
-
-        teacher = user.downcast(Teacher)
-        student = user.downcast(Student)
-
-        return Course.objects.filter(
-            Q(teachers__in=[teacher]) | Q(students__in=[student])
-        ).distinct()
+        return get_courses_for_user(user=self.request.user)
 
 
 class CourseDetailApi(
     ServiceExceptionHandlerMixin,
     CourseAuthenticationMixin,
     CourseDetailAuthenticationMixin,
+    SparseFieldsetsMixin,
     APIView
 ):
+    """
+    Heavy fields, available through `?expand=`:
+        description - the markdown description of each problem
+        code - the code of each problem's last solution
+    """
 
-    class CourseSerializer(serializers.ModelSerializer):
+    class CourseSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
         problems = serializers.SerializerMethodField()
         languages = serializers.SerializerMethodField()
         weeks = serializers.SerializerMethodField()
@@ -93,8 +104,10 @@ class CourseDetailApi(
             )
 
         def get_problems(self, obj):
-            return [
-                {
+            problems = []
+
+            for task in obj.tasks:
+                problem = {
                     'id': task.id,
                     'name': task.name,
                     'gradable': task.gradable,
@@ -102,22 +115,27 @@ class CourseDetailApi(
                         'id': task.week.id,
                         'number': task.week.number
                     },
-                    'description': task.description,
-                    'last_solution': task.last_solution and {
+                    'last_solution': None
+                }
+
+                if self.is_expanded('description'):
+                    problem['description'] = task.description
+
+                if task.last_solution is not None:
+                    problem['last_solution'] = {
                         'id': task.last_solution.id,
                         'status': task.last_solution.verbose_status,
-                        'code': task.last_solution.code
-                    } or None
-                } for task in obj.tasks
-            ]
+                    }
+
+                    if self.is_expanded('code'):
+                        problem['last_solution']['code'] = task.last_solution.code
+
+                problems.append(problem)
+
+            return problems
 
         def get_languages(self, obj):
-            return [
-                {
-                    'id': language.id,
-                    'name': language.name,
-                } for language in ProgrammingLanguage.objects.all()
-            ]
+            return programming_languages.get()
 
         def get_weeks(self, obj):
             return [
@@ -128,20 +146,37 @@ class CourseDetailApi(
             ]
 
     def get_queryset(self):
-        return Course.objects.prefetch_related('weeks__included_tasks')
+        return Course.objects.prefetch_related('weeks')
 
+    @conditional_get(course_detail_etag)
     def get(self, request, course_id):
         course = get_object_or_404(self.get_queryset(), pk=course_id)
         user = self.request.user
 
-        course.tasks = get_gradable_tasks_for_course(course=course, user=user)
+        course.tasks = get_gradable_tasks_for_course(
+            course=course,
+            user=user,
+            defer_task_fields=() if self.is_expanded('description') else ('description', ),
+            defer_solution_fields=() if self.is_expanded('code') else ('test_output', ),
+            include_solution_code=self.is_expanded('code'),
+        )
+
+        serializer = self.CourseSerializer(instance=course, context=self.get_serializer_context())
 
-        return Response(self.CourseSerializer(instance=course).data)
+        return Response(serializer.data)
 
 
-class TeacherCourseDetailApi(TeacherCourseAuthenticationMixin, APIView):
+class TeacherCourseDetailApi(
+    TeacherCourseAuthenticationMixin,
+    SparseFieldsetsMixin,
+    APIView
+):
+    """
+    Heavy fields, available through `?expand=`:
+        description - the markdown description of each task
+    """
     # Pending deprecation, rebase FE functionality to CourseDetailApi only
-    class Serializer(serializers.ModelSerializer):
+    class Serializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
 
         weeks = serializers.SerializerMethodField()
         languages = serializers.SerializerMethodField()
@@ -165,28 +200,42 @@ class TeacherCourseDetailApi(TeacherCourseAuthenticationMixin, APIView):
                     'id': week.id,
                     'number': week.number,
                     'tasks': [
-                        {
-                            'id': task.id,
-                            'name': task.name,
-                            'gradable': task.gradable,
-                            'description': task.description,
-                        } for task in week.included_tasks.all()
+                        self.get_task(task) for task in week.included_tasks.all()
                     ]
                 } for week in obj.weeks.all()
             ]
 
+        def get_task(self, task):
+            data = {
+                'id': task.id,
+                'name': task.name,
+                'gradable': task.gradable,
+            }
+
+            if self.is_expanded('description'):
+                data['description'] = task.description
+
+            return data
+
         def get_languages(self, obj):
-            return [
-                {
-                    'id': language.id,
-                    'name': language.name,
-                } for language in ProgrammingLanguage.objects.all()
-            ]
+            return programming_languages.get()
+
+    def get_queryset(self):
+        tasks = IncludedTask.objects.order_by('id')
+
+        if not self.is_expanded('description'):
+            tasks = tasks.defer('description')
 
+        return Course.objects.prefetch_related(
+            Prefetch('weeks__included_tasks', queryset=tasks)
+        )
+
+    @conditional_get(teacher_course_detail_etag)
     def get(self, request, course_id):
-        course = get_object_or_404(Course, pk=course_id)
+        course = get_object_or_404(self.get_queryset(), pk=course_id)
+        serializer = self.Serializer(instance=course, context=self.get_serializer_context())
 
-        return Response(self.Serializer(instance=course).data)
+        return Response(serializer.data)
 
 
 class CreateTaskApi(
@@ -243,10 +292,20 @@ class CreateTaskApi(
 class TeacherOnlyCourseDetailApi(
     ServiceExceptionHandlerMixin,
     TeacherCourseAuthenticationMixin,
+    SparseFieldsetsMixin,
     APIView,
 ):
-
-    class Serializer(serializers.ModelSerializer):
+    """
+    Heavy fields, available through `?expand=`:
+        solution_code - the code of each completed task's solution
+        test_result - the test output of each completed task's solution
+    """
+
+    class Serializer(
+        SparseFieldsetSerializerMixin,
+        CompiledSerializerMixin,
+        serializers.ModelSerializer
+    ):
         languages = serializers.SerializerMethodField()
         students_count = serializers.IntegerField(source='students.count')
         students = inline_serializer(many=True, fields={
@@ -254,7 +313,7 @@ class TeacherOnlyCourseDetailApi(
             'user_id': serializers.IntegerField(source='user.id'),
             'full_name': serializers.CharField(source='user.name'),
             'solution_status_summary': inline_serializer(
-                source='user.get_solution_summary', fields={
+                source='solution_summary', fields={
                     'OK': serializers.IntegerField(),
                     'TOTAL': serializers.IntegerField(),
                     'completed_tasks': inline_serializer(
@@ -263,8 +322,8 @@ class TeacherOnlyCourseDetailApi(
                             'task_id': serializers.IntegerField(),
                             'name': serializers.CharField(),
                             'solution_id': serializers.IntegerField(),
-                            'solution_code': serializers.CharField(),
-                            'test_result': serializers.DictField(),
+                            'solution_code': serializers.CharField(required=False),
+                            'test_result': serializers.DictField(required=False),
                         }
                     )
                 }),
@@ -277,16 +336,7 @@ class TeacherOnlyCourseDetailApi(
         })
 
         def get_languages(self, obj):
-
-            languages = inline_serializer(
-                instance=ProgrammingLanguage.objects.all(),
-                many=True,
-                fields={
-                    'id': serializers.IntegerField(),
-                    'name': serializers.CharField()
-                },
-            )
-            return languages.data
+            return programming_languages.get()
 
         class Meta:
             model = Course
@@ -304,10 +354,22 @@ class TeacherOnlyCourseDetailApi(
             )
 
     def get_queryset(self):
-        return Course.objects.prefetch_related('students__user__solutions')
+        return Course.objects.prefetch_related('weeks', 'students__user__profile')
 
     def get(self, request, course_id):
 
         course = get_object_or_404(self.get_queryset(), pk=course_id)
 
-        return Response(self.Serializer(instance=course).data)
+        students = course.students.all()
+        summaries = get_user_solution_summaries(
+            users=students,
+            include_code=self.is_expanded('solution_code'),
+            include_test_result=self.is_expanded('test_result'),
+        )
+
+        for student in students:
+            student.solution_summary = summaries[student.id]
+
+        serializer = self.Serializer(instance=course, context=self.get_serializer_context())
+
+        return Response(serializer.data)
@@ -0,0 +1,52 @@
+from rest_framework import status
+from rest_framework import serializers
+from rest_framework.views import APIView
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+
+from odin.apis.mixins import ServiceExceptionHandlerMixin
+from odin.users.models import BaseUser
+
+from odin.education.models import Course
+from odin.education.services import enroll_students
+
+from odin.education.apis.permissions import TeacherInCourseAuthenticationMixin
+
+
+MAX_ENROLLMENT_EMAILS = 1000
+
+
+class CourseEnrollmentApi(
+    ServiceExceptionHandlerMixin,
+    TeacherInCourseAuthenticationMixin,
+    APIView
+):
+    """
+    Enrolls the users with the given emails as students in the course.
+    Users already in the course are skipped, so the request can be repeated.
+    """
+
+    class Serializer(serializers.Serializer):
+        emails = serializers.ListField(
+            child=serializers.EmailField(),
+            min_length=1,
+            max_length=MAX_ENROLLMENT_EMAILS
+        )
+
+    def post(self, request, course_id):
+        course = get_object_or_404(Course, pk=course_id)
+
+        serializer = self.Serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        emails = set(serializer.validated_data['emails'])
+
+        users = dict(BaseUser.objects.filter(email__in=emails).values_list('email', 'id'))
+        enrolled = set(enroll_students(course=course, user_ids=users.values()))
+
+        data = {
+            'enrolled': sorted(email for email, user_id in users.items() if user_id in enrolled),
+            'already_enrolled': sorted(email for email, user_id in users.items() if user_id not in enrolled),
+            'unknown': sorted(emails - set(users)),
+        }
+
+        return Response(data=data, status=status.HTTP_200_OK)
@@ -0,0 +1,62 @@
+from odin.apis.utils import make_etag
+from odin.common.cache import get_version, get_versions
+
+from odin.education.models import IncludedTask
+from odin.education.services import get_course_task_statistics_versions
+from odin.education.cache import (
+    LANGUAGES_VERSION_KEY,
+    get_course_version_key,
+    get_course_user_version_key,
+    get_task_version_key,
+    get_task_user_version_key,
+    get_solution_version_key,
+)
+
+
+def course_detail_etag(request, course_id, *args, **kwargs):
+    versions = get_versions(
+        get_course_version_key(course_id=course_id),
+        get_course_user_version_key(course_id=course_id, user_id=request.user.id),
+        LANGUAGES_VERSION_KEY,
+    )
+
+    return make_etag('course-detail', course_id, request.user.id, *versions)
+
+
+def teacher_course_detail_etag(request, course_id, *args, **kwargs):
+    versions = get_versions(
+        get_course_version_key(course_id=course_id),
+        LANGUAGES_VERSION_KEY,
+    )
+
+    return make_etag('teacher-course-detail', course_id, *versions)
+
+
+def course_task_statistics_etag(request, course_id, *args, **kwargs):
+    versions = get_course_task_statistics_versions(course_id=course_id)
+
+    return make_etag('course-task-statistics', course_id, *versions)
+
+
+def task_detail_etag(request, task_id, *args, **kwargs):
+    course_id = IncludedTask.objects.filter(id=task_id).values_list('course_id', flat=True).first()
+
+    if course_id is None:
+        return None
+
+    versions = get_versions(
+        get_task_version_key(task_id=task_id),
+        get_task_user_version_key(task_id=task_id, user_id=request.user.id),
+        get_course_version_key(course_id=course_id),
+    )
+
+    return make_etag('task-detail', task_id, request.user.id, *versions)
+
+
+def solution_detail_etag(request, *args, solution_id=None, **kwargs):
+    if solution_id is None:
+        return None
+
+    version = get_version(get_solution_version_key(solution_id=solution_id))
+
+    return make_etag('solution-detail', solution_id, version)
@@ -0,0 +1,45 @@
+from django.http import StreamingHttpResponse
+
+from rest_framework import serializers
+from rest_framework.views import APIView
+from rest_framework.generics import get_object_or_404
+
+from odin.apis.mixins import ServiceExceptionHandlerMixin
+from odin.common.exports import CSV, EXPORT_CONTENT_TYPES, stream_export
+
+from odin.education.models import Course
+from odin.education.services import (
+    COURSE_SOLUTIONS_EXPORT_FIELDS,
+    get_course_solutions_export_rows,
+)
+
+from odin.education.apis.permissions import TeacherInCourseAuthenticationMixin
+
+
+class CourseSolutionsExportApi(
+    ServiceExceptionHandlerMixin,
+    TeacherInCourseAuthenticationMixin,
+    APIView
+):
+    """
+    Streams every solution in the course with its grade and test output.
+    `?export_format=` is either `csv` (default) or `ndjson`.
+    """
+
+    class QuerySerializer(serializers.Serializer):
+        export_format = serializers.ChoiceField(choices=list(EXPORT_CONTENT_TYPES), default=CSV)
+
+    def get(self, request, course_id):
+        course = get_object_or_404(Course, pk=course_id)
+
+        query = self.QuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        export_format = query.validated_data['export_format']
+
+        rows = get_course_solutions_export_rows(course=course)
+        content = stream_export(rows, fields=COURSE_SOLUTIONS_EXPORT_FIELDS, export_format=export_format)
+
+        response = StreamingHttpResponse(content, content_type=EXPORT_CONTENT_TYPES[export_format])
+        response['Content-Disposition'] = f'attachment; filename="{course.slug_url}-solutions.{export_format}"'
+
+        return response
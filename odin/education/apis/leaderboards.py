@@ -0,0 +1,54 @@
+from typing import Dict
+
+from rest_framework import serializers
+from rest_framework.views import APIView
+from rest_framework.response import Response
+
+from odin.apis.mixins import ServiceExceptionHandlerMixin
+
+from odin.education.leaderboards import get_course_leaderboard
+
+from odin.education.apis.permissions import CourseDetailAuthenticationMixin
+
+
+DEFAULT_LEADERBOARD_SIZE = 10
+MAX_LEADERBOARD_SIZE = 100
+
+
+def serialize_leaderboard_entry(entry: Dict) -> Dict:
+    return {
+        'rank': entry['rank'],
+        'id': entry['user_id'],
+        'name': entry['user__profile__full_name'],
+        'solved_tasks': entry['solved_tasks_count'],
+        'last_solved_at': entry['last_solved_at'],
+    }
+
+
+class CourseLeaderboardApi(
+    ServiceExceptionHandlerMixin,
+    CourseDetailAuthenticationMixin,
+    APIView
+):
+    """
+    The `top` students of the course by passed tasks, ties going to whoever reached their count first,
+    and the place of the requesting user (`null` until they pass a task).
+    """
+
+    class FilterSerializer(serializers.Serializer):
+        top = serializers.IntegerField(min_value=1, max_value=MAX_LEADERBOARD_SIZE, default=DEFAULT_LEADERBOARD_SIZE)
+
+    def get(self, request, course_id):
+        serializer = self.FilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        leaderboard = get_course_leaderboard(course_id=int(course_id))
+        me = leaderboard.get_entry(request.user.id)
+
+        data = {
+            'total': len(leaderboard),
+            'top': [serialize_leaderboard_entry(entry) for entry in leaderboard.top(serializer.validated_data['top'])],
+            'me': serialize_leaderboard_entry(me) if me is not None else None,
+        }
+
+        return Response(data)
@@ -1,65 +1,63 @@
+from django.db.models import Q
+
 from rest_framework.permissions import BasePermission
 from rest_framework.generics import get_object_or_404
 
 from odin.authentication.permissions import JSONWebTokenAuthenticationMixin
+from odin.users.models import BaseUser
 
 from odin.education.models import (
     Student,
     Teacher,
     Course,
+    CourseAssignment,
 )
 
 
 class IsStudentPermission(BasePermission):
 
     def has_permission(self, request, view):
-        user = request.user
-        student = user.downcast(Student)
-
-        if student is not None:
-            return True
-
-        return False
+        return Student.objects.filter(user_id=request.user.id).exists()
 
 
 class IsTeacherPermission(BasePermission):
     def has_permission(self, request, view):
-        user = request.user
-        teacher = user.downcast(Teacher)
+        return Teacher.objects.filter(user_id=request.user.id).exists()
 
-        if teacher is not None:
-            return True
 
-        return False
+class IsStudentOrTeacherPermission(BasePermission):
 
+    def has_permission(self, request, view):
+        return BaseUser.objects.filter(
+            Q(student__isnull=False) | Q(teacher__isnull=False),
+            id=request.user.id
+        ).exists()
 
-class IsStudentOrTeacherPermission(BasePermission):
+
+class IsStudentOrTeacherInCoursePermission(BasePermission):
 
     def has_permission(self, request, view):
-        user = request.user
-        student = user.downcast(Student)
-        teacher = user.downcast(Teacher)
+        course_id = view.kwargs['course_id']
 
-        if student or teacher:
-            return True
+        get_object_or_404(Course.objects.all(), pk=course_id)
 
-        return False
+        return CourseAssignment.objects.filter(
+            Q(student_id=request.user.id) | Q(teacher_id=request.user.id),
+            course_id=course_id
+        ).exists()
 
 
-class IsStudentOrTeacherInCoursePermission(BasePermission):
+class IsTeacherInCoursePermission(BasePermission):
 
     def has_permission(self, request, view):
-        user = request.user
-        student = user.downcast(Student)
-        teacher = user.downcast(Teacher)
         course_id = view.kwargs['course_id']
 
-        course = get_object_or_404(Course.objects.all(), pk=course_id)
-
-        if teacher in course.teachers.all() or student in course.students.all():
-            return True
+        get_object_or_404(Course.objects.all(), pk=course_id)
 
-        return False
+        return CourseAssignment.objects.filter(
+            course_id=course_id,
+            teacher_id=request.user.id
+        ).exists()
 
 
 class StudentCourseAuthenticationMixin(JSONWebTokenAuthenticationMixin):
@@ -80,3 +78,8 @@ class CourseAuthenticationMixin(JSONWebTokenAuthenticationMixin):
 class CourseDetailAuthenticationMixin(JSONWebTokenAuthenticationMixin):
     def get_permissions(self):
         return super().get_permissions() + [IsStudentOrTeacherInCoursePermission()]
+
+
+class TeacherInCourseAuthenticationMixin(JSONWebTokenAuthenticationMixin):
+    def get_permissions(self):
+        return super().get_permissions() + [IsTeacherInCoursePermission()]
@@ -3,11 +3,13 @@ from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
-from odin.apis.mixins import ServiceExceptionHandlerMixin
+from odin.apis.mixins import ServiceExceptionHandlerMixin, SparseFieldsetsMixin
+from odin.apis.utils import conditional_get
 
 from odin.education.models import Solution
 
 from odin.education.apis.permissions import CourseAuthenticationMixin
+from odin.education.apis.etags import solution_detail_etag
 
 from odin.education.services import create_gradable_solution
 
@@ -19,17 +21,42 @@ from odin.grading.services import start_grader_communication
 class SolutionSubmitApi(
     ServiceExceptionHandlerMixin,
     CourseAuthenticationMixin,
+    SparseFieldsetsMixin,
     APIView
 ):
+    """
+    Heavy fields of `get`, available through `?expand=`:
+        code - the code of the solution
+        test_result - the test output of the solution
+    """
 
+    @conditional_get(solution_detail_etag)
     def get(self, request, *args, **kwargs):
-        solution = get_object_or_404(Solution, id=self.kwargs.get('solution_id'))
+        solutions = Solution.objects.all()
+
+        if self.is_expanded('code'):
+            solutions = solutions.with_code()
+
+        if not self.is_expanded('test_result'):
+            solutions = solutions.defer('test_output')
+
+        solution = get_object_or_404(solutions, id=self.kwargs.get('solution_id'))
+
         data = {
             'solution_id': solution.id,
             'solution_status': solution.verbose_status,
-            'code': solution.code,
-            'test_result': solution.test_output
         }
+
+        if self.is_expanded('code'):
+            data['code'] = solution.code
+
+        if self.is_expanded('test_result'):
+            data['test_result'] = solution.test_output
+
+        requested = self.get_requested_fields()
+        if requested is not None:
+            data = {key: value for key, value in data.items() if key in requested}
+
         return Response(data)
 
     def post(self, request):
@@ -0,0 +1,28 @@
+from rest_framework.views import APIView
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+
+from odin.apis.mixins import ServiceExceptionHandlerMixin
+from odin.apis.utils import conditional_get
+
+from odin.education.models import Course
+from odin.education.services import get_course_task_statistics
+
+from odin.education.apis.etags import course_task_statistics_etag
+from odin.education.apis.permissions import TeacherInCourseAuthenticationMixin
+
+
+class CourseTaskStatisticsApi(
+    ServiceExceptionHandlerMixin,
+    TeacherInCourseAuthenticationMixin,
+    APIView
+):
+    """
+    How many of the students in the course submitted and passed each of its tasks.
+    """
+
+    @conditional_get(course_task_statistics_etag)
+    def get(self, request, course_id):
+        course = get_object_or_404(Course, pk=course_id)
+
+        return Response(get_course_task_statistics(course=course))
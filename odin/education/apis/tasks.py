@@ -2,20 +2,33 @@ from odin.education.models import IncludedTask
 
 from rest_framework import serializers
 from rest_framework.views import APIView
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
 from .permissions import CourseAuthenticationMixin
+from .etags import task_detail_etag
 
-from odin.apis.mixins import ServiceExceptionHandlerMixin
+from odin.apis.mixins import ServiceExceptionHandlerMixin, SparseFieldsetsMixin
+from odin.apis.serializers import SparseFieldsetSerializerMixin
+from odin.apis.utils import conditional_get
+from odin.apis.pagination import KeysetPagination
 
 
 class TaskDetailApi(
     ServiceExceptionHandlerMixin,
     CourseAuthenticationMixin,
+    SparseFieldsetsMixin,
     APIView
 ):
+    """
+    Heavy fields, available through `?expand=`:
+        description - the markdown description of the task
+        code - the code of each solution
+        test_result - the test output of each solution
+    """
+    pagination_class = KeysetPagination
 
-    class TaskSerializer(serializers.ModelSerializer):
+    class TaskSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
         solutions = serializers.SerializerMethodField()
         course = serializers.SerializerMethodField()
 
@@ -30,6 +43,7 @@ class TaskDetailApi(
                 'course',
                 'solutions'
             )
+            expandable_fields = ('description', )
 
         def get_course(self, obj):
             return {
@@ -38,25 +52,57 @@ class TaskDetailApi(
                    }
 
         def get_solutions(self, obj):
-            solutions = [
-                {
+            solutions = []
+
+            for solution in obj.valid_solutions:
+                data = {
                     'id': solution.id,
-                    'code': solution.code,
                     'status': solution.verbose_status,
-                    'test_result': solution.test_output,
                     'student_id': solution.user_id
-                } for solution in obj.valid_solutions
-            ]
+                }
+
+                if self.is_expanded('code'):
+                    data['code'] = solution.code
+
+                if self.is_expanded('test_result'):
+                    data['test_result'] = solution.test_output
+
+                solutions.append(data)
+
+            return solutions
+
+    def get_queryset(self):
+        tasks = IncludedTask.objects.select_related('course')
 
-            if solutions:
-                return solutions
-            else:
-                return []
+        if not self.is_expanded('description'):
+            tasks = tasks.defer('description')
 
+        return tasks
+
+    def get_solutions_queryset(self, task):
+        solutions = task.solutions.filter(user_id=self.request.user.id)
+
+        if self.is_expanded('code'):
+            solutions = solutions.with_code()
+
+        if not self.is_expanded('test_result'):
+            solutions = solutions.defer('test_output')
+
+        return solutions
+
+    @conditional_get(task_detail_etag)
     def get(self, request, task_id):
-        user = self.request.user
-        task = IncludedTask.objects.get(id=task_id)
+        task = get_object_or_404(self.get_queryset(), id=task_id)
+
+        paginator = self.pagination_class()
+        task.valid_solutions = paginator.paginate_queryset(
+            self.get_solutions_queryset(task),
+            request,
+            view=self
+        )
 
-        task.valid_solutions = task.solutions.filter(user_id=user.id).order_by('-id')
+        data = self.TaskSerializer(instance=task, context=self.get_serializer_context()).data
+        data['next'] = paginator.get_next_link()
+        data['previous'] = paginator.get_previous_link()
 
-        return Response(self.TaskSerializer(instance=task).data)
+        return Response(data)
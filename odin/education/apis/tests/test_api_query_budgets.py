@@ -0,0 +1,175 @@
+import csv
+import io
+import json
+
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.common.testing import QueryBudgetAssertionsMixin
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Student, Teacher, Solution
+from odin.education.services import add_student, add_teacher
+from odin.education.factories import (
+    CourseFactory,
+    IncludedTaskFactory,
+    ProgrammingLanguageFactory,
+    SolutionFactory,
+)
+
+
+class TestEducationApiQueryBudgets(QueryBudgetAssertionsMixin, TestCase):
+    """
+    Every endpoint is measured on a small course and again after the course grew,
+    so the budgets hold no matter how many students, tasks and solutions there are.
+    """
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.student = Student.objects.create_from_user(self.user)
+        self.teacher = Teacher.objects.create_from_user(self.user)
+
+        self.course = CourseFactory()
+        self.week = self.course.weeks.first()
+        add_student(course=self.course, student=self.student)
+        add_teacher(self.course, self.teacher)
+
+        self.task = IncludedTaskFactory(course=self.course, week=self.week, gradable=True)
+        self.solution = SolutionFactory(task=self.task, user=self.user, status=Solution.OK, test_output={})
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def grow_course(self, *, students=5, tasks=5):
+        new_students = []
+        for _ in range(students):
+            student = Student.objects.create_from_user(BaseUserFactory())
+            add_student(course=self.course, student=student)
+            new_students.append(student)
+
+        for _ in range(tasks):
+            task = IncludedTaskFactory(course=self.course, week=self.week, gradable=True)
+
+            for user in [self.user] + [student.user for student in new_students]:
+                SolutionFactory(task=task, user=user, status=Solution.OK, test_output={'OK': True})
+                SolutionFactory(task=task, user=user, status=Solution.NOT_OK, test_output={'OK': False})
+
+        for _ in range(3):
+            SolutionFactory(task=self.task, user=self.user)
+
+        course = CourseFactory()
+        add_student(course=course, student=self.student)
+
+    def assertRequestBudget(self, budget, method, url, **kwargs):
+        # Warms up the process and cache level state, which is shared by all sizes.
+        getattr(self.client, method)(url, **kwargs, **self.auth)
+
+        for grow in (False, True):
+            if grow:
+                self.grow_course()
+
+            with self.assertQueryBudget(budget):
+                response = getattr(self.client, method)(url, **kwargs, **self.auth)
+
+            self.assertLess(response.status_code, 400)
+
+    def test_student_courses(self):
+        self.assertRequestBudget(2, 'get', '/api/education/courses/')
+
+    def test_course_detail(self):
+        url = f'/api/education/courses/{self.course.id}/'
+
+        self.assertRequestBudget(7, 'get', url)
+        self.assertRequestBudget(7, 'get', url, data={'expand': 'description,code'})
+
+    def test_task_detail(self):
+        url = f'/api/education/task/{self.task.id}/'
+
+        self.assertRequestBudget(4, 'get', url)
+        self.assertRequestBudget(4, 'get', url, data={'expand': 'description,code,test_result'})
+
+    def test_solution_detail(self):
+        url = f'/api/education/solution/{self.solution.id}/'
+
+        self.assertRequestBudget(2, 'get', url, data={'expand': 'code,test_result'})
+
+    def test_solution_submit(self):
+        self.assertRequestBudget(
+            4,
+            'post',
+            '/api/education/solution/',
+            data={'task': self.task.id, 'code': faker.text()}
+        )
+
+    def test_teacher_course_detail(self):
+        url = f'/api/education/courses/{self.course.id}/weeks/'
+
+        self.assertRequestBudget(5, 'get', url, data={'expand': 'description'})
+
+    def test_teacher_only_course_detail(self):
+        url = f'/api/education/courses/{self.course.id}/teachers/'
+
+        self.assertRequestBudget(8, 'get', url, data={'expand': 'solution_code,test_result'})
+
+    def test_course_solutions_export(self):
+        url = f'/api/education/courses/{self.course.id}/solutions/export/'
+        self.client.get(url, **self.auth)
+
+        for grow in (False, True):
+            if grow:
+                self.grow_course()
+
+            # The rows are only fetched while the streamed body is consumed.
+            with self.assertQueryBudget(4):
+                response = self.client.get(url, **self.auth)
+                content = b''.join(response.streaming_content).decode()
+
+            self.assertEqual(200, response.status_code)
+            rows = list(csv.DictReader(io.StringIO(content)))
+            self.assertEqual(Solution.objects.filter(task__course=self.course).count(), len(rows))
+
+    def test_course_task_statistics(self):
+        url = f'/api/education/courses/{self.course.id}/statistics/'
+
+        self.assertRequestBudget(4, 'get', url)
+
+    def test_create_task(self):
+        language = ProgrammingLanguageFactory()
+        data = {
+            'name': faker.word(),
+            'code': faker.text(),
+            'description_url': faker.url(),
+            'gradable': True,
+            'language': language.id,
+            'week': self.week.id,
+        }
+
+        self.assertRequestBudget(
+            18,
+            'post',
+            f'/api/education/courses/{self.course.id}/tasks/',
+            data=json.dumps(data),
+            content_type='application/json'
+        )
+
+    def test_enroll_students(self):
+        url = f'/api/education/courses/{self.course.id}/students/'
+
+        for size in (1, 20):
+            users = BaseUserFactory.create_bulk(size, is_active=False)
+
+            with self.assertQueryBudget(9):
+                response = self.client.post(
+                    url,
+                    data=json.dumps({'emails': [user.email for user in users]}),
+                    content_type='application/json',
+                    **self.auth
+                )
+
+            self.assertEqual(size, len(response.data['enrolled']))
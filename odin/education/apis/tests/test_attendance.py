@@ -0,0 +1,105 @@
+import json
+
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Teacher
+from odin.education.services import add_teacher, enroll_students
+from odin.education.factories import CourseFactory, StudentFactory, LectureFactory
+from odin.education.apis.attendance import encode_attendance
+
+
+class TestCourseAttendanceApi(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.teacher = Teacher.objects.create_from_user(self.user)
+        self.course = CourseFactory()
+        add_teacher(self.course, self.teacher)
+        self.url = f'/api/education/courses/{self.course.id}/attendance/'
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def test_returns_the_lectures_and_the_attendance_of_every_student(self):
+        student = StudentFactory()
+        enroll_students(course=self.course, user_ids=[student.id])
+        lectures = LectureFactory.create_batch(5, course=self.course)
+        for lecture in lectures[::2]:
+            lecture.present_students.add(student)
+
+        response = self.client.get(self.url, **self.auth)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(5, len(response.data['lectures']))
+        self.assertEqual(
+            [{'id': student.id, 'email': student.email, 'name': None, 'attendance': '15', 'attended': 3}],
+            response.data['students']
+        )
+
+    def test_teacher_outside_of_the_course_cannot_see_the_attendance(self):
+        other_course = CourseFactory()
+
+        response = self.client.get(f'/api/education/courses/{other_course.id}/attendance/', **self.auth)
+
+        self.assertEqual(403, response.status_code)
+
+    def test_encode_attendance_pads_to_the_number_of_lectures(self):
+        self.assertEqual('', encode_attendance(0, 0))
+        self.assertEqual('0', encode_attendance(0, 3))
+        self.assertEqual('001', encode_attendance(1, 9))
+        self.assertEqual('3ff', encode_attendance(2 ** 10 - 1, 10))
+
+    def test_marks_the_attendance_of_many_lectures_in_one_request(self):
+        students = StudentFactory.create_bulk(3)
+        enroll_students(course=self.course, user_ids=[student.id for student in students])
+        first, second = LectureFactory.create_batch(2, course=self.course)
+        first.present_students.add(students[0])
+        data = {
+            'lectures': [
+                {'lecture': first.id, 'students': [students[1].id]},
+                {'lecture': second.id, 'students': [students[1].id, students[2].id]},
+            ]
+        }
+
+        response = self.client.post(self.url, data=json.dumps(data), content_type='application/json', **self.auth)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'lectures': 2, 'added': 3, 'removed': 1}, response.data)
+        self.assertEqual([students[1]], list(first.present_students.all()))
+
+    def test_marks_the_same_students_present_at_every_lecture_of_a_week(self):
+        student = StudentFactory()
+        enroll_students(course=self.course, user_ids=[student.id])
+        week = self.course.weeks.first()
+        lectures = LectureFactory.create_batch(2, course=self.course, week=week)
+        data = {'week': week.number, 'students': [student.id]}
+
+        response = self.client.post(self.url, data=json.dumps(data), content_type='application/json', **self.auth)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'lectures': 2, 'added': 2, 'removed': 0}, response.data)
+        self.assertEqual(set(lectures), set(student.lectures.all()))
+
+    def test_marking_students_outside_of_the_course_is_rejected(self):
+        outsider = StudentFactory()
+        lecture = LectureFactory(course=self.course)
+        data = {'lectures': [{'lecture': lecture.id, 'students': [outsider.id]}]}
+
+        response = self.client.post(self.url, data=json.dumps(data), content_type='application/json', **self.auth)
+
+        self.assertEqual(400, response.status_code)
+        self.assertFalse(lecture.present_students.exists())
+
+    def test_marking_needs_either_lectures_or_a_week(self):
+        response = self.client.post(self.url, data=json.dumps({}), content_type='application/json', **self.auth)
+
+        self.assertEqual(400, response.status_code)
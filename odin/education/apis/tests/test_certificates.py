@@ -0,0 +1,34 @@
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import CourseAssignment, Certificate
+from odin.education.services import enroll_students
+from odin.education.factories import CourseFactory
+
+
+class TestCertificateVerificationApi(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.course = CourseFactory()
+        self.student = BaseUserFactory()
+        enroll_students(course=self.course, user_ids=[self.student.id])
+        self.certificate = Certificate.objects.create(
+            assignment=CourseAssignment.objects.get(course=self.course, student_id=self.student.id)
+        )
+
+    def test_anyone_can_verify_a_certificate(self):
+        response = self.client.get(f'/api/education/certificates/{self.certificate.token}/')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(str(self.certificate.token), response.data['token'])
+        self.assertEqual(self.course.name, response.data['course'])
+        self.assertEqual(self.student.profile.full_name, response.data['student'])
+
+    def test_unknown_tokens_are_not_found(self):
+        response = self.client.get(f'/api/education/certificates/{faker.uuid4()}/')
+
+        self.assertEqual(404, response.status_code)
@@ -0,0 +1,89 @@
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Student, Solution
+from odin.education.services import add_student
+from odin.education.factories import (
+    CourseFactory,
+    IncludedTaskFactory,
+    SolutionFactory,
+)
+
+
+class TestConditionalGet(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.student = Student.objects.create_from_user(self.user)
+        self.course = CourseFactory()
+        add_student(course=self.course, student=self.student)
+        self.task = IncludedTaskFactory(course=self.course, week=self.course.weeks.first(), gradable=True)
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def get(self, url, etag=None):
+        headers = dict(self.auth)
+        if etag is not None:
+            headers['HTTP_IF_NONE_MATCH'] = etag
+
+        return self.client.get(url, **headers)
+
+    def test_course_detail_returns_not_modified_when_etag_matches(self):
+        url = f'/api/education/courses/{self.course.id}/'
+
+        response = self.get(url)
+        self.assertEqual(200, response.status_code)
+
+        response = self.get(url, etag=response['ETag'])
+        self.assertEqual(304, response.status_code)
+
+    def test_course_detail_etag_changes_when_user_submits_solution(self):
+        url = f'/api/education/courses/{self.course.id}/'
+        etag = self.get(url)['ETag']
+
+        SolutionFactory(task=self.task, user=self.user)
+
+        response = self.get(url, etag=etag)
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response['ETag'])
+
+    def test_course_detail_etag_changes_when_task_is_added(self):
+        url = f'/api/education/courses/{self.course.id}/'
+        etag = self.get(url)['ETag']
+
+        IncludedTaskFactory(course=self.course, week=self.course.weeks.first())
+
+        self.assertEqual(200, self.get(url, etag=etag).status_code)
+
+    def test_task_detail_returns_not_modified_until_solution_is_submitted(self):
+        url = f'/api/education/task/{self.task.id}/'
+        etag = self.get(url)['ETag']
+
+        self.assertEqual(304, self.get(url, etag=etag).status_code)
+
+        SolutionFactory(task=self.task, user=self.user)
+
+        self.assertEqual(200, self.get(url, etag=etag).status_code)
+
+    def test_solution_detail_etag_changes_when_solution_status_changes(self):
+        solution = SolutionFactory(task=self.task, user=self.user, status=Solution.PENDING)
+        url = f'/api/education/solution/{solution.id}/'
+        etag = self.get(url)['ETag']
+
+        self.assertEqual(304, self.get(url, etag=etag).status_code)
+
+        solution.status = Solution.OK
+        solution.save()
+
+        response = self.get(url, etag=etag)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('ok', response.data['solution_status'])
@@ -0,0 +1,72 @@
+import json
+
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Teacher
+from odin.education.services import add_teacher
+from odin.education.factories import CourseFactory, StudentFactory
+
+
+class TestCourseEnrollmentApi(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.teacher = Teacher.objects.create_from_user(self.user)
+        self.course = CourseFactory()
+        add_teacher(self.course, self.teacher)
+        self.url = f'/api/education/courses/{self.course.id}/students/'
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def test_enrolls_users_by_email_and_reports_the_rest(self):
+        new_user = BaseUserFactory()
+        enrolled_student = StudentFactory()
+        self.course.course_assignments.create(student=enrolled_student)
+        unknown = faker.email()
+
+        response = self.client.post(
+            self.url,
+            data=json.dumps({'emails': [new_user.email, enrolled_student.email, unknown]}),
+            content_type='application/json',
+            **self.auth
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([new_user.email], response.data['enrolled'])
+        self.assertEqual([enrolled_student.email], response.data['already_enrolled'])
+        self.assertEqual([unknown], response.data['unknown'])
+        self.assertTrue(self.course.students.filter(id=new_user.id).exists())
+
+    def test_teacher_outside_of_the_course_cannot_enroll(self):
+        other_course = CourseFactory()
+
+        response = self.client.post(
+            f'/api/education/courses/{other_course.id}/students/',
+            data=json.dumps({'emails': [BaseUserFactory().email]}),
+            content_type='application/json',
+            **self.auth
+        )
+
+        self.assertEqual(403, response.status_code)
+        self.assertFalse(other_course.students.exists())
+
+    def test_empty_email_list_is_rejected(self):
+        response = self.client.post(
+            self.url,
+            data=json.dumps({'emails': []}),
+            content_type='application/json',
+            **self.auth
+        )
+
+        self.assertEqual(400, response.status_code)
+        self.assertIn('emails', str(response.data))
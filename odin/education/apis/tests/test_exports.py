@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Teacher, Solution
+from odin.education.services import add_teacher, get_course_solutions_export_rows
+from odin.education.factories import (
+    CourseFactory,
+    IncludedTaskFactory,
+    SolutionFactory,
+)
+
+
+class TestCourseSolutionsExportApi(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.teacher = Teacher.objects.create_from_user(self.user)
+        self.course = CourseFactory()
+        add_teacher(self.course, self.teacher)
+        self.task = IncludedTaskFactory(course=self.course, week=self.course.weeks.first(), gradable=True)
+        self.url = f'/api/education/courses/{self.course.id}/solutions/export/'
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def test_streams_course_solutions_as_csv(self):
+        passed = SolutionFactory(task=self.task, status=Solution.OK, test_output={'result': 'ok'})
+        failed = SolutionFactory(task=self.task, status=Solution.NOT_OK)
+        pending = SolutionFactory(task=self.task, status=Solution.PENDING)
+        SolutionFactory()
+
+        response = self.client.get(self.url, **self.auth)
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.streaming)
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual([str(passed.id), str(failed.id), str(pending.id)], [row['solution_id'] for row in rows])
+        self.assertEqual(['Passed', 'Failed', ''], [row['grade'] for row in rows])
+        self.assertEqual({'result': 'ok'}, json.loads(rows[0]['test_output']))
+        self.assertEqual(passed.code, rows[0]['code'])
+
+    def test_streams_course_solutions_as_ndjson(self):
+        solution = SolutionFactory(task=self.task, status=Solution.OK, code=faker.text() * 20)
+
+        response = self.client.get(self.url, {'export_format': 'ndjson'}, **self.auth)
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([solution.id], [json.loads(line)['solution_id'] for line in lines])
+        self.assertEqual('ok', json.loads(lines[0])['status'])
+        self.assertEqual(solution.code, json.loads(lines[0])['code'])
+
+    def test_teacher_outside_of_the_course_cannot_export(self):
+        other_course = CourseFactory()
+
+        response = self.client.get(f'/api/education/courses/{other_course.id}/solutions/export/', **self.auth)
+
+        self.assertEqual(403, response.status_code)
+
+    def test_export_rows_are_fetched_in_chunks(self):
+        solutions = [SolutionFactory(task=self.task) for _ in range(5)]
+
+        with self.assertNumQueries(3):
+            rows = list(get_course_solutions_export_rows(course=self.course, chunk_size=2))
+
+        self.assertEqual([solution.id for solution in solutions], [row['solution_id'] for row in rows])
@@ -0,0 +1,67 @@
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Solution
+from odin.education.services import enroll_students
+from odin.education.factories import CourseFactory, IncludedTaskFactory, SolutionFactory, StudentFactory
+
+
+class TestCourseLeaderboardApi(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.course = CourseFactory()
+        enroll_students(course=self.course, user_ids=[self.user.id])
+        self.tasks = IncludedTaskFactory.create_batch(2, course=self.course, gradable=True)
+        self.url = f'/api/education/courses/{self.course.id}/leaderboard/'
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def test_returns_the_top_students_and_the_place_of_the_user(self):
+        leader = StudentFactory()
+        enroll_students(course=self.course, user_ids=[leader.id])
+        for task in self.tasks:
+            SolutionFactory(task=task, user=leader, status=Solution.OK)
+        SolutionFactory(task=self.tasks[0], user=self.user, status=Solution.OK)
+
+        response = self.client.get(self.url, data={'top': 1}, **self.auth)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, response.data['total'])
+        self.assertEqual([(1, leader.id, 2)], [
+            (entry['rank'], entry['id'], entry['solved_tasks']) for entry in response.data['top']
+        ])
+        self.assertEqual((2, 1), (response.data['me']['rank'], response.data['me']['solved_tasks']))
+
+    def test_entries_do_not_expose_the_emails_of_other_students(self):
+        SolutionFactory(task=self.tasks[0], user=self.user, status=Solution.OK)
+
+        response = self.client.get(self.url, **self.auth)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            {'rank', 'id', 'name', 'solved_tasks', 'last_solved_at'},
+            set(response.data['top'][0])
+        )
+
+    def test_user_without_passed_tasks_has_no_place(self):
+        response = self.client.get(self.url, **self.auth)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'total': 0, 'top': [], 'me': None}, response.data)
+
+    def test_users_outside_of_the_course_cannot_see_the_leaderboard(self):
+        other_course = CourseFactory()
+
+        response = self.client.get(f'/api/education/courses/{other_course.id}/leaderboard/', **self.auth)
+
+        self.assertEqual(403, response.status_code)
@@ -0,0 +1,65 @@
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Student
+from odin.education.services import add_student
+from odin.education.factories import (
+    CourseFactory,
+    IncludedTaskFactory,
+    SolutionFactory,
+)
+
+
+class TestKeysetPagination(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.student = Student.objects.create_from_user(self.user)
+        self.course = CourseFactory()
+        add_student(course=self.course, student=self.student)
+        self.task = IncludedTaskFactory(course=self.course, week=self.course.weeks.first())
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def test_task_detail_returns_solutions_page_by_page(self):
+        solutions = [SolutionFactory(task=self.task, user=self.user) for _ in range(3)]
+        url = f'/api/education/task/{self.task.id}/'
+
+        first_page = self.client.get(url, {'page_size': 2}, **self.auth).data
+        self.assertEqual(
+            [solutions[2].id, solutions[1].id],
+            [solution['id'] for solution in first_page['solutions']]
+        )
+        self.assertIsNone(first_page['previous'])
+
+        second_page = self.client.get(first_page['next'], **self.auth).data
+        self.assertEqual([solutions[0].id], [solution['id'] for solution in second_page['solutions']])
+        self.assertIsNone(second_page['next'])
+
+    def test_task_detail_cursor_is_stable_when_new_solutions_are_submitted(self):
+        solutions = [SolutionFactory(task=self.task, user=self.user) for _ in range(3)]
+        url = f'/api/education/task/{self.task.id}/'
+
+        first_page = self.client.get(url, {'page_size': 2}, **self.auth).data
+        SolutionFactory(task=self.task, user=self.user)
+
+        second_page = self.client.get(first_page['next'], **self.auth).data
+        self.assertEqual([solutions[0].id], [solution['id'] for solution in second_page['solutions']])
+
+    def test_student_courses_are_paginated(self):
+        other_course = CourseFactory()
+        add_student(course=other_course, student=self.student)
+
+        response = self.client.get('/api/education/courses/', {'page_size': 1}, **self.auth)
+
+        self.assertEqual([other_course.id], [course['id'] for course in response.data['results']])
+        self.assertIsNotNone(response.data['next'])
@@ -0,0 +1,79 @@
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Student
+from odin.education.services import add_student
+from odin.education.factories import (
+    CourseFactory,
+    IncludedTaskFactory,
+    SolutionFactory,
+)
+
+
+class TestSparseFieldsets(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.student = Student.objects.create_from_user(self.user)
+        self.course = CourseFactory()
+        add_student(course=self.course, student=self.student)
+        self.task = IncludedTaskFactory(course=self.course, week=self.course.weeks.first(), gradable=True)
+        self.solution = SolutionFactory(task=self.task, user=self.user)
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def test_course_detail_leaves_out_heavy_fields_by_default(self):
+        response = self.client.get(f'/api/education/courses/{self.course.id}/', **self.auth)
+
+        problem = response.data['problems'][0]
+        self.assertNotIn('description', problem)
+        self.assertNotIn('code', problem['last_solution'])
+
+    def test_course_detail_includes_expanded_fields(self):
+        response = self.client.get(
+            f'/api/education/courses/{self.course.id}/',
+            {'expand': 'description,code'},
+            **self.auth
+        )
+
+        problem = response.data['problems'][0]
+        self.assertEqual(self.task.description, problem['description'])
+        self.assertEqual(self.solution.code, problem['last_solution']['code'])
+
+    def test_course_detail_returns_only_requested_fields(self):
+        response = self.client.get(
+            f'/api/education/courses/{self.course.id}/',
+            {'fields': 'id,name'},
+            **self.auth
+        )
+
+        self.assertEqual({'id', 'name'}, set(response.data))
+
+    def test_task_detail_expands_solution_code(self):
+        url = f'/api/education/task/{self.task.id}/'
+
+        default = self.client.get(url, **self.auth).data
+        self.assertNotIn('description', default)
+        self.assertNotIn('code', default['solutions'][0])
+
+        expanded = self.client.get(url, {'expand': 'description,code'}, **self.auth).data
+        self.assertEqual(self.task.description, expanded['description'])
+        self.assertEqual(self.solution.code, expanded['solutions'][0]['code'])
+
+    def test_solution_detail_expands_code_and_test_result(self):
+        url = f'/api/education/solution/{self.solution.id}/'
+
+        default = self.client.get(url, **self.auth).data
+        self.assertEqual({'solution_id', 'solution_status'}, set(default))
+
+        expanded = self.client.get(url, {'expand': 'code'}, **self.auth).data
+        self.assertEqual(self.solution.code, expanded['code'])
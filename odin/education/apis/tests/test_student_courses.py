@@ -0,0 +1,77 @@
+from test_plus import TestCase
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Student, Teacher
+from odin.education.services import add_student, add_teacher
+from odin.education.factories import CourseFactory
+
+
+class TestStudentCoursesApi(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.student = Student.objects.create_from_user(self.user)
+        self.url = '/api/education/courses/'
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def enroll_in_new_course(self, *, students_count=0):
+        course = CourseFactory()
+        add_student(course=course, student=self.student)
+
+        for _ in range(students_count):
+            add_student(course=course, student=Student.objects.create_from_user(BaseUserFactory()))
+
+        return course
+
+    def test_returns_active_students_count_and_description(self):
+        course = self.enroll_in_new_course(students_count=2)
+        inactive_student = Student.objects.create_from_user(BaseUserFactory())
+        inactive_student.is_active = False
+        inactive_student.save()
+        add_student(course=course, student=inactive_student)
+
+        response = self.client.get(self.url, **self.auth)
+
+        self.assertEqual(1, len(response.data['results']))
+        self.assertEqual(3, response.data['results'][0]['students_count'])
+        self.assertEqual(course.description.verbose, response.data['results'][0]['description'])
+
+    def test_returns_courses_of_a_user_that_is_both_teacher_and_student(self):
+        student_course = self.enroll_in_new_course()
+        teacher_course = CourseFactory()
+        add_teacher(teacher_course, Teacher.objects.create_from_user(self.user))
+
+        response = self.client.get(self.url, **self.auth)
+
+        self.assertEqual(
+            [teacher_course.id, student_course.id],
+            [course['id'] for course in response.data['results']]
+        )
+
+    def test_number_of_queries_does_not_depend_on_the_number_of_courses(self):
+        self.enroll_in_new_course(students_count=1)
+        # Warm up the authentication cache.
+        self.client.get(self.url, **self.auth)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, **self.auth)
+
+        for _ in range(3):
+            self.enroll_in_new_course(students_count=2)
+
+        with self.assertNumQueries(len(queries)):
+            response = self.client.get(self.url, **self.auth)
+
+        self.assertEqual(4, len(response.data['results']))
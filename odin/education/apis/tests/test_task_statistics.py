@@ -0,0 +1,73 @@
+from test_plus import TestCase
+
+from django.test import Client
+
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+
+from odin.education.models import Teacher, Solution
+from odin.education.services import add_teacher, enroll_students
+from odin.education.factories import CourseFactory, IncludedTaskFactory, SolutionFactory, StudentFactory
+
+
+class TestCourseTaskStatisticsApi(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.test_password = faker.password()
+        self.user = BaseUserFactory(password=self.test_password)
+        self.user.is_active = True
+        self.user.save()
+        self.teacher = Teacher.objects.create_from_user(self.user)
+        self.course = CourseFactory()
+        add_teacher(self.course, self.teacher)
+        self.url = f'/api/education/courses/{self.course.id}/statistics/'
+
+        login_data = {'email': self.user.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+        self.auth = {'HTTP_AUTHORIZATION': f'JWT {token}'}
+
+    def test_returns_the_statistics_of_every_task(self):
+        student = StudentFactory()
+        enroll_students(course=self.course, user_ids=[student.id])
+        task = IncludedTaskFactory(course=self.course, gradable=True)
+        SolutionFactory(task=task, user=student, status=Solution.NOT_OK)
+
+        response = self.client.get(self.url, **self.auth)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            [(task.id, 1, 1, 0)],
+            [
+                (
+                    statistics['id'],
+                    statistics['total_student_count'],
+                    statistics['students_with_a_submitted_solution_count'],
+                    statistics['students_with_a_passing_solution_count'],
+                )
+                for statistics in response.data
+            ]
+        )
+
+    def test_returns_not_modified_until_a_solution_changes(self):
+        task = IncludedTaskFactory(course=self.course)
+        etag = self.client.get(self.url, **self.auth)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(304, response.status_code)
+
+        SolutionFactory(task=task, user=StudentFactory())
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(200, response.status_code)
+
+    def test_students_cannot_see_the_statistics(self):
+        student = BaseUserFactory(password=self.test_password)
+        student.is_active = True
+        student.save()
+        enroll_students(course=self.course, user_ids=[student.id])
+        login_data = {'email': student.email, 'password': self.test_password}
+        token = self.client.post(self.reverse('api:auth:login'), data=login_data).data['token']
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=f'JWT {token}')
+
+        self.assertEqual(403, response.status_code)
@@ -12,6 +12,18 @@ from .tasks import TaskDetailApi
 
 from .solutions import SolutionSubmitApi
 
+from .exports import CourseSolutionsExportApi
+
+from .enrollments import CourseEnrollmentApi
+
+from .attendance import CourseAttendanceApi
+
+from .leaderboards import CourseLeaderboardApi
+
+from .statistics import CourseTaskStatisticsApi
+
+from .certificates import CertificateVerificationApi
+
 
 urlpatterns = [
     url(
@@ -46,4 +58,28 @@ urlpatterns = [
         regex='^courses/(?P<course_id>[0-9]+)/teachers/$',
         view=TeacherOnlyCourseDetailApi.as_view(),
     ),
+    url(
+        regex='^courses/(?P<course_id>[0-9]+)/solutions/export/$',
+        view=CourseSolutionsExportApi.as_view(),
+    ),
+    url(
+        regex='^courses/(?P<course_id>[0-9]+)/students/$',
+        view=CourseEnrollmentApi.as_view(),
+    ),
+    url(
+        regex='^courses/(?P<course_id>[0-9]+)/attendance/$',
+        view=CourseAttendanceApi.as_view(),
+    ),
+    url(
+        regex='^courses/(?P<course_id>[0-9]+)/leaderboard/$',
+        view=CourseLeaderboardApi.as_view(),
+    ),
+    url(
+        regex='^courses/(?P<course_id>[0-9]+)/statistics/$',
+        view=CourseTaskStatisticsApi.as_view(),
+    ),
+    url(
+        regex='^certificates/(?P<token>[0-9a-zA-Z-]{1,110})/$',
+        view=CertificateVerificationApi.as_view(),
+    ),
 ]
@@ -0,0 +1,182 @@
+from typing import Dict
+
+import factory
+
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from odin.common.benchmarks import benchmark
+from odin.users.factories import BaseUserFactory
+
+from .apis.courses import StudentCoursesApi, TeacherOnlyCourseDetailApi
+from .datasets import generate_education_dataset, generate_lectures
+from .factories import CourseFactory, TeacherFactory, StudentFactory, CourseAssignmentFactory
+from .leaderboards import load_leaderboard
+from .models import Student, Solution
+from .services import (
+    add_student,
+    add_teacher,
+    get_user_solution_summary,
+    get_user_solution_summaries,
+    get_all_student_solution_statistics,
+    get_course_attendance,
+    rebuild_leaderboard,
+    get_course_task_statistics,
+    count_course_task_statistics,
+)
+
+
+BENCHMARK_PASSWORD = 'measure-twice-cut-once'
+
+
+def seed_platform(
+    runner,
+    *,
+    courses_count: int=50,
+    students_count: int=10000,
+    tasks_count: int=500,
+    solutions_count: int=2000000
+) -> Dict:
+    """
+    Generates the education dataset with every count scaled by the runner,
+    and picks the first course with its teacher, a student, a task and a solution for the measurements.
+    """
+    data = generate_education_dataset(
+        courses_count=runner.scaled(courses_count),
+        students_count=runner.scaled(students_count),
+        tasks_count=runner.scaled(tasks_count),
+        solutions_count=runner.scaled(solutions_count),
+        password=BENCHMARK_PASSWORD
+    )
+
+    course = data['courses'][0]
+    student = data['students_per_course'][course.id][0]
+    task = data['tasks_per_course'][course.id][0]
+
+    return {
+        'courses': data['courses'],
+        'course': course,
+        'teacher': data['teachers'][0],
+        'student': student,
+        'task': task,
+        'solution': Solution.objects.filter(task=task, user=student).first(),
+    }
+
+
+@benchmark('education.student_courses')
+def student_courses(runner, *, courses_count=50, students_per_course=20):
+    courses = [CourseFactory() for _ in range(courses_count)]
+    students = [Student.objects.create_from_user(BaseUserFactory()) for _ in range(students_per_course)]
+    teacher = TeacherFactory()
+
+    for course in courses:
+        add_teacher(course, teacher)
+        for student in students:
+            add_student(course=course, student=student)
+
+    view = StudentCoursesApi.as_view()
+    factory = APIRequestFactory(SERVER_NAME='localhost')
+
+    def list_courses(user):
+        request = factory.get('/api/education/courses/', {'page_size': courses_count})
+        force_authenticate(request, user=user)
+        response = view(request)
+        response.render()
+
+        return response
+
+    runner.measure(
+        f'student in {courses_count} courses',
+        lambda: list_courses(students[0].user)
+    )
+    runner.measure(
+        f'teacher in {courses_count} courses',
+        lambda: list_courses(teacher.user)
+    )
+
+
+@benchmark('education.gradebook_serialization')
+def gradebook_serialization(runner, *, students_count=1000, completed_tasks_count=10):
+    course = CourseFactory()
+
+    for _ in range(students_count):
+        add_student(course=course, student=Student.objects.create_from_user(BaseUserFactory()))
+
+    course = TeacherOnlyCourseDetailApi().get_queryset().get(id=course.id)
+
+    for student in course.students.all():
+        student.solution_summary = {
+            'OK': completed_tasks_count,
+            'TOTAL': completed_tasks_count,
+            'completed_tasks': [
+                {'task_id': index, 'name': f'Task {index}', 'solution_id': index}
+                for index in range(completed_tasks_count)
+            ]
+        }
+
+    serializer_class = TeacherOnlyCourseDetailApi.Serializer
+
+    runner.measure(
+        f'DRF serialization of {students_count} students',
+        lambda: serializers.Serializer.to_representation(serializer_class(instance=course), course),
+    )
+    runner.measure(
+        f'compiled serialization of {students_count} students',
+        lambda: serializer_class(instance=course).data,
+    )
+
+
+@benchmark('education.services')
+def heavy_services(runner):
+    data = seed_platform(runner)
+    course, student, task = data['course'], data['student'], data['task']
+    course_students = list(course.students.all())
+
+    runner.measure(
+        'get_user_solution_summary',
+        lambda: get_user_solution_summary(user=student),
+    )
+    runner.measure(
+        f'get_user_solution_summaries for {len(course_students)} students',
+        lambda: get_user_solution_summaries(users=course_students),
+    )
+    runner.measure(
+        'get_all_student_solution_statistics',
+        lambda: get_all_student_solution_statistics(task=task),
+    )
+    runner.measure(
+        f'course task statistics for {course.included_tasks.count()} tasks, uncached',
+        lambda: count_course_task_statistics(course_id=course.id),
+    )
+    runner.measure(
+        'get_course_task_statistics',
+        lambda: get_course_task_statistics(course=course),
+    )
+
+    leaderboard = load_leaderboard(course_id=course.id)
+    runner.measure(
+        f'load_leaderboard with {len(leaderboard)} entries',
+        lambda: load_leaderboard(course_id=course.id),
+    )
+    runner.measure(
+        f'leaderboard rank of {len(course_students)} students',
+        lambda: [leaderboard.get_rank(course_student.id) for course_student in course_students],
+    )
+    runner.measure(
+        'rebuild_leaderboard',
+        lambda: rebuild_leaderboard(course=course),
+        rollback=True,
+    )
+
+
+@benchmark('education.attendance')
+def attendance(runner, *, students_count=1000, lectures_count=50):
+    course = CourseFactory()
+    students = StudentFactory.create_bulk(runner.scaled(students_count))
+    CourseAssignmentFactory.create_bulk(len(students), course=course, student=factory.Iterator(students, cycle=False))
+    generate_lectures(course=course, lectures_count=lectures_count)
+
+    runner.measure(
+        f'get_course_attendance for {len(students)} students and {lectures_count} lectures',
+        lambda: get_course_attendance(course=course),
+    )
@@ -0,0 +1,32 @@
+import hashlib
+import zlib
+from typing import Tuple
+
+
+def get_code_hash(code: str) -> str:
+    return hashlib.sha256(code.encode('utf-8')).hexdigest()
+
+
+def encode_code(code: str, *, compress: bool) -> Tuple[bytes, bool]:
+    """
+    Returns the bytes to store for `code` and whether they are compressed.
+    Compressed bytes are only used when they are actually smaller.
+    """
+    data = code.encode('utf-8')
+
+    if compress:
+        compressed = zlib.compress(data)
+
+        if len(compressed) < len(data):
+            return compressed, True
+
+    return data, False
+
+
+def decode_code(data: bytes, *, compressed: bool) -> str:
+    data = bytes(data)
+
+    if compressed:
+        data = zlib.decompress(data)
+
+    return data.decode('utf-8')
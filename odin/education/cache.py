@@ -0,0 +1,55 @@
+from odin.common.cache import ReferenceData
+
+from .models import ProgrammingLanguage, Course
+
+
+LANGUAGES_VERSION_KEY = 'education:languages'
+
+
+def get_course_version_key(*, course_id: int) -> str:
+    return f'education:course:{course_id}'
+
+
+def get_course_user_version_key(*, course_id: int, user_id: int) -> str:
+    return f'education:course:{course_id}:user:{user_id}'
+
+
+def get_course_solutions_version_key(*, course_id: int) -> str:
+    return f'education:course:{course_id}:solutions'
+
+
+def get_course_leaderboard_version_key(*, course_id: int) -> str:
+    return f'education:course:{course_id}:leaderboard'
+
+
+def get_task_version_key(*, task_id: int) -> str:
+    return f'education:task:{task_id}'
+
+
+def get_task_user_version_key(*, task_id: int, user_id: int) -> str:
+    return f'education:task:{task_id}:user:{user_id}'
+
+
+def get_solution_version_key(*, solution_id: int) -> str:
+    return f'education:solution:{solution_id}'
+
+
+def get_profile_version_key(*, user_id: int) -> str:
+    return f'education:profile:{user_id}'
+
+
+def get_certificate_cache_key(*, token: str) -> str:
+    return f'education:certificate:{token}'
+
+
+programming_languages = ReferenceData(
+    key=LANGUAGES_VERSION_KEY,
+    loader=lambda: list(ProgrammingLanguage.objects.order_by('id').values('id', 'name')),
+    models=[ProgrammingLanguage],
+)
+
+course_slugs_and_names = ReferenceData(
+    key='education:courses:slugs',
+    loader=lambda: list(Course.objects.order_by('id').values_list('slug_url', 'name')),
+    models=[Course],
+)
@@ -0,0 +1,160 @@
+from typing import Dict, List
+
+import factory
+
+from django.db import connection
+
+from odin.common.faker import faker
+
+from .models import Course, Lecture, CodeBlob, Solution
+from .services import rebuild_leaderboard
+from .factories import (
+    StudentFactory,
+    TeacherFactory,
+    CourseFactory,
+    CourseAssignmentFactory,
+    TaskFactory,
+    IncludedTaskFactory,
+    ProgrammingLanguageFactory,
+    TaskTestFactory,
+    IncludedTestFactory,
+    LectureFactory,
+)
+
+
+def _insert_solutions(*, courses: List[Course], solutions_per_task: int, code_blob_hashes: List[str]):
+    """
+    Inserts `solutions_per_task` solutions for every student and task of `courses` in one statement.
+    Every third one passes. Built in the database, since even `bulk_create` spends minutes on millions of rows.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO education_solution (created_at, updated_at, task_id, user_id, code_blob_id, status, test_output)
+            SELECT now(), now(), task.id, assignment.student_id,
+                   (%(hashes)s::varchar[])[1 + (task.id + assignment.student_id + attempt) %% %(hashes_count)s],
+                   CASE WHEN attempt %% 3 = 0 THEN %(ok)s ELSE %(not_ok)s END,
+                   json_build_object('passed', attempt %% 3 = 0)
+              FROM education_courseassignment assignment
+              JOIN education_includedtask task ON task.course_id = assignment.course_id
+             CROSS JOIN generate_series(1, %(solutions_per_task)s) attempt
+             WHERE assignment.course_id = ANY(%(course_ids)s) AND assignment.student_id IS NOT NULL
+             ORDER BY assignment.student_id, task.id, attempt
+            """,
+            {
+                'hashes': code_blob_hashes,
+                'hashes_count': len(code_blob_hashes),
+                'ok': Solution.OK,
+                'not_ok': Solution.NOT_OK,
+                'solutions_per_task': solutions_per_task,
+                'course_ids': [course.id for course in courses],
+            }
+        )
+
+
+def generate_education_dataset(
+    *,
+    courses_count: int=50,
+    students_count: int=10000,
+    tasks_count: int=500,
+    solutions_count: int=2000000,
+    password: str=None,
+    code_variants_count: int=100
+) -> Dict:
+    """
+    Generates courses with one teacher each, splitting the students and the gradable tasks evenly between them.
+    Every task gets a test and the solutions are split evenly between every student and task of a course.
+
+    Everything is inserted in bulk, see `BulkCreateFactoryMixin`, and the solutions with a single statement.
+    Solutions reuse `code_variants_count` different codes, so they share code blobs as real submissions do.
+    """
+    students_count = max(students_count, courses_count)
+    tasks_count = max(tasks_count, courses_count)
+    user_kwargs = {} if password is None else {'password': password}
+
+    courses = CourseFactory.create_bulk(courses_count)
+    teachers = TeacherFactory.create_bulk(courses_count, **user_kwargs)
+    students = StudentFactory.create_bulk(students_count, **user_kwargs)
+
+    students_per_course = {course.id: students[index::courses_count] for index, course in enumerate(courses)}
+    CourseAssignmentFactory.create_bulk(
+        courses_count,
+        course=factory.Iterator(courses, cycle=False),
+        teacher=factory.Iterator(teachers, cycle=False)
+    )
+    CourseAssignmentFactory.create_bulk(
+        students_count,
+        course=factory.Iterator([course for course in courses for _ in students_per_course[course.id]], cycle=False),
+        student=factory.Iterator(
+            [student for course in courses for student in students_per_course[course.id]],
+            cycle=False
+        )
+    )
+
+    weeks_per_course = {course.id: list(course.weeks.all()) for course in courses}
+
+    task_courses = [courses[index % courses_count] for index in range(tasks_count)]
+    tasks = IncludedTaskFactory.create_bulk(
+        tasks_count,
+        task=factory.Iterator(TaskFactory.create_bulk(tasks_count, gradable=True), cycle=False),
+        course=factory.Iterator(task_courses, cycle=False),
+        week=factory.Iterator([
+            weeks_per_course[course.id][index // courses_count % len(weeks_per_course[course.id])]
+            for index, course in enumerate(task_courses)
+        ], cycle=False)
+    )
+
+    languages = ProgrammingLanguageFactory.create_bulk(3)
+    IncludedTestFactory.create_bulk(
+        tasks_count,
+        task=factory.Iterator(tasks, cycle=False),
+        test=factory.Iterator(TaskTestFactory.create_bulk(
+            tasks_count,
+            language=factory.Iterator(languages),
+            code=factory.LazyAttribute(lambda _: faker.text())
+        ), cycle=False)
+    )
+
+    tasks_per_course = {course.id: [] for course in courses}
+    for task in tasks:
+        tasks_per_course[task.course_id].append(task)
+
+    code_blobs = CodeBlob.objects.get_or_create_for_codes([faker.text() for _ in range(code_variants_count)])
+    _insert_solutions(
+        courses=courses,
+        solutions_per_task=max(1, solutions_count // (students_count * tasks_count // courses_count)),
+        code_blob_hashes=[blob.hash for blob in code_blobs.values()]
+    )
+    # The solutions skip the signals that keep the leaderboards up to date.
+    for course in courses:
+        rebuild_leaderboard(course=course)
+
+    return {
+        'courses': courses,
+        'teachers': teachers,
+        'students_per_course': students_per_course,
+        'tasks_per_course': tasks_per_course,
+        'languages': languages,
+    }
+
+
+def generate_lectures(*, course: Course, lectures_count: int=50, presence_ratio: float=0.8) -> List[Lecture]:
+    """
+    Spreads `lectures_count` lectures over the weeks of `course`
+    and marks about `presence_ratio` of its students present at each one.
+    """
+    lectures = LectureFactory.create_bulk(
+        lectures_count,
+        course=course,
+        week=factory.Iterator(list(course.weeks.all()))
+    )
+    student_ids = list(course.students.values_list('id', flat=True))
+
+    Lecture.present_students.through.objects.bulk_create([
+        Lecture.present_students.through(lecture_id=lecture.id, student_id=student_id)
+        for lecture in lectures
+        for student_id in student_ids
+        if faker.random.random() < presence_ratio
+    ])
+
+    return lectures
@@ -4,8 +4,10 @@ import factory
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 
+from odin.common.cache import bump_versions
 from odin.common.utils import get_now
 from odin.common.faker import faker
+from odin.common.factories import BulkCreateFactoryMixin
 from odin.users.factories import BaseUserFactory
 
 from odin.education.services import create_test_for_task
@@ -14,29 +16,54 @@ from .models import (
     Student,
     Teacher,
     Course,
+    CourseDescription,
+    CourseAssignment,
     Week,
+    Lecture,
     Material,
     IncludedMaterial,
     Task,
     IncludedTask,
     ProgrammingLanguage,
     Test,
+    IncludedTest,
+    CodeBlob,
     Solution
 )
-from .services import create_course
+from .services import create_course, build_course_weeks, rebuild_leaderboard
+from .cache import (
+    programming_languages,
+    course_slugs_and_names,
+    get_course_version_key,
+    get_course_user_version_key,
+    get_course_solutions_version_key,
+    get_task_user_version_key,
+)
+
+
+def _bump_course_versions(instances):
+    bump_versions(*{get_course_version_key(course_id=instance.course_id) for instance in instances})
 
 
 class StudentFactory(BaseUserFactory):
     class Meta:
         model = Student
 
+    @classmethod
+    def create_bulk(cls, size, **kwargs):
+        return Student.objects.bulk_create_from_users(BaseUserFactory.create_bulk(size, **kwargs))
+
 
 class TeacherFactory(BaseUserFactory):
     class Meta:
         model = Teacher
 
+    @classmethod
+    def create_bulk(cls, size, **kwargs):
+        return Teacher.objects.bulk_create_from_users(BaseUserFactory.create_bulk(size, **kwargs))
+
 
-class CourseFactory(factory.DjangoModelFactory):
+class CourseFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     name = factory.Sequence(lambda n: f'{n}{faker.word()}')
     start_date = factory.LazyAttribute(
         lambda _: get_now()
@@ -62,8 +89,35 @@ class CourseFactory(factory.DjangoModelFactory):
     def _create(cls, model_class, *args, **kwargs):
         return create_course(**kwargs)
 
+    @classmethod
+    def _to_bulk_instance(cls, kwargs):
+        return Course(**kwargs)
+
+    @classmethod
+    def _after_create_bulk(cls, courses):
+        # Replaces what `create_course` and the `Course` signals add to every new course.
+        Week.objects.bulk_create([week for course in courses for week in build_course_weeks(course=course)])
+        CourseDescription.objects.bulk_create([CourseDescription(course=course) for course in courses])
+        CourseAssignment.objects.bulk_create([
+            CourseAssignment(course=course, teacher=teacher, hidden=True)
+            for teacher in Teacher.objects.filter(is_superuser=True)
+            for course in courses
+        ])
+        course_slugs_and_names.invalidate()
+
+
+class CourseAssignmentFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
+    course = factory.SubFactory(CourseFactory)
 
-class WeekFactory(factory.DjangoModelFactory):
+    class Meta:
+        model = CourseAssignment
+
+    @classmethod
+    def _after_create_bulk(cls, assignments):
+        _bump_course_versions(assignments)
+
+
+class WeekFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     number = factory.LazyAttribute(lambda _: faker.pyint())
 
     start_date = factory.LazyAttribute(lambda _: faker.date_object())
@@ -74,6 +128,19 @@ class WeekFactory(factory.DjangoModelFactory):
     class Meta:
         model = Week
 
+    @classmethod
+    def _after_create_bulk(cls, weeks):
+        _bump_course_versions(weeks)
+
+
+class LectureFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
+    course = factory.SubFactory(CourseFactory)
+    week = factory.LazyAttribute(lambda lecture: lecture.course.weeks.first())
+    date = factory.SelfAttribute('week.start_date')
+
+    class Meta:
+        model = Lecture
+
 
 class MaterialFactory(factory.DjangoModelFactory):
     identifier = factory.Sequence(lambda n: f'{n}{faker.word()}')
@@ -102,7 +169,7 @@ class IncludedMaterialFactory(factory.DjangoModelFactory):
         return IncludedMaterial.objects.create(**kwargs)
 
 
-class TaskFactory(factory.DjangoModelFactory):
+class TaskFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     name = factory.Sequence(lambda n: f'{n}{faker.word()}')
     description = factory.LazyAttribute(lambda _: faker.text())
     gradable = factory.LazyAttribute(lambda _: faker.boolean())
@@ -111,25 +178,23 @@ class TaskFactory(factory.DjangoModelFactory):
         model = Task
 
 
-class IncludedTaskFactory(factory.DjangoModelFactory):
+class IncludedTaskFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     week = factory.SubFactory(WeekFactory)
     course = factory.SubFactory(CourseFactory)
     task = factory.SubFactory(TaskFactory)
+    name = factory.SelfAttribute('task.name')
+    description = factory.SelfAttribute('task.description')
+    gradable = factory.SelfAttribute('task.gradable')
 
     class Meta:
         model = IncludedTask
 
     @classmethod
-    def _create(cls, model_class, *args, **kwargs):
-        fields = ('name', 'description', 'gradable')
-        task = kwargs.get('task')
-        for field in fields:
-            if kwargs.get(field) is None:
-                kwargs[field] = task.__dict__.get(field)
-        return IncludedTask.objects.create(**kwargs)
+    def _after_create_bulk(cls, included_tasks):
+        _bump_course_versions(included_tasks)
 
 
-class ProgrammingLanguageFactory(factory.DjangoModelFactory):
+class ProgrammingLanguageFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     name = factory.LazyAttribute(lambda _: faker.word())
     test_format = factory.LazyAttribute(lambda _: faker.file_name())
     requirements_format = factory.LazyAttribute(lambda _: faker.file_name())
@@ -137,8 +202,12 @@ class ProgrammingLanguageFactory(factory.DjangoModelFactory):
     class Meta:
         model = ProgrammingLanguage
 
+    @classmethod
+    def _after_create_bulk(cls, languages):
+        programming_languages.invalidate()
+
 
-class TaskTestFactory(factory.DjangoModelFactory):
+class TaskTestFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     language = factory.SubFactory(ProgrammingLanguageFactory)
 
     class Meta:
@@ -159,7 +228,34 @@ class BinaryFileTestFactory(TaskTestFactory):
         return create_test_for_task(*args, **kwargs)
 
 
-class SolutionFactory(factory.DjangoModelFactory):
+class IncludedTestFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
+    task = factory.SubFactory(IncludedTaskFactory, gradable=True)
+    test = factory.SubFactory(TaskTestFactory, code=factory.LazyAttribute(lambda _: faker.text()))
+
+    class Meta:
+        model = IncludedTest
+
+    @classmethod
+    def _copy_test(cls, included_test):
+        # Same as `create_test_for_task` for an existing test
+        for field in ('language', 'extra_options', 'code', 'requirements', 'file'):
+            setattr(included_test, field, getattr(included_test.test, field))
+
+        return included_test
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        included_test = cls._copy_test(model_class(*args, **kwargs))
+        included_test.save()
+
+        return included_test
+
+    @classmethod
+    def _to_bulk_instance(cls, included_test):
+        return cls._copy_test(included_test)
+
+
+class SolutionFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     task = factory.SubFactory(IncludedTaskFactory)
     user = factory.SubFactory(BaseUserFactory)
     url = factory.LazyAttribute(lambda _: faker.url())
@@ -169,3 +265,31 @@ class SolutionFactory(factory.DjangoModelFactory):
 
     class Meta:
         model = Solution
+
+    @classmethod
+    def _before_create_bulk(cls, solutions):
+        # Resolves the code to blobs in one go, instead of once per `save`.
+        codes = [solution._code for solution in solutions if getattr(solution, '_code', None) is not None]
+        blobs = CodeBlob.objects.get_or_create_for_codes(codes)
+
+        for solution in solutions:
+            code = solution.__dict__.pop('_code', None)
+            if code is not None:
+                solution.code_blob = blobs[code]
+
+    @classmethod
+    def _after_create_bulk(cls, solutions):
+        # Replaces `bump_solution_version`, the new solutions themselves have nothing cached yet.
+        bump_versions(*{
+            key
+            for solution in solutions
+            for key in (
+                get_task_user_version_key(task_id=solution.task_id, user_id=solution.user_id),
+                get_course_user_version_key(course_id=solution.task.course_id, user_id=solution.user_id),
+                get_course_solutions_version_key(course_id=solution.task.course_id),
+            )
+        })
+
+        # Replaces `update_leaderboard`.
+        for course in {solution.task.course for solution in solutions}:
+            rebuild_leaderboard(course=course)
@@ -0,0 +1,85 @@
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from odin.common.cache import ReferenceData
+
+from .cache import get_course_leaderboard_version_key
+from .models import LeaderboardEntry
+
+
+def _get_rank_key(entry: Dict) -> tuple:
+    # More solved tasks first, then whoever got to that count earlier.
+    return (-entry['solved_tasks_count'], entry['last_solved_at'])
+
+
+class Leaderboard:
+    """
+    The entries of a course leaderboard, ordered by rank.
+    Students with the same count solved at the same time share a rank.
+    """
+    def __init__(self, entries: List[Dict]):
+        self.entries = sorted(entries, key=lambda entry: (_get_rank_key(entry), entry['user_id']))
+        self._rank_keys = [_get_rank_key(entry) for entry in self.entries]
+        self._entries_by_user = {entry['user_id']: entry for entry in self.entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def top(self, count: int) -> List[Dict]:
+        return [
+            {'rank': self.get_rank(entry['user_id']), **entry}
+            for entry in self.entries[:count]
+        ]
+
+    def get_rank(self, user_id: int) -> Optional[int]:
+        entry = self._entries_by_user.get(user_id)
+
+        if entry is None:
+            return None
+
+        return bisect_left(self._rank_keys, _get_rank_key(entry)) + 1
+
+    def get_entry(self, user_id: int) -> Optional[Dict]:
+        entry = self._entries_by_user.get(user_id)
+
+        if entry is None:
+            return None
+
+        return {'rank': self.get_rank(user_id), **entry}
+
+
+def load_leaderboard(*, course_id: int) -> Leaderboard:
+    return Leaderboard(list(
+        LeaderboardEntry.objects.filter(course_id=course_id).values(
+            'user_id',
+            'user__profile__full_name',
+            'solved_tasks_count',
+            'last_solved_at',
+        )
+    ))
+
+
+_leaderboards = {}
+
+
+def _get_course_leaderboard_data(course_id: int) -> ReferenceData:
+    data = _leaderboards.get(course_id)
+
+    if data is None:
+        data = _leaderboards.setdefault(course_id, ReferenceData(
+            key=get_course_leaderboard_version_key(course_id=course_id),
+            loader=lambda: load_leaderboard(course_id=course_id)
+        ))
+
+    return data
+
+
+def get_course_leaderboard(*, course_id: int) -> Leaderboard:
+    """
+    The leaderboard of the course, kept in the process until one of its entries changes.
+    """
+    return _get_course_leaderboard_data(course_id).get()
+
+
+def invalidate_course_leaderboard(*, course_id: int):
+    _get_course_leaderboard_data(course_id).invalidate()
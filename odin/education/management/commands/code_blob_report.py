@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from odin.education.services import get_code_blob_storage_report
+
+
+class Command(BaseCommand):
+    help = 'Reports how much space storing solution code as deduplicated blobs saves.'
+
+    def handle(self, *args, **options):
+        report = get_code_blob_storage_report()
+
+        self.stdout.write(f'Solutions with code: {report["solutions"]}')
+        self.stdout.write(f'Distinct code blobs: {report["blobs"]}')
+        self.stdout.write(f'Code size without deduplication: {report["logical_bytes"]} bytes')
+        self.stdout.write(f'Distinct code size: {report["unique_bytes"]} bytes')
+        self.stdout.write(f'Stored size: {report["stored_bytes"]} bytes')
+
+        saved = report['saved_bytes']
+        ratio = saved / report['logical_bytes'] if report['logical_bytes'] else 0
+        self.stdout.write(self.style.SUCCESS(f'Saved: {saved} bytes ({ratio:.1%})'))
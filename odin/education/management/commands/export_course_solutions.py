@@ -0,0 +1,36 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from odin.common.exports import CSV, EXPORT_CHUNK_SIZE, EXPORT_CONTENT_TYPES, stream_export
+
+from odin.education.models import Course
+from odin.education.services import (
+    COURSE_SOLUTIONS_EXPORT_FIELDS,
+    get_course_solutions_export_rows,
+)
+
+
+class Command(BaseCommand):
+    help = 'Exports the solutions of a course, with grades and test results, as CSV or NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_id', type=int)
+        parser.add_argument('--format', dest='export_format', choices=list(EXPORT_CONTENT_TYPES), default=CSV)
+        parser.add_argument('--output', help='Path of the file to write to. Writes to stdout if omitted.')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            course = Course.objects.get(id=options['course_id'])
+        except Course.DoesNotExist:
+            raise CommandError(f'Course {options["course_id"]} does not exist')
+
+        rows = get_course_solutions_export_rows(course=course, chunk_size=options['chunk_size'])
+        content = stream_export(rows, fields=COURSE_SOLUTIONS_EXPORT_FIELDS, export_format=options['export_format'])
+
+        if options['output']:
+            with open(options['output'], 'w', newline='') as output:
+                output.writelines(content)
+        else:
+            sys.stdout.writelines(content)
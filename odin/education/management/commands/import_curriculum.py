@@ -0,0 +1,37 @@
+import json
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from odin.education.models import Course
+from odin.education.services import import_curriculum
+
+
+class Command(BaseCommand):
+    help = 'Imports the materials, tasks and tests of a curriculum manifest into a course.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('course', type=int, help='Id of the course to import into.')
+        parser.add_argument('manifest', help='Path to the JSON manifest, see `import_curriculum`.')
+
+    def handle(self, *args, **options):
+        course = Course.objects.filter(id=options['course']).first()
+
+        if course is None:
+            raise CommandError(f'Course {options["course"]} does not exist')
+
+        with open(options['manifest']) as manifest:
+            manifest = json.load(manifest)
+
+        start = time.perf_counter()
+
+        try:
+            imported = import_curriculum(course=course, manifest=manifest)
+        except ValidationError as exc:
+            raise CommandError('; '.join(exc.messages))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {imported["materials"]} materials, {imported["tasks"]} tasks '
+            f'and {imported["tests"]} tests in {time.perf_counter() - start:.1f}s'
+        ))
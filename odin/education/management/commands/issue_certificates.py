@@ -0,0 +1,31 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from odin.education.models import Course
+from odin.education.services import CERTIFICATE_MIN_COMPLETION, issue_certificates
+
+
+class Command(BaseCommand):
+    help = 'Issues certificates to the students of a course that passed enough of its tasks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('course', type=int, help='Id of the course.')
+        parser.add_argument(
+            '--min-completion',
+            type=float,
+            default=CERTIFICATE_MIN_COMPLETION,
+            help='Part of the tasks a student has to pass, between 0 and 1.'
+        )
+
+    def handle(self, *args, **options):
+        course = Course.objects.filter(id=options['course']).first()
+
+        if course is None:
+            raise CommandError(f'Course {options["course"]} does not exist')
+
+        try:
+            certificates = issue_certificates(course=course, min_completion=options['min_completion'])
+        except ValidationError as exc:
+            raise CommandError(exc.messages[0])
+
+        self.stdout.write(self.style.SUCCESS(f'Issued {len(certificates)} certificates for {course}'))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from odin.education.models import Course
+from odin.education.services import rebuild_leaderboard
+
+
+class Command(BaseCommand):
+    help = 'Recounts the leaderboard of every course, or of a single course, and reports the entries that drifted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', type=int, help='Id of the course to rebuild.')
+
+    def handle(self, *args, **options):
+        courses = Course.objects.order_by('id')
+
+        if options['course'] is not None:
+            courses = courses.filter(id=options['course'])
+
+            if not courses.exists():
+                raise CommandError(f'Course {options["course"]} does not exist')
+
+        drifted = 0
+
+        for course in courses:
+            count = rebuild_leaderboard(course=course)
+            drifted += count
+
+            if count:
+                self.stdout.write(self.style.WARNING(f'{course}: {count} leaderboard entries were out of date'))
+
+        self.stdout.write(self.style.SUCCESS(f'Leaderboards rebuilt, {drifted} entries were out of date'))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from odin.education.models import Course
+from odin.education.services import refresh_task_descriptions
+
+
+class Command(BaseCommand):
+    help = 'Schedules fetching the descriptions of every task, or of the tasks of a single course.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', type=int, help='Id of the course to refresh.')
+
+    def handle(self, *args, **options):
+        course = None
+
+        if options['course'] is not None:
+            course = Course.objects.filter(id=options['course']).first()
+
+            if course is None:
+                raise CommandError(f'Course {options["course"]} does not exist')
+
+        count = refresh_task_descriptions(course=course)
+
+        self.stdout.write(self.style.SUCCESS(f'Scheduled fetching {count} task descriptions'))
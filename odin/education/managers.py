@@ -1,18 +1,22 @@
+from django.db import IntegrityError, transaction
 from django.db.models import Manager, Q
+from django.conf import settings
 from django.apps import apps
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
-from odin.users.managers import UserManager
+from odin.users.managers import UserManager, RoleManagerMixin
 from odin.users.models import BaseUser
 
+from .blobs import get_code_hash, encode_code
+
 
 class BaseEducationUserManager(UserManager):
     def create(self, **kwargs):
         return self.create_user(**kwargs)
 
 
-class StudentManager(BaseEducationUserManager):
+class StudentManager(RoleManagerMixin, BaseEducationUserManager):
     def create_from_user(self, user: BaseUser):
         Student = apps.get_model('education', 'Student')
 
@@ -33,7 +37,7 @@ class StudentManager(BaseEducationUserManager):
         return Student.objects.get(id=student.id)
 
 
-class TeacherManager(BaseEducationUserManager):
+class TeacherManager(RoleManagerMixin, BaseEducationUserManager):
     def create_from_user(self, user: BaseUser):
         Teacher = apps.get_model('education', 'Teacher')
 
@@ -67,3 +71,50 @@ class CourseManager(Manager):
         )
 
         return self.filter(Q(**conditions[0]) & Q(**conditions[1]))
+
+
+class CodeBlobManager(Manager):
+    def get_or_create_for_code(self, code: str):
+        code_hash = get_code_hash(code)
+        blob = self.filter(hash=code_hash).first()
+
+        if blob is None:
+            data, compressed = encode_code(code, compress=settings.SOLUTION_CODE_COMPRESSION)
+            blob, _ = self.get_or_create(
+                hash=code_hash,
+                defaults={'data': data, 'compressed': compressed, 'size': len(code.encode('utf-8'))}
+            )
+
+        return blob
+
+    def get_or_create_for_codes(self, codes):
+        """
+        Same as `get_or_create_for_code` for many codes at once, returns the blobs keyed by code.
+        """
+        hashes = {code: get_code_hash(code) for code in set(codes)}
+        blobs = self.in_bulk(list(hashes.values()))
+
+        missing = []
+        for code, code_hash in hashes.items():
+            if code_hash not in blobs:
+                data, compressed = encode_code(code, compress=settings.SOLUTION_CODE_COMPRESSION)
+                missing.append(self.model(
+                    hash=code_hash,
+                    data=data,
+                    compressed=compressed,
+                    size=len(code.encode('utf-8'))
+                ))
+
+        try:
+            with transaction.atomic():
+                self.bulk_create(missing)
+        except IntegrityError:
+            # Someone stored some of the blobs meanwhile. Blobs never change, so theirs are as good as ours.
+            for blob in missing:
+                self.get_or_create(hash=blob.hash, defaults={
+                    'data': blob.data, 'compressed': blob.compressed, 'size': blob.size
+                })
+
+        blobs.update({blob.hash: blob for blob in missing})
+
+        return {code: blobs[code_hash] for code, code_hash in hashes.items()}
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import migrations
+
+from odin.education.blobs import get_code_hash, encode_code, decode_code
+
+
+CHUNK_SIZE = 2000
+
+
+def move_code_to_blobs(apps, schema_editor):
+    Solution = apps.get_model('education', 'Solution')
+    CodeBlob = apps.get_model('education', 'CodeBlob')
+
+    solutions = Solution.objects.filter(code__isnull=False).order_by('id').values_list('id', 'code')
+    last_id = 0
+
+    while True:
+        chunk = list(solutions.filter(id__gt=last_id)[:CHUNK_SIZE])
+        if not chunk:
+            return
+
+        last_id = chunk[-1][0]
+
+        solution_ids = defaultdict(list)
+        codes = {}
+        for solution_id, code in chunk:
+            code_hash = get_code_hash(code)
+            solution_ids[code_hash].append(solution_id)
+            codes[code_hash] = code
+
+        existing = set(CodeBlob.objects.filter(hash__in=codes.keys()).values_list('hash', flat=True))
+        blobs = []
+        for code_hash, code in codes.items():
+            if code_hash in existing:
+                continue
+
+            data, compressed = encode_code(code, compress=settings.SOLUTION_CODE_COMPRESSION)
+            blobs.append(CodeBlob(hash=code_hash, data=data, compressed=compressed, size=len(code.encode('utf-8'))))
+
+        CodeBlob.objects.bulk_create(blobs)
+
+        for code_hash, ids in solution_ids.items():
+            Solution.objects.filter(id__in=ids).update(code_blob_id=code_hash)
+
+
+def move_code_back_to_solutions(apps, schema_editor):
+    Solution = apps.get_model('education', 'Solution')
+    CodeBlob = apps.get_model('education', 'CodeBlob')
+
+    for blob in CodeBlob.objects.iterator():
+        code = decode_code(blob.data, compressed=blob.compressed)
+        Solution.objects.filter(code_blob_id=blob.hash).update(code=code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('education', '0028_codeblob'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_code_to_blobs, move_code_back_to_solutions),
+    ]
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('education', '0029_move_solution_code_to_code_blobs'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='solution',
+            name='code',
+        ),
+    ]
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2026-10-19 10:42
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('education', '0030_remove_solution_code'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='solution',
+            index=models.Index(fields=['task', 'user', '-id'], name='education_solution_tu_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='solution',
+            index=models.Index(fields=['user', 'status'], name='education_solution_us_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='solution',
+            index=models.Index(fields=['task', 'status'], name='education_solution_ts_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2026-10-19 11:16
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('education', '0031_solution_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDescription',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('url', models.URLField(max_length=500, unique=True)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('markdown', models.TextField(blank=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='includedtask',
+            name='description_url',
+            field=models.URLField(blank=True, db_index=True, max_length=500, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='description_url',
+            field=models.URLField(blank=True, db_index=True, max_length=500, null=True),
+        ),
+    ]
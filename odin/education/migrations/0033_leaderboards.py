@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2026-10-19 11:50
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Solution.OK for gradable tasks and Solution.SUBMITTED_WITHOUT_GRADING for the rest pass.
+POPULATE_LEADERBOARDS = """
+INSERT INTO education_solvedtask (task_id, user_id, solved_at)
+SELECT solution.task_id, solution.user_id, min(solution.created_at)
+  FROM education_solution solution
+  JOIN education_includedtask task ON task.id = solution.task_id
+ WHERE (task.gradable AND solution.status = 2) OR (NOT task.gradable AND solution.status = 6)
+ GROUP BY solution.task_id, solution.user_id;
+
+INSERT INTO education_leaderboardentry (course_id, user_id, solved_tasks_count, last_solved_at)
+SELECT task.course_id, solved.user_id, count(*), max(solved.solved_at)
+  FROM education_solvedtask solved
+  JOIN education_includedtask task ON task.id = solved.task_id
+ GROUP BY task.course_id, solved.user_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('education', '0032_task_descriptions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('solved_tasks_count', models.PositiveIntegerField()),
+                ('last_solved_at', models.DateTimeField()),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to='education.Course')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SolvedTask',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('solved_at', models.DateTimeField()),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='solved_tasks', to='education.IncludedTask')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='solved_tasks', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='solvedtask',
+            unique_together=set([('task', 'user')]),
+        ),
+        migrations.AlterUniqueTogether(
+            name='leaderboardentry',
+            unique_together=set([('course', 'user')]),
+        ),
+        migrations.RunSQL(POPULATE_LEADERBOARDS, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -4,31 +4,76 @@ from django.shortcuts import get_object_or_404, redirect
 from django.http import Http404
 from django.contrib import messages
 from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
+
+
+def _get_prefetch_queryset(model, lookup: str, fields):
+    """
+    The queryset `lookup` prefetches with, loading only `fields` and what the prefetch needs to match the rows.
+    Fields behind a relation, like `profile__full_name`, are loaded with `select_related`.
+    """
+    for name in lookup.split('__'):
+        field = model._meta.get_field(name)
+        model = field.related_model
+
+    queryset = model.objects.all()
+
+    if fields is None:
+        return queryset
+
+    fields = list(fields)
+
+    if field.one_to_many:
+        # Reverse foreign keys are matched to their parents by the foreign key.
+        fields.append(field.field.name)
+
+    related = {field.rsplit('__', 1)[0] for field in fields if '__' in field}
+    if related:
+        queryset = queryset.select_related(*related)
+
+    return queryset.only(*fields)
 
 
 class CourseViewMixin:
-    def dispatch(self, request, *args, **kwargs):
+    """
+    Loads `self.course` with a single query plus one for each relation the view declares it renders.
+
+    `course_fields` is passed to `only()`, `course_prefetch` maps relation lookups to the fields loaded for them:
+
+        course_prefetch = {
+            'students': ('email', 'profile__full_name'),
+            'weeks': ('number', 'start_date', 'end_date'),
+            'weeks__lectures': ('date', ),
+        }
+
+    `None` loads every field of the relation.
+    """
+    course_fields = ('id', 'name', 'slug_url', 'start_date', 'end_date', 'attendable', 'public', 'logo')
+    course_prefetch = {}
+
+    def get_course_queryset(self):
         Course = apps.get_model('education.Course')
+
+        # Parents first, `weeks` has to be prefetched with its own queryset before `weeks__lectures`.
+        prefetch = [
+            Prefetch(lookup, queryset=_get_prefetch_queryset(Course, lookup, fields))
+            for lookup, fields in sorted(self.course_prefetch.items(), key=lambda item: item[0].count('__'))
+        ]
+
+        return Course.objects.only(*self.course_fields).prefetch_related(*prefetch)
+
+    def dispatch(self, request, *args, **kwargs):
         course_id = self.kwargs.get('course_id')
-        if not course_id:
-            course_slug = self.kwargs.get('course_slug')
-
-        prefetch = (
-            'students__profile',
-            'teachers__profile',
-            'week',
-            'materials',
-            'tasks__solutions',
-            'weeks__lectures',
-        )
+
         if course_id:
-            self.course = Course.objects.filter(id=course_id).prefetch_related(*prefetch)
+            lookup = {'id': course_id}
         else:
-            self.course = Course.objects.filter(slug_url=course_slug).prefetch_related(*prefetch)
-        if not self.course.exists():
-            raise Http404
+            lookup = {'slug_url': self.kwargs.get('course_slug')}
 
-        self.course = self.course.first()
+        self.course = self.get_course_queryset().filter(**lookup).first()
+
+        if self.course is None:
+            raise Http404
 
         return super().dispatch(request, *args, **kwargs)
 
@@ -6,15 +6,17 @@ from dateutil import rrule
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.contrib.postgres.fields import JSONField
+from django.utils.functional import cached_property
 
 from odin.common.models import UpdatedAtCreatedAtModelMixin
 from odin.common.utils import get_now, json_field_default
 
 from odin.users.models import BaseUser
 
-from .managers import StudentManager, TeacherManager, CourseManager
+from .managers import StudentManager, TeacherManager, CourseManager, CodeBlobManager
 from .query import TaskQuerySet, SolutionQuerySet
 from .mixins import TestModelMixin
+from .blobs import decode_code
 
 
 class Student(BaseUser):
@@ -218,9 +220,7 @@ class Lecture(models.Model):
 
     @property
     def not_present_students(self):
-        present_ids = self.present_students.values_list('id', flat=True)
-
-        return self.course.students.exclude(id__in=present_ids)
+        return Student.objects.filter(course_assignments__course_id=self.course_id).exclude(lectures=self)
 
 
 class Certificate(models.Model):
@@ -249,6 +249,7 @@ class StudentNote(UpdatedAtCreatedAtModelMixin, models.Model):
 class BaseTask(UpdatedAtCreatedAtModelMixin, models.Model):
     name = models.CharField(max_length=128)
     description = models.TextField(blank=True, null=True)
+    description_url = models.URLField(max_length=500, blank=True, null=True, db_index=True)
     gradable = models.BooleanField(default=False)
 
     class Meta:
@@ -262,6 +263,18 @@ class Task(BaseTask):
     pass
 
 
+class TaskDescription(UpdatedAtCreatedAtModelMixin, models.Model):
+    """
+    Task description markdown, as last fetched from `url`, with the ETag to revalidate it.
+    """
+    url = models.URLField(max_length=500, unique=True)
+    etag = models.CharField(max_length=255, blank=True)
+    markdown = models.TextField(blank=True)
+
+    def __str__(self):
+        return self.url
+
+
 class ProgrammingLanguage(models.Model):
     name = models.CharField(max_length=110)
     test_format = models.CharField(max_length=20, blank=True, null=True)
@@ -340,6 +353,25 @@ class IncludedTest(TestModelMixin, BaseTest):
                              related_name='included_tests')
 
 
+class CodeBlob(models.Model):
+    """
+    Solution code, stored once per distinct content and keyed by its SHA-256 hash.
+    """
+    hash = models.CharField(max_length=64, primary_key=True)
+    data = models.BinaryField()
+    compressed = models.BooleanField(default=False)
+    size = models.PositiveIntegerField()
+
+    objects = CodeBlobManager()
+
+    @cached_property
+    def code(self):
+        return decode_code(self.data, compressed=self.compressed)
+
+    def __str__(self):
+        return self.hash
+
+
 class Solution(UpdatedAtCreatedAtModelMixin, models.Model):
     PENDING = 0
     RUNNING = 1
@@ -362,7 +394,13 @@ class Solution(UpdatedAtCreatedAtModelMixin, models.Model):
     task = models.ForeignKey(IncludedTask, related_name='solutions')
     user = models.ForeignKey(BaseUser, related_name='solutions')
     url = models.URLField(blank=True, null=True)
-    code = models.TextField(blank=True, null=True)
+    code_blob = models.ForeignKey(
+        CodeBlob,
+        on_delete=models.PROTECT,
+        related_name='solutions',
+        blank=True,
+        null=True
+    )
     check_status_location = models.CharField(max_length=128, null=True, blank=True)
     build_id = models.IntegerField(blank=True, null=True)
     status = models.SmallIntegerField(choices=STATUS_CHOICE, default=SUBMITTED_WITHOUT_GRADING)
@@ -372,13 +410,61 @@ class Solution(UpdatedAtCreatedAtModelMixin, models.Model):
 
     objects = SolutionQuerySet.as_manager()
 
+    @property
+    def code(self):
+        if hasattr(self, '_code'):
+            return self._code
+
+        if self.code_blob_id is None:
+            return None
+
+        return self.code_blob.code
+
+    @code.setter
+    def code(self, value):
+        # The blob is looked up or created on save.
+        self._code = value
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+
+        if update_fields is not None:
+            # `code` is not a concrete field, it is stored as `code_blob`.
+            update_fields = {'code_blob' if field == 'code' else field for field in update_fields}
+
+        if hasattr(self, '_code'):
+            if self._code is None:
+                self.code_blob = None
+            else:
+                self.code_blob = CodeBlob.objects.get_or_create_for_code(self._code)
+
+            del self._code
+
+            if update_fields is not None:
+                update_fields.add('code_blob')
+
+        if update_fields is not None:
+            kwargs['update_fields'] = update_fields
+
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        if hasattr(self, '_code'):
+            del self._code
+
+        super().refresh_from_db(*args, **kwargs)
+
     @property
     def verbose_status(self):
         return self.STATUS_CHOICE[self.status][1]
 
+    @property
+    def passed(self) -> bool:
+        return self.task.gradable and self.status == self.OK or \
+            not self.task.gradable and self.status == self.SUBMITTED_WITHOUT_GRADING
+
     def pass_or_fail_status(self):
-        if self.task.gradable and self.status == self.OK or \
-                not self.task.gradable and self.status == self.SUBMITTED_WITHOUT_GRADING:
+        if self.passed:
             return "Passed"
         return "Failed"
 
@@ -387,9 +473,36 @@ class Solution(UpdatedAtCreatedAtModelMixin, models.Model):
 
     class Meta:
         ordering = ['-id']
+        indexes = [
+            models.Index(fields=['task', 'user', '-id'], name='education_solution_tu_id_idx'),
+            models.Index(fields=['user', 'status'], name='education_solution_us_idx'),
+            models.Index(fields=['task', 'status'], name='education_solution_ts_idx'),
+        ]
 
 
 class SolutionComment(UpdatedAtCreatedAtModelMixin, models.Model):
     text = models.TextField()
     solution = models.ForeignKey(Solution, related_name='comments')
     user = models.ForeignKey(BaseUser, related_name='user_comments')
+
+
+class SolvedTask(models.Model):
+    """
+    When `user` first passed `task`, kept up to date as solutions are graded. Feeds `LeaderboardEntry`.
+    """
+    task = models.ForeignKey(IncludedTask, on_delete=models.CASCADE, related_name='solved_tasks')
+    user = models.ForeignKey(BaseUser, on_delete=models.CASCADE, related_name='solved_tasks')
+    solved_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = (('task', 'user'), )
+
+
+class LeaderboardEntry(models.Model):
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='leaderboard_entries')
+    user = models.ForeignKey(BaseUser, on_delete=models.CASCADE, related_name='leaderboard_entries')
+    solved_tasks_count = models.PositiveIntegerField()
+    last_solved_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = (('course', 'user'), )
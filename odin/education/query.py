@@ -10,6 +10,9 @@ class TaskQuerySet(models.QuerySet):
 
 class SolutionQuerySet(models.QuerySet):
 
+    def with_code(self):
+        return self.select_related('code_blob')
+
     def get_solutions_for(self, user, task):
         return self.filter(student=user, task=task)
 
@@ -1,14 +1,29 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
-from typing import Dict, BinaryIO
+from typing import Dict, BinaryIO, Iterable, Iterator, List, Optional
 
 import requests
-from django.db import transaction
-from django.db.models import Q, Sum, When, Case, IntegerField, F
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Q, Sum, When, Case, IntegerField, F, Count, OuterRef, Subquery
+from django.db.models.functions import Length
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 
+from odin.common.cache import bump_versions, get_versions
+from odin.common.exports import EXPORT_CHUNK_SIZE, iterate_in_chunks
 from odin.users.models import BaseUser
 
+from .blobs import decode_code
+from .cache import (
+    get_course_version_key,
+    get_course_solutions_version_key,
+    get_task_version_key,
+    get_profile_version_key,
+    get_certificate_cache_key,
+)
+from .leaderboards import invalidate_course_leaderboard
 from .models import (
     Course,
     CourseAssignment,
@@ -20,13 +35,18 @@ from .models import (
     Material,
     IncludedTask,
     Task,
+    TaskDescription,
     ProgrammingLanguage,
     Solution,
+    CodeBlob,
     Test,
     IncludedTest,
     StudentNote,
     Lecture,
     SolutionComment,
+    SolvedTask,
+    LeaderboardEntry,
+    Certificate,
 )
 
 
@@ -38,6 +58,63 @@ def add_teacher(course: Course, teacher: Teacher, hidden: bool=False) -> CourseA
     return CourseAssignment.objects.create(course=course, teacher=teacher, hidden=hidden)
 
 
+def add_teachers_to_courses(*, teacher_ids: Iterable[int], course_ids: Iterable[int], hidden: bool=False):
+    """
+    Adds every teacher to every course in one statement, skipping the assignments that already exist.
+    """
+    teacher_ids, course_ids = list(teacher_ids), list(course_ids)
+
+    if not teacher_ids or not course_ids:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO education_courseassignment (course_id, teacher_id, hidden)
+            SELECT course_id, teacher_id, %s
+              FROM unnest(%s::integer[]) course_id CROSS JOIN unnest(%s::integer[]) teacher_id
+                ON CONFLICT DO NOTHING
+            """,
+            [hidden, course_ids, teacher_ids]
+        )
+
+    # The raw insert skips the signals that invalidate the cached courses.
+    bump_versions(*[get_course_version_key(course_id=course_id) for course_id in course_ids])
+
+
+@transaction.atomic
+def enroll_students(*, course: Course, user_ids: Iterable[int]) -> List[int]:
+    """
+    Makes students of the users that are not students yet and adds all of them to `course`,
+    skipping the ones already in it. Takes the same few queries for any number of users.
+    Returns the ids of the newly enrolled users.
+    """
+    user_ids = sorted(set(user_ids))
+
+    if not user_ids:
+        return []
+
+    Student.objects.bulk_create_from_user_ids(user_ids)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO education_courseassignment (course_id, student_id, hidden)
+            SELECT %s, unnest(%s::integer[]), false
+                ON CONFLICT DO NOTHING
+         RETURNING student_id
+            """,
+            [course.id, user_ids]
+        )
+        enrolled = [user_id for user_id, in cursor.fetchall()]
+
+    if enrolled:
+        # The raw insert skips the signals that invalidate the cached course.
+        bump_versions(get_course_version_key(course_id=course.id))
+
+    return enrolled
+
+
 @transaction.atomic
 def create_course(
     *,
@@ -66,14 +143,107 @@ def create_course(
         video_channel=video_channel,
         slug_url=slug_url,
         logo=logo,
-        public=public
+        public=public,
+        attendable=attendable
+    )
+
+    Week.objects.bulk_create(build_course_weeks(course=course))
+    CourseDescription.objects.create(course=course, verbose=description)
+
+    return course
+
+
+@transaction.atomic
+def clone_course(
+    *,
+    course: Course,
+    name: str,
+    slug_url: str,
+    start_date: date
+) -> Course:
+    """
+    Creates a course of the same length starting on `start_date`,
+    with the materials, tasks and tests of `course` included in the matching weeks.
+    Included rows keep pointing to the same source materials, tasks and tests,
+    and are inserted with one `bulk_create` per table, however big `course` is.
+    """
+    description = CourseDescription.objects.filter(course=course).values_list('verbose', flat=True).first()
+
+    new_course = create_course(
+        name=name,
+        start_date=start_date,
+        end_date=start_date + (course.end_date - course.start_date),
+        repository=course.repository,
+        facebook_group=course.facebook_group,
+        video_channel=course.video_channel,
+        slug_url=slug_url,
+        logo=course.logo,
+        public=course.public,
+        attendable=course.attendable,
+        description=description or ""
     )
 
-    weeks = course.duration_in_weeks
-    start_date = course.start_date - timedelta(days=start_date.weekday())
+    week_numbers = dict(course.weeks.values_list('id', 'number'))
+    new_weeks = {week.number: week for week in new_course.weeks.all()}
+
+    def new_week(week_id):
+        return new_weeks.get(week_numbers.get(week_id))
+
+    IncludedMaterial.objects.bulk_create([
+        IncludedMaterial(
+            material_id=material.material_id,
+            week=new_week(material.week_id),
+            course=new_course,
+            identifier=material.identifier,
+            url=material.url,
+            content=material.content
+        )
+        for material in course.included_materials.order_by('id')
+    ])
+
+    tasks = list(course.included_tasks.order_by('id'))
+    new_tasks = IncludedTask.objects.bulk_create([
+        IncludedTask(
+            task_id=task.task_id,
+            week=new_week(task.week_id),
+            course=new_course,
+            name=task.name,
+            description=task.description,
+            description_url=task.description_url,
+            gradable=task.gradable
+        )
+        for task in tasks
+    ])
+    new_task_ids = {task.id: new_task.id for task, new_task in zip(tasks, new_tasks)}
+
+    IncludedTest.objects.bulk_create([
+        IncludedTest(
+            test_id=test.test_id,
+            task_id=new_task_ids[test.task_id],
+            language_id=test.language_id,
+            extra_options=test.extra_options,
+            code=test.code,
+            requirements=test.requirements,
+            file=test.file,
+            description=test.description
+        )
+        for test in IncludedTest.objects.filter(task__course=course).order_by('id')
+    ])
+
+    # `bulk_create` skips the signals that invalidate the cached course.
+    bump_versions(get_course_version_key(course_id=new_course.id))
+
+    return new_course
+
+
+def build_course_weeks(*, course: Course) -> List[Week]:
+    """
+    Unsaved weeks covering the course, starting from the Monday of its first week.
+    """
+    start_date = course.start_date - timedelta(days=course.start_date.weekday())
 
     week_instances = []
-    for i in range(1, weeks + 1):
+    for i in range(1, course.duration_in_weeks + 1):
         current = Week(
             course=course,
             number=i,
@@ -84,10 +254,7 @@ def create_course(
         start_date = current.end_date + timedelta(days=1)
         week_instances.append(current)
 
-    Week.objects.bulk_create(week_instances)
-    CourseDescription.objects.create(course=course, verbose=description)
-
-    return course
+    return week_instances
 
 
 def create_included_material(
@@ -124,18 +291,25 @@ def create_included_task(
     week: Week,
     name: str=None,
     description: str=None,
+    description_url: str=None,
     gradable: bool=False,
     existing_task: Task=None,
 )-> IncludedTask:
 
     included_task = IncludedTask(week=week, course=course)
     if existing_task is None:
-        existing_task = Task(name=name, description=description, gradable=gradable)
+        existing_task = Task(
+            name=name,
+            description=description,
+            description_url=description_url,
+            gradable=gradable
+        )
         existing_task.full_clean()
         existing_task.save()
 
     included_task.name = existing_task.name
     included_task.description = existing_task.description
+    included_task.description_url = existing_task.description_url
     included_task.gradable = existing_task.gradable
 
     included_task.task = existing_task
@@ -244,6 +418,144 @@ def calculate_student_valid_solutions_for_course(
     return f'{ratio:.1f}'
 
 
+CERTIFICATE_MIN_COMPLETION = 0.5
+CERTIFICATE_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def _get_certificate_data(*, course_name: str, start_date: date, end_date: date, full_name: str) -> Dict:
+    return {
+        'course': course_name,
+        'start_date': start_date,
+        'end_date': end_date,
+        'student': full_name,
+    }
+
+
+def _get_certificate_versions(*, course_id: int, student_id: int) -> List[str]:
+    # The course stamp moves when the course is renamed, the profile stamp with the name of the student.
+    return get_versions(
+        get_course_version_key(course_id=course_id),
+        get_profile_version_key(user_id=student_id),
+    )
+
+
+def _get_cached_certificate(*, course_id: int, student_id: int, versions: List[str], data: Dict) -> Dict:
+    return {'course_id': course_id, 'student_id': student_id, 'versions': versions, 'data': data}
+
+
+@transaction.atomic
+def issue_certificates(*, course: Course, min_completion: float=CERTIFICATE_MIN_COMPLETION) -> List[Certificate]:
+    """
+    Issues a certificate to every student of `course` without one that passed at least `min_completion` of its tasks.
+    The passed tasks come from the leaderboard, so it takes the same few queries for any number of students.
+    """
+    if not course.can_generate_certificates:
+        raise ValidationError(f'Certificates for {course} can no longer be generated')
+
+    tasks_count = course.included_tasks.count()
+    if not tasks_count:
+        return []
+
+    solved_tasks_count = LeaderboardEntry.objects.filter(
+        course=course,
+        user_id=OuterRef('student_id')
+    ).values('solved_tasks_count')
+    assignments = CourseAssignment.objects.filter(
+        course=course,
+        student__isnull=False,
+        certificate__isnull=True
+    ).annotate(
+        solved_tasks_count=Subquery(solved_tasks_count, output_field=IntegerField())
+    ).values_list('id', 'student_id', 'student__profile__full_name', 'solved_tasks_count')
+
+    students = {
+        assignment_id: (student_id, full_name)
+        for assignment_id, student_id, full_name, solved in assignments
+        if (solved or 0) / tasks_count >= min_completion
+    }
+
+    certificates = Certificate.objects.bulk_create([
+        Certificate(assignment_id=assignment_id, token=str(uuid.uuid4()))
+        for assignment_id in students
+    ])
+
+    if not certificates:
+        return certificates
+
+    # Answers the first verifications from the cache as well.
+    student_ids = [student_id for student_id, _ in students.values()]
+    course_version, *profile_versions = get_versions(
+        get_course_version_key(course_id=course.id),
+        *[get_profile_version_key(user_id=student_id) for student_id in student_ids]
+    )
+    profile_versions = dict(zip(student_ids, profile_versions))
+
+    cached = {}
+    for certificate in certificates:
+        student_id, full_name = students[certificate.assignment_id]
+        cached[get_certificate_cache_key(token=certificate.token)] = _get_cached_certificate(
+            course_id=course.id,
+            student_id=student_id,
+            versions=[course_version, profile_versions[student_id]],
+            data=_get_certificate_data(
+                course_name=course.name,
+                start_date=course.start_date,
+                end_date=course.end_date,
+                full_name=full_name
+            )
+        )
+    transaction.on_commit(lambda: cache.set_many(cached, CERTIFICATE_CACHE_TIMEOUT))
+
+    return certificates
+
+
+def verify_certificate(*, token: str) -> Optional[Dict]:
+    """
+    The course and the student of the certificate with `token`, or `None` if there is no such certificate.
+    Known certificates are cached until the course or the profile of the student changes.
+    Unknown tokens are not, so they cannot fill the cache.
+    """
+    key = get_certificate_cache_key(token=token)
+    cached = cache.get(key)
+
+    if cached is not None:
+        versions = _get_certificate_versions(course_id=cached['course_id'], student_id=cached['student_id'])
+
+        if versions == cached['versions']:
+            return cached['data']
+
+    certificate = Certificate.objects.filter(token=token).values(
+        'assignment__course_id',
+        'assignment__course__name',
+        'assignment__course__start_date',
+        'assignment__course__end_date',
+        'assignment__student_id',
+        'assignment__student__profile__full_name',
+    ).first()
+
+    if certificate is None:
+        return None
+
+    data = _get_certificate_data(
+        course_name=certificate['assignment__course__name'],
+        start_date=certificate['assignment__course__start_date'],
+        end_date=certificate['assignment__course__end_date'],
+        full_name=certificate['assignment__student__profile__full_name']
+    )
+    # Read after the query, the stamps bumped again on commit still catch a change made meanwhile.
+    cache.set(key, _get_cached_certificate(
+        course_id=certificate['assignment__course_id'],
+        student_id=certificate['assignment__student_id'],
+        versions=_get_certificate_versions(
+            course_id=certificate['assignment__course_id'],
+            student_id=certificate['assignment__student_id']
+        ),
+        data=data
+    ), CERTIFICATE_CACHE_TIMEOUT)
+
+    return data
+
+
 def get_all_student_solution_statistics(
     *,
     task: IncludedTask
@@ -264,6 +576,249 @@ def get_all_student_solution_statistics(
     return result
 
 
+COURSE_TASK_STATISTICS_CACHE_KEY = 'education:course:{course_id}:task-statistics:{versions}'
+COURSE_TASK_STATISTICS_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def get_course_task_statistics_versions(*, course_id: int) -> List[str]:
+    # The course stamp moves with the tasks and the enrollments, the solutions stamp with every solution.
+    return get_versions(
+        get_course_version_key(course_id=course_id),
+        get_course_solutions_version_key(course_id=course_id),
+    )
+
+
+def count_course_task_statistics(*, course_id: int) -> List[Dict]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            WITH students AS (
+                SELECT student_id
+                  FROM education_courseassignment
+                 WHERE course_id = %(course_id)s AND student_id IS NOT NULL
+            )
+            SELECT task.id, task.name, week.number, task.gradable,
+                   (SELECT count(*) FROM students),
+                   count(DISTINCT solution.user_id),
+                   count(DISTINCT solution.user_id) FILTER (
+                       WHERE (task.gradable AND solution.status = %(ok)s)
+                          OR (NOT task.gradable AND solution.status = %(submitted)s)
+                   )
+              FROM education_includedtask task
+              LEFT JOIN education_week week ON week.id = task.week_id
+              LEFT JOIN education_solution solution
+                ON solution.task_id = task.id AND solution.user_id IN (SELECT student_id FROM students)
+             WHERE task.course_id = %(course_id)s
+             GROUP BY task.id, week.number
+             ORDER BY week.number, task.id
+            """,
+            {'course_id': course_id, 'ok': Solution.OK, 'submitted': Solution.SUBMITTED_WITHOUT_GRADING}
+        )
+
+        return [
+            {
+                'id': task_id,
+                'name': name,
+                'week': week,
+                'gradable': gradable,
+                'total_student_count': total,
+                'students_with_a_submitted_solution_count': submitted,
+                'students_with_a_passing_solution_count': passed,
+            }
+            for task_id, name, week, gradable, total, submitted, passed in cursor.fetchall()
+        ]
+
+
+def get_course_task_statistics(*, course: Course) -> List[Dict]:
+    """
+    `get_all_student_solution_statistics` for every task of `course`, ordered by week, in a single query.
+    Cached until the tasks, the students or the solutions of the course change.
+    """
+    versions = get_course_task_statistics_versions(course_id=course.id)
+    key = COURSE_TASK_STATISTICS_CACHE_KEY.format(course_id=course.id, versions=':'.join(versions))
+
+    statistics = cache.get(key)
+
+    if statistics is None:
+        statistics = count_course_task_statistics(course_id=course.id)
+        cache.add(key, statistics, COURSE_TASK_STATISTICS_CACHE_TIMEOUT)
+
+    return statistics
+
+
+def record_solved_task(*, solution: Solution) -> bool:
+    """
+    Counts `solution` on the leaderboard of its course if it is the first one of its user to pass its task.
+    Takes a single query, returns whether the leaderboard changed.
+    """
+    if not solution.passed:
+        return False
+
+    course_id = solution.task.course_id
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            WITH solved AS (
+                INSERT INTO education_solvedtask (task_id, user_id, solved_at)
+                VALUES (%(task_id)s, %(user_id)s, %(solved_at)s)
+                    ON CONFLICT DO NOTHING
+             RETURNING solved_at
+            )
+            INSERT INTO education_leaderboardentry (course_id, user_id, solved_tasks_count, last_solved_at)
+            SELECT %(course_id)s, %(user_id)s, 1, solved_at FROM solved
+                ON CONFLICT (course_id, user_id) DO UPDATE
+               SET solved_tasks_count = education_leaderboardentry.solved_tasks_count + 1,
+                   last_solved_at = greatest(education_leaderboardentry.last_solved_at, excluded.last_solved_at)
+            """,
+            {
+                'task_id': solution.task_id,
+                'user_id': solution.user_id,
+                'solved_at': solution.created_at,
+                'course_id': course_id,
+            }
+        )
+        changed = cursor.rowcount > 0
+
+    if changed:
+        invalidate_course_leaderboard(course_id=course_id)
+
+    return changed
+
+
+def recount_solved_task(*, course_id: int, task_id: int, user_ids: List[int]) -> bool:
+    """
+    Brings the solved task and the leaderboard entries of `user_ids` up to date
+    after their solutions of the task went away or stopped passing, or the task itself was removed.
+    The task stays solved from the earliest passing solution that is left, if any.
+    The entries that drop to no solved tasks are deleted. Takes a single query, returns whether anything changed.
+    """
+    user_ids = list(user_ids)
+
+    if not user_ids:
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            WITH passing AS (
+                SELECT solution.user_id, min(solution.created_at) AS solved_at
+                  FROM education_solution solution
+                  JOIN education_includedtask task ON task.id = solution.task_id
+                 WHERE solution.task_id = %(task_id)s
+                   AND solution.user_id = ANY(%(user_ids)s)
+                   AND ((task.gradable AND solution.status = %(ok)s)
+                        OR (NOT task.gradable AND solution.status = %(submitted)s))
+                 GROUP BY solution.user_id
+            ), unsolved AS (
+                DELETE FROM education_solvedtask solved
+                 WHERE solved.task_id = %(task_id)s
+                   AND solved.user_id = ANY(%(user_ids)s)
+                   AND solved.user_id NOT IN (SELECT user_id FROM passing)
+             RETURNING solved.user_id
+            ), resolved AS (
+                INSERT INTO education_solvedtask (task_id, user_id, solved_at)
+                SELECT %(task_id)s, user_id, solved_at FROM passing
+                    ON CONFLICT (task_id, user_id) DO UPDATE
+                   SET solved_at = excluded.solved_at
+                 WHERE education_solvedtask.solved_at <> excluded.solved_at
+             RETURNING user_id
+            ), entries AS (
+                -- Every statement sees the solved tasks from before it, so the task is counted from `passing`.
+                SELECT solved.user_id, count(*) AS solved_tasks_count, max(solved.solved_at) AS last_solved_at
+                  FROM (
+                        SELECT solved.user_id, solved.solved_at
+                          FROM education_solvedtask solved
+                          JOIN education_includedtask task ON task.id = solved.task_id
+                         WHERE task.course_id = %(course_id)s
+                           AND solved.task_id <> %(task_id)s
+                           AND solved.user_id = ANY(%(user_ids)s)
+                     UNION ALL
+                        SELECT user_id, solved_at FROM passing
+                       ) solved
+                 GROUP BY solved.user_id
+            ), counted AS (
+                INSERT INTO education_leaderboardentry (course_id, user_id, solved_tasks_count, last_solved_at)
+                SELECT %(course_id)s, user_id, solved_tasks_count, last_solved_at FROM entries
+                    ON CONFLICT (course_id, user_id) DO UPDATE
+                   SET solved_tasks_count = excluded.solved_tasks_count,
+                       last_solved_at = excluded.last_solved_at
+                 WHERE (education_leaderboardentry.solved_tasks_count, education_leaderboardentry.last_solved_at)
+                       IS DISTINCT FROM (excluded.solved_tasks_count, excluded.last_solved_at)
+             RETURNING user_id
+            ), emptied AS (
+                DELETE FROM education_leaderboardentry entry
+                 WHERE entry.course_id = %(course_id)s
+                   AND entry.user_id = ANY(%(user_ids)s)
+                   AND entry.user_id NOT IN (SELECT user_id FROM entries)
+             RETURNING entry.user_id
+            )
+            SELECT (SELECT count(*) FROM unsolved) + (SELECT count(*) FROM resolved)
+                 + (SELECT count(*) FROM counted) + (SELECT count(*) FROM emptied)
+            """,
+            {
+                'course_id': course_id,
+                'task_id': task_id,
+                'user_ids': user_ids,
+                'ok': Solution.OK,
+                'submitted': Solution.SUBMITTED_WITHOUT_GRADING,
+            }
+        )
+        changed, = cursor.fetchone()
+
+    if changed:
+        invalidate_course_leaderboard(course_id=course_id)
+
+    return changed > 0
+
+
+@transaction.atomic
+def rebuild_leaderboard(*, course: Course) -> int:
+    """
+    Recounts the leaderboard of `course` from its solutions.
+    Returns how many entries were out of date, which is 0 unless some change skipped the solution and task signals.
+    """
+    current = {
+        entry['user_id']: (entry['solved_tasks_count'], entry['last_solved_at'])
+        for entry in course.leaderboard_entries.values('user_id', 'solved_tasks_count', 'last_solved_at')
+    }
+
+    SolvedTask.objects.filter(task__course=course).delete()
+    LeaderboardEntry.objects.filter(course=course).delete()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO education_solvedtask (task_id, user_id, solved_at)
+            SELECT solution.task_id, solution.user_id, min(solution.created_at)
+              FROM education_solution solution
+              JOIN education_includedtask task ON task.id = solution.task_id
+             WHERE task.course_id = %(course_id)s
+               AND ((task.gradable AND solution.status = %(ok)s)
+                    OR (NOT task.gradable AND solution.status = %(submitted)s))
+             GROUP BY solution.task_id, solution.user_id
+            """,
+            {'course_id': course.id, 'ok': Solution.OK, 'submitted': Solution.SUBMITTED_WITHOUT_GRADING}
+        )
+        cursor.execute(
+            """
+            INSERT INTO education_leaderboardentry (course_id, user_id, solved_tasks_count, last_solved_at)
+            SELECT %(course_id)s, solved.user_id, count(*), max(solved.solved_at)
+              FROM education_solvedtask solved
+              JOIN education_includedtask task ON task.id = solved.task_id
+             WHERE task.course_id = %(course_id)s
+             GROUP BY solved.user_id
+            RETURNING user_id, solved_tasks_count, last_solved_at
+            """,
+            {'course_id': course.id}
+        )
+        rebuilt = {user_id: (count, last_solved_at) for user_id, count, last_solved_at in cursor.fetchall()}
+
+    invalidate_course_leaderboard(course_id=course.id)
+
+    return sum(current.get(user_id) != rebuilt.get(user_id) for user_id in current.keys() | rebuilt.keys())
+
+
 def create_student_note(
     *,
     author: Teacher,
@@ -300,6 +855,87 @@ def create_lecture(
         raise ValidationError('Date not in range of any week for this course')
 
 
+def get_course_attendance(*, course: Course) -> Dict:
+    """
+    The presence of every student in `course` at each of its lectures, in three queries.
+    `attendance` holds a bitset per student id, where bit `i` is set if the student was present at `lectures[i]`.
+    """
+    lectures = list(course.lectures.order_by('date', 'id').values('id', 'date', 'week__number'))
+    students = list(course.students.order_by('id').values('id', 'email', 'profile__full_name'))
+    attendance = {student['id']: 0 for student in students}
+
+    if not lectures:
+        return {'lectures': lectures, 'students': students, 'attendance': attendance}
+
+    # The bitsets are built by the database, so a row per student comes back instead of one per presence.
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT presence.student_id, bit_or(B'1'::bit({len(lectures)}) >> (lecture.position::integer - 1))
+              FROM education_lecture_present_students presence
+              JOIN unnest(%s::integer[]) WITH ORDINALITY lecture(id, position) ON lecture.id = presence.lecture_id
+             WHERE presence.student_id = ANY(%s)
+             GROUP BY presence.student_id
+            """,
+            [[lecture['id'] for lecture in lectures], list(attendance)]
+        )
+
+        for student_id, bits in cursor.fetchall():
+            attendance[student_id] = int(bits[::-1], 2)
+
+    return {'lectures': lectures, 'students': students, 'attendance': attendance}
+
+
+@transaction.atomic
+def mark_attendance(*, course: Course, attendance: Dict[int, Iterable[int]], replace: bool=True) -> Dict[str, int]:
+    """
+    Marks the students present at each lecture of `attendance`, which maps lecture ids to student ids.
+    With `replace`, students missing from a lecture's list are marked absent, so the list is synced as a whole.
+    Takes the same four queries for any number of lectures and students.
+    """
+    if not attendance:
+        return {'added': 0, 'removed': 0}
+
+    attendance = {lecture_id: set(student_ids) for lecture_id, student_ids in attendance.items()}
+    student_ids = set().union(*attendance.values())
+
+    unknown_lectures = set(attendance) - set(course.lectures.filter(id__in=attendance).values_list('id', flat=True))
+    if unknown_lectures:
+        raise ValidationError(f'Lectures {sorted(unknown_lectures)} are not in {course}')
+
+    unknown_students = student_ids - set(course.students.filter(id__in=student_ids).values_list('id', flat=True))
+    if unknown_students:
+        raise ValidationError(f'Students {sorted(unknown_students)} are not in {course}')
+
+    pairs = [(lecture_id, student_id) for lecture_id, student_ids in attendance.items() for student_id in student_ids]
+    pair_lectures, pair_students = [lecture_id for lecture_id, _ in pairs], [student_id for _, student_id in pairs]
+    removed = 0
+
+    with connection.cursor() as cursor:
+        if replace:
+            cursor.execute(
+                """
+                DELETE FROM education_lecture_present_students
+                 WHERE lecture_id = ANY(%s)
+                   AND (lecture_id, student_id) NOT IN (SELECT * FROM unnest(%s::integer[], %s::integer[]))
+                """,
+                [list(attendance), pair_lectures, pair_students]
+            )
+            removed = cursor.rowcount
+
+        cursor.execute(
+            """
+            INSERT INTO education_lecture_present_students (lecture_id, student_id)
+            SELECT * FROM unnest(%s::integer[], %s::integer[])
+                ON CONFLICT DO NOTHING
+            """,
+            [pair_lectures, pair_students]
+        )
+        added = cursor.rowcount
+
+    return {'added': added, 'removed': removed}
+
+
 def add_week_to_course(
     *,
     course: Course,
@@ -339,32 +975,109 @@ def create_solution_comment(
     return comment
 
 
+def get_courses_for_user(*, user: BaseUser):
+    """
+    Courses where `user` is a student or a teacher,
+    annotated with the number of active students and joined with their descriptions.
+    """
+    course_ids = CourseAssignment.objects.filter(
+        Q(student_id=user.id) | Q(teacher_id=user.id)
+    ).values('course_id')
+
+    return Course.objects.filter(
+        id__in=course_ids
+    ).select_related(
+        'description'
+    ).annotate(
+        students_count=Sum(
+            Case(
+                When(course_assignments__student__is_active=True, then=1),
+                default=0,
+                output_field=IntegerField()
+            )
+        )
+    )
+
+
 def get_gradable_tasks_for_course(
     *,
     course: Course,
-    user: BaseUser
+    user: BaseUser,
+    defer_task_fields: Iterable[str]=(),
+    defer_solution_fields: Iterable[str]=(),
+    include_solution_code: bool=True
 ):
+    """
+    Returns the gradable tasks of the course, each with the `last_solution` of `user` for it.
+    """
+
+    tasks = list(
+        course.included_tasks.filter(gradable=True)
+                             .select_related('week')
+                             .defer(*defer_task_fields)
+                             .order_by('week__number', 'task__id')
+    )
 
-    tasks = []
+    last_solutions = get_last_solutions_for_tasks(
+        tasks=tasks,
+        user=user,
+        defer_fields=defer_solution_fields,
+        include_code=include_solution_code
+    )
 
-    for task in course.included_tasks.order_by('week__number', 'task__id'):
-        if task.gradable:
-            task.last_solution = get_last_solution_for_task(
-                task=task,
-                user=user
-            )
-            tasks.append(task)
+    for task in tasks:
+        task.last_solution = last_solutions.get(task.id)
 
     return tasks
 
 
+def get_last_solutions_for_tasks(
+    *,
+    tasks: Iterable[IncludedTask],
+    user: BaseUser,
+    defer_fields: Iterable[str]=(),
+    include_code: bool=True
+) -> Dict[int, Solution]:
+
+    solutions = Solution.objects.filter(
+        task_id__in=[task.id for task in tasks],
+        user=user
+    ).defer(
+        *defer_fields
+    ).order_by(
+        'task_id', '-id'
+    ).distinct(
+        'task_id'
+    )
+
+    if include_code:
+        solutions = solutions.with_code()
+
+    return {solution.task_id: solution for solution in solutions}
+
+
 def get_last_solution_for_task(
     *,
     task: IncludedTask,
-    user: BaseUser
+    user: BaseUser,
+    defer_fields: Iterable[str]=(),
+    include_code: bool=True
 ) -> Solution:
 
-    return Solution.objects.filter(task=task, user=user).order_by('-id').first()
+    solutions = Solution.objects.filter(task=task, user=user).defer(*defer_fields)
+
+    if include_code:
+        solutions = solutions.with_code()
+
+    return solutions.order_by('-id').first()
+
+
+def get_task_description_url(url: str) -> str:
+    if not url.endswith('README.md'):
+        url = url.replace('tree', 'blob')
+        url = f'{url}/README.md'
+
+    return f'{url}?raw=1'
 
 
 def create_included_task_with_test(
@@ -379,67 +1092,393 @@ def create_included_task_with_test(
     description_url: str
 ):
 
-    if not description_url.endswith('README.md'):
-        description_url = description_url.replace('tree', 'blob')
-        description_url = f'{description_url}/README.md'
-
-    description_url = f'{description_url}?raw=1'
-
-    markdown = requests.get(description_url, timeout=2).text
+    description_url = get_task_description_url(description_url)
+    cached = TaskDescription.objects.filter(url=description_url).values_list('markdown', flat=True).first()
 
     included_task = create_included_task(
         course=course,
         week=week,
         name=name,
-        description=markdown,
+        description=cached,
+        description_url=description_url,
         gradable=gradable
     )
-    included_task.save()
 
     if included_task.gradable:
-
-        included_test = create_test_for_task(
+        create_test_for_task(
             task=included_task,
             code=code,
             language=language,
             requirements=requirements
         )
 
-        included_test.save()
+    schedule_task_description_fetch(url=description_url)
 
     return included_task
 
 
+def schedule_task_description_fetch(*, url: str):
+    from odin.education.tasks import fetch_description
+
+    transaction.on_commit(lambda: fetch_description.delay(url))
+
+
+TASK_DESCRIPTION_FETCH_TIMEOUT = 10
+TASK_DESCRIPTION_FETCH_WORKERS = 16
+
+
+def _request_task_description(*, url: str, cached: TaskDescription=None) -> requests.Response:
+    headers = {}
+    if cached is not None and cached.etag:
+        headers['If-None-Match'] = cached.etag
+
+    return requests.get(url, headers=headers, timeout=TASK_DESCRIPTION_FETCH_TIMEOUT)
+
+
+def _store_task_description(*, url: str, response: requests.Response, cached: TaskDescription=None) -> TaskDescription:
+    if response.status_code == requests.codes.not_modified:
+        return cached
+
+    response.raise_for_status()
+
+    description, _ = TaskDescription.objects.update_or_create(
+        url=url,
+        defaults={'etag': response.headers.get('ETag', ''), 'markdown': response.text}
+    )
+
+    return description
+
+
+def fetch_task_description(*, url: str) -> TaskDescription:
+    """
+    Fetches the markdown at `url`, revalidating the cached copy with its ETag,
+    and fills it in every task described by `url`.
+    Must not run inside a transaction, so no connection waits on the request.
+    """
+    cached = TaskDescription.objects.filter(url=url).first()
+    response = _request_task_description(url=url, cached=cached)
+
+    with transaction.atomic():
+        description = _store_task_description(url=url, response=response, cached=cached)
+        update_task_descriptions(description=description)
+
+    return description
+
+
+def _store_task_descriptions(
+    *,
+    responses: Dict[str, requests.Response],
+    cached: Dict[str, TaskDescription]
+) -> Dict[str, str]:
+    """
+    Stores the fetched descriptions, inserting the new ones at once, and returns the markdown of every url.
+    """
+    markdown = {}
+    new = []
+
+    for url, response in responses.items():
+        if response.status_code == requests.codes.not_modified:
+            markdown[url] = cached[url].markdown
+            continue
+
+        markdown[url] = response.text
+        etag = response.headers.get('ETag', '')
+
+        if url in cached:
+            TaskDescription.objects.filter(id=cached[url].id).update(
+                etag=etag,
+                markdown=response.text,
+                updated_at=timezone.now()
+            )
+        else:
+            new.append(TaskDescription(url=url, etag=etag, markdown=response.text))
+
+    TaskDescription.objects.bulk_create(new)
+
+    return markdown
+
+
+def _request_task_descriptions(
+    *,
+    urls: List[str],
+    cached: Dict[str, TaskDescription]
+) -> Dict[str, requests.Response]:
+    """
+    Requests every url in parallel. Urls that could not be fetched are left out.
+    """
+    def request(url):
+        try:
+            response = _request_task_description(url=url, cached=cached.get(url))
+        except requests.RequestException:
+            return None
+
+        if response.ok or response.status_code == requests.codes.not_modified:
+            return response
+
+    with ThreadPoolExecutor(max_workers=TASK_DESCRIPTION_FETCH_WORKERS) as executor:
+        responses = dict(zip(urls, executor.map(request, urls)))
+
+    return {url: response for url, response in responses.items() if response is not None}
+
+
+def update_task_descriptions(*, description: TaskDescription):
+    Task.objects.filter(
+        description_url=description.url
+    ).exclude(
+        description=description.markdown
+    ).update(description=description.markdown)
+
+    included_tasks = list(
+        IncludedTask.objects.filter(
+            description_url=description.url
+        ).exclude(
+            description=description.markdown
+        ).values_list('id', 'course_id')
+    )
+
+    if not included_tasks:
+        return
+
+    IncludedTask.objects.filter(id__in=[task_id for task_id, _ in included_tasks]).update(
+        description=description.markdown
+    )
+
+    # `update` skips the signals that invalidate the cached tasks and courses.
+    bump_versions(*{
+        key
+        for task_id, course_id in included_tasks
+        for key in (get_task_version_key(task_id=task_id), get_course_version_key(course_id=course_id))
+    })
+
+
+def refresh_task_descriptions(*, course: Course=None) -> int:
+    """
+    Schedules a fetch of every distinct task description url, or only of those used in `course`.
+    """
+    tasks = IncludedTask.objects.filter(description_url__isnull=False)
+
+    if course is not None:
+        tasks = tasks.filter(course=course)
+
+    urls = tasks.order_by().values_list('description_url', flat=True).distinct()
+
+    for url in urls:
+        schedule_task_description_fetch(url=url)
+
+    return len(urls)
+
+
+def import_curriculum(*, course: Course, manifest: Dict) -> Dict[str, int]:
+    """
+    Adds the materials, tasks and tests of a whole curriculum to the existing weeks of `course`:
+
+        {"weeks": [{"number": 1,
+                    "materials": [{"identifier": ..., "url": ..., "content": ...}],
+                    "tasks": [{"name": ..., "description_url": ..., "gradable": true,
+                               "language": "Python", "code": ..., "requirements": ...}]}]}
+
+    Descriptions are fetched in parallel before the transaction starts and everything is inserted with `bulk_create`.
+    Descriptions that could not be fetched are fetched again in the background.
+    """
+    weeks = {week.number: week for week in course.weeks.all()}
+    manifest_weeks = manifest.get('weeks', [])
+
+    for manifest_week in manifest_weeks:
+        if manifest_week.get('number') not in weeks:
+            raise ValidationError(f'Week {manifest_week.get("number")} does not exist in {course}')
+
+    material_entries = [
+        (weeks[manifest_week['number']], entry)
+        for manifest_week in manifest_weeks
+        for entry in manifest_week.get('materials', [])
+    ]
+    task_entries = [
+        (weeks[manifest_week['number']], entry)
+        for manifest_week in manifest_weeks
+        for entry in manifest_week.get('tasks', [])
+    ]
+
+    for _, entry in task_entries:
+        if entry.get('gradable', False) and not (entry.get('language') and entry.get('code')):
+            raise ValidationError(f'Gradable task {entry.get("name")} needs a language and code for its test')
+
+    language_names = {entry['language'] for _, entry in task_entries if entry.get('gradable', False)}
+    languages = {language.name: language for language in ProgrammingLanguage.objects.filter(name__in=language_names)}
+    missing_languages = language_names - set(languages)
+
+    if missing_languages:
+        raise ValidationError(f'Unknown programming languages: {", ".join(sorted(missing_languages))}')
+
+    description_urls = [
+        get_task_description_url(entry['description_url']) if entry.get('description_url') else None
+        for _, entry in task_entries
+    ]
+    urls = list({url for url in description_urls if url is not None})
+    cached = {description.url: description for description in TaskDescription.objects.filter(url__in=urls)}
+    responses = _request_task_descriptions(urls=urls, cached=cached)
+
+    with transaction.atomic():
+        descriptions = _store_task_descriptions(responses=responses, cached=cached)
+
+        materials = [
+            Material(identifier=entry.get('identifier'), url=entry.get('url'), content=entry.get('content', ''))
+            for _, entry in material_entries
+        ]
+        for material in materials:
+            material.full_clean()
+
+        materials = Material.objects.bulk_create(materials)
+        IncludedMaterial.objects.bulk_create([
+            IncludedMaterial(
+                material=material,
+                week=week,
+                course=course,
+                identifier=material.identifier,
+                url=material.url,
+                content=material.content
+            )
+            for (week, _), material in zip(material_entries, materials)
+        ])
+
+        tasks = [
+            Task(
+                name=entry.get('name'),
+                description=descriptions.get(description_url, entry.get('description')),
+                description_url=description_url,
+                gradable=entry.get('gradable', False)
+            )
+            for (_, entry), description_url in zip(task_entries, description_urls)
+        ]
+        for task in tasks:
+            task.full_clean()
+
+        tasks = Task.objects.bulk_create(tasks)
+        included_tasks = IncludedTask.objects.bulk_create([
+            IncludedTask(
+                task=task,
+                week=week,
+                course=course,
+                name=task.name,
+                description=task.description,
+                description_url=task.description_url,
+                gradable=task.gradable
+            )
+            for (week, _), task in zip(task_entries, tasks)
+        ])
+
+        gradable = [
+            (included_task, entry)
+            for (_, entry), included_task in zip(task_entries, included_tasks)
+            if included_task.gradable
+        ]
+        tests = [
+            Test(language=languages[entry['language']], code=entry['code'], requirements=entry.get('requirements'))
+            for _, entry in gradable
+        ]
+        for test in tests:
+            test.full_clean(exclude=['language'])
+
+        tests = Test.objects.bulk_create(tests)
+        IncludedTest.objects.bulk_create([
+            IncludedTest(
+                test=test,
+                task=included_task,
+                language=test.language,
+                extra_options=test.extra_options,
+                code=test.code,
+                requirements=test.requirements
+            )
+            for (included_task, _), test in zip(gradable, tests)
+        ])
+
+        for url in set(urls) - set(descriptions):
+            schedule_task_description_fetch(url=url)
+
+        # `bulk_create` skips the signals that invalidate the cached course.
+        bump_versions(get_course_version_key(course_id=course.id))
+
+    return {'materials': len(materials), 'tasks': len(included_tasks), 'tests': len(tests)}
+
+
 def get_user_solution_summary(
-    user: BaseUser
+    user: BaseUser,
+    include_code: bool=True,
+    include_test_result: bool=True
 ):
+    return get_user_solution_summaries(
+        users=[user],
+        include_code=include_code,
+        include_test_result=include_test_result
+    )[user.id]
+
 
-    results = Solution.objects.aggregate(
+def get_user_solution_summaries(
+    *,
+    users: Iterable[BaseUser],
+    include_code: bool=True,
+    include_test_result: bool=True
+) -> Dict[int, Dict]:
+    """
+    Solution summaries for many users in two queries, keyed by user id.
+    """
+    user_ids = [user.id for user in users]
+
+    summaries = {
+        user_id: {'OK': None, 'TOTAL': None, 'completed_tasks': []}
+        for user_id in user_ids
+    }
+
+    totals = Solution.objects.filter(
+        user_id__in=user_ids
+    ).order_by().values('user_id').annotate(
         OK=Sum(
             Case(
-                When(Q(status__in=['2']) & Q(user=user), then=1),
+                When(status__in=['2'], then=1),
                 output_field=IntegerField()
             )
         ),
         TOTAL=Sum(
             Case(
-                When(Q(status__range=(0, 6)) & Q(user=user), then=1),
+                When(status__range=(0, 6), then=1),
                 output_field=IntegerField()
             )
         )
     )
 
-    completed_tasks = user.solutions.filter(status=2).annotate(
-        name=F('task__name'),
-        task_id=F('task'),
-        solution_id=F('id'),
-        solution_code=F('code'),
-        test_result=F('test_output')
-    ).values('name', 'task_id', 'solution_code', 'test_result', 'solution_id')
+    for total in totals:
+        summaries[total['user_id']].update(OK=total['OK'], TOTAL=total['TOTAL'])
 
-    results['completed_tasks'] = completed_tasks
+    fields = ['user_id', 'name', 'task_id', 'solution_id']
+    annotations = {
+        'name': F('task__name'),
+        'task_id': F('task'),
+        'solution_id': F('id'),
+    }
 
-    return results
+    if include_code:
+        fields.extend(['code_blob__data', 'code_blob__compressed'])
+
+    if include_test_result:
+        fields.append('test_result')
+        annotations['test_result'] = F('test_output')
+
+    completed_tasks = Solution.objects.filter(
+        user_id__in=user_ids,
+        status=2
+    ).annotate(**annotations).values(*fields)
+
+    for completed_task in completed_tasks:
+        user_id = completed_task.pop('user_id')
+
+        if include_code:
+            data = completed_task.pop('code_blob__data')
+            compressed = completed_task.pop('code_blob__compressed')
+
+            completed_task['solution_code'] = data and decode_code(data, compressed=compressed)
+
+        summaries[user_id]['completed_tasks'].append(completed_task)
+
+    return summaries
 
 
 def get_user_avatar_url(
@@ -450,3 +1489,106 @@ def get_user_avatar_url(
         return None
 
     return str(user.profile.full_image.url)
+
+
+COURSE_SOLUTIONS_EXPORT_FIELDS = (
+    'solution_id',
+    'task_id',
+    'task_name',
+    'week_number',
+    'gradable',
+    'user_id',
+    'email',
+    'full_name',
+    'status',
+    'grade',
+    'return_code',
+    'created_at',
+    'test_output',
+    'code',
+)
+
+# Solutions that are still waiting for the grader, gradable ones start as SUBMITTED_WITHOUT_GRADING.
+UNGRADED_SOLUTION_STATUSES = (Solution.PENDING, Solution.RUNNING, Solution.SUBMITTED)
+
+
+def get_solution_grade(*, status: int, gradable: bool) -> str:
+    """
+    'Passed' or 'Failed', or an empty string while the solution is not graded yet.
+    """
+    if status in UNGRADED_SOLUTION_STATUSES or gradable and status == Solution.SUBMITTED_WITHOUT_GRADING:
+        return ''
+
+    passed_status = Solution.OK if gradable else Solution.SUBMITTED_WITHOUT_GRADING
+
+    return 'Passed' if status == passed_status else 'Failed'
+
+
+def get_course_solutions_export_rows(
+    *,
+    course: Course,
+    chunk_size: int=EXPORT_CHUNK_SIZE
+) -> Iterator[Dict]:
+    solutions = Solution.objects.filter(
+        task__course=course
+    ).values(
+        'id',
+        'task_id',
+        'task__name',
+        'task__week__number',
+        'task__gradable',
+        'user_id',
+        'user__email',
+        'user__profile__full_name',
+        'status',
+        'return_code',
+        'created_at',
+        'test_output',
+        'code_blob__data',
+        'code_blob__compressed',
+    )
+
+    statuses = dict(Solution.STATUS_CHOICE)
+
+    for solution in iterate_in_chunks(solutions, chunk_size=chunk_size):
+        code = None
+        if solution['code_blob__data'] is not None:
+            code = decode_code(solution['code_blob__data'], compressed=solution['code_blob__compressed'])
+
+        yield {
+            'solution_id': solution['id'],
+            'task_id': solution['task_id'],
+            'task_name': solution['task__name'],
+            'week_number': solution['task__week__number'],
+            'gradable': solution['task__gradable'],
+            'user_id': solution['user_id'],
+            'email': solution['user__email'],
+            'full_name': solution['user__profile__full_name'],
+            'status': statuses[solution['status']],
+            'grade': get_solution_grade(status=solution['status'], gradable=solution['task__gradable']),
+            'return_code': solution['return_code'],
+            'created_at': solution['created_at'],
+            'test_output': solution['test_output'],
+            'code': code,
+        }
+
+
+def get_code_blob_storage_report() -> Dict:
+    """
+    `logical_bytes` is what storing the code on every solution would take,
+    `stored_bytes` is what the deduplicated and compressed blobs actually take.
+    """
+    logical = Solution.objects.filter(code_blob__isnull=False).aggregate(
+        solutions=Count('id'),
+        logical_bytes=Sum('code_blob__size'),
+    )
+    stored = CodeBlob.objects.aggregate(
+        blobs=Count('hash'),
+        unique_bytes=Sum('size'),
+        stored_bytes=Sum(Length('data')),
+    )
+
+    report = {key: value or 0 for key, value in {**logical, **stored}.items()}
+    report['saved_bytes'] = report['logical_bytes'] - report['stored_bytes']
+
+    return report
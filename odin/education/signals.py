@@ -1,13 +1,112 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, pre_delete, post_delete
+from django.core.cache import cache
 from django.dispatch import receiver
 
-from .models import Course, Teacher
-from .services import add_teacher
+from odin.common.cache import bump_versions
+from odin.users.models import Profile
+
+from .models import (
+    Course,
+    Teacher,
+    Week,
+    IncludedTask,
+    CourseAssignment,
+    Solution,
+    Certificate,
+)
+from .services import add_teachers_to_courses, record_solved_task, recount_solved_task
+from .cache import (
+    get_course_version_key,
+    get_course_user_version_key,
+    get_course_solutions_version_key,
+    get_task_version_key,
+    get_task_user_version_key,
+    get_solution_version_key,
+    get_profile_version_key,
+    get_certificate_cache_key,
+)
 
 
 @receiver(post_save, sender=Course)
 def populate_course_teachers_with_superusers(sender, instance, created, **kwargs):
     if created:
-        superusers = Teacher.objects.filter(is_superuser=True)
-        for user in superusers:
-            add_teacher(instance, user, hidden=True)
+        add_teachers_to_courses(
+            teacher_ids=Teacher.objects.filter(is_superuser=True).values_list('id', flat=True),
+            course_ids=[instance.id],
+            hidden=True
+        )
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def bump_course_version(sender, instance, **kwargs):
+    bump_versions(get_course_version_key(course_id=instance.id))
+
+
+@receiver(post_save, sender=Week)
+@receiver(post_delete, sender=Week)
+@receiver(post_save, sender=CourseAssignment)
+@receiver(post_delete, sender=CourseAssignment)
+def bump_course_version_on_course_content_change(sender, instance, **kwargs):
+    bump_versions(get_course_version_key(course_id=instance.course_id))
+
+
+@receiver(post_save, sender=IncludedTask)
+@receiver(post_delete, sender=IncludedTask)
+def bump_task_version(sender, instance, **kwargs):
+    bump_versions(
+        get_task_version_key(task_id=instance.id),
+        get_course_version_key(course_id=instance.course_id),
+    )
+
+
+@receiver(post_save, sender=Solution)
+@receiver(post_delete, sender=Solution)
+def bump_solution_version(sender, instance, **kwargs):
+    bump_versions(
+        get_solution_version_key(solution_id=instance.id),
+        get_task_user_version_key(task_id=instance.task_id, user_id=instance.user_id),
+        get_course_user_version_key(course_id=instance.task.course_id, user_id=instance.user_id),
+        get_course_solutions_version_key(course_id=instance.task.course_id),
+    )
+
+
+@receiver(post_save, sender=Solution)
+def update_leaderboard(sender, instance, created, **kwargs):
+    if instance.passed:
+        record_solved_task(solution=instance)
+    elif not created:
+        # The solution may have been the one that solved its task before it was regraded.
+        recount_solved_task(course_id=instance.task.course_id, task_id=instance.task_id, user_ids=[instance.user_id])
+
+
+@receiver(post_delete, sender=Solution)
+def update_leaderboard_on_solution_delete(sender, instance, **kwargs):
+    if instance.passed:
+        recount_solved_task(course_id=instance.task.course_id, task_id=instance.task_id, user_ids=[instance.user_id])
+
+
+@receiver(pre_delete, sender=IncludedTask)
+def remember_users_that_solved_the_task(sender, instance, **kwargs):
+    # The solved tasks are gone by the time `post_delete` runs.
+    instance._solved_user_ids = list(instance.solved_tasks.values_list('user_id', flat=True))
+
+
+@receiver(post_delete, sender=IncludedTask)
+def update_leaderboard_on_task_delete(sender, instance, **kwargs):
+    recount_solved_task(
+        course_id=instance.course_id,
+        task_id=instance.id,
+        user_ids=getattr(instance, '_solved_user_ids', [])
+    )
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def bump_profile_version(sender, instance, **kwargs):
+    bump_versions(get_profile_version_key(user_id=instance.user_id))
+
+
+@receiver(post_delete, sender=Certificate)
+def forget_verified_certificate(sender, instance, **kwargs):
+    cache.delete(get_certificate_cache_key(token=instance.token))
@@ -0,0 +1,38 @@
+from __future__ import absolute_import, unicode_literals
+from celery import shared_task
+
+from requests import codes
+from requests.exceptions import Timeout, ConnectionError, HTTPError
+
+from django.conf import settings
+
+from .models import Course
+from .services import fetch_task_description, issue_certificates
+
+
+TASK_DESCRIPTION_RETRY_COUNTDOWN = 30
+
+
+def _is_temporary_http_error(exc: HTTPError) -> bool:
+    if exc.response is None:
+        return False
+
+    return exc.response.status_code >= 500 or exc.response.status_code == codes.too_many_requests
+
+
+@shared_task(bind=True, max_retries=settings.CELERY_TASK_MAX_RETRIES)
+def fetch_description(self, url):
+    try:
+        fetch_task_description(url=url)
+    except (Timeout, ConnectionError) as exc:
+        raise self.retry(exc=exc, countdown=TASK_DESCRIPTION_RETRY_COUNTDOWN)
+    except HTTPError as exc:
+        if not _is_temporary_http_error(exc):
+            raise
+
+        raise self.retry(exc=exc, countdown=TASK_DESCRIPTION_RETRY_COUNTDOWN)
+
+
+@shared_task
+def issue_course_certificates(course_id):
+    issue_certificates(course=Course.objects.get(id=course_id))
@@ -0,0 +1,46 @@
+from test_plus import TestCase
+
+from odin.common.cache import ReferenceData
+
+from ..models import ProgrammingLanguage
+from ..factories import ProgrammingLanguageFactory
+
+
+class TestReferenceData(TestCase):
+    def setUp(self):
+        self.language = ProgrammingLanguageFactory()
+        self.languages = ReferenceData(
+            key=f'tests:languages:{self.language.id}',
+            loader=lambda: list(ProgrammingLanguage.objects.values_list('name', flat=True)),
+            models=[ProgrammingLanguage],
+        )
+        self.addCleanup(self.languages.disconnect)
+
+    def test_value_is_served_from_process_cache_after_first_load(self):
+        self.assertEqual([self.language.name], self.languages.get())
+
+        with self.assertNumQueries(0):
+            self.assertEqual([self.language.name], self.languages.get())
+
+    def test_saving_a_model_invalidates_the_value(self):
+        self.languages.get()
+
+        language = ProgrammingLanguageFactory()
+
+        self.assertIn(language.name, self.languages.get())
+
+    def test_deleting_a_model_invalidates_the_value(self):
+        self.languages.get()
+
+        self.language.delete()
+
+        self.assertEqual([], self.languages.get())
+
+    def test_disconnect_stops_the_invalidation(self):
+        self.languages.disconnect()
+        self.languages.get()
+
+        ProgrammingLanguageFactory()
+
+        with self.assertNumQueries(0):
+            self.languages.get()
@@ -0,0 +1,58 @@
+from test_plus import TestCase
+
+from odin.users.models import Profile
+from odin.interviews.datasets import generate_interviews_dataset
+from odin.interviews.models import Interview
+
+from ..datasets import generate_education_dataset
+from ..factories import StudentFactory, CourseFactory, IncludedTaskFactory, SolutionFactory
+from ..models import Student, Week, CourseDescription, CodeBlob, Solution
+
+
+class TestBulkFactories(TestCase):
+    def test_create_bulk_students_creates_users_with_profiles(self):
+        students = StudentFactory.create_bulk(5)
+
+        self.assertEqual(5, Student.objects.filter(id__in=[student.id for student in students]).count())
+        self.assertEqual(5, Profile.objects.filter(user__in=students).count())
+
+    def test_create_bulk_courses_creates_their_weeks_and_descriptions(self):
+        courses = CourseFactory.create_bulk(3)
+
+        for course in courses:
+            self.assertEqual(course.duration_in_weeks, Week.objects.filter(course=course).count())
+            self.assertTrue(CourseDescription.objects.filter(course=course).exists())
+
+    def test_create_bulk_solutions_share_code_blobs(self):
+        task = IncludedTaskFactory()
+        student = StudentFactory()
+        blobs_count = CodeBlob.objects.count()
+
+        solutions = SolutionFactory.create_bulk(3, task=task, user=student, code='print(42)')
+
+        self.assertEqual(blobs_count + 1, CodeBlob.objects.count())
+        solutions = Solution.objects.filter(id__in=[solution.id for solution in solutions])
+        self.assertEqual({'print(42)'}, {solution.code for solution in solutions})
+
+
+class TestGenerateDataset(TestCase):
+    def test_generate_education_and_interviews_dataset(self):
+        education = generate_education_dataset(courses_count=2, students_count=6, tasks_count=4, solutions_count=24)
+        interviews = generate_interviews_dataset(
+            courses=education['courses'],
+            applications_count=5,
+            interviewers_count=1,
+            days_count=1
+        )
+
+        self.assertEqual(2, len(education['courses']))
+        self.assertEqual(6, sum(len(students) for students in education['students_per_course'].values()))
+        self.assertEqual(24, Solution.objects.filter(task__course__in=education['courses']).count())
+        self.assertEqual(5, len(interviews['applications']))
+        self.assertEqual(
+            5,
+            Interview.objects.filter(
+                interviewer__in=interviews['interviewers'],
+                application__isnull=False
+            ).count()
+        )
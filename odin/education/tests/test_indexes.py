@@ -0,0 +1,62 @@
+from test_plus import TestCase
+
+from django.db.models import Q
+
+from odin.common.testing import QueryPlanAssertionsMixin
+
+from ..factories import (
+    CourseFactory,
+    IncludedTaskFactory,
+    SolutionFactory,
+    StudentFactory,
+    TeacherFactory,
+)
+from ..models import Solution, CourseAssignment
+from ..services import add_student, add_teacher
+
+
+class TestHotQueryIndexes(QueryPlanAssertionsMixin, TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.teacher = TeacherFactory()
+        add_teacher(self.course, self.teacher)
+        self.tasks = [IncludedTaskFactory(course=self.course) for _ in range(3)]
+        self.students = [StudentFactory() for _ in range(3)]
+
+        for student in self.students:
+            add_student(course=self.course, student=student)
+
+            for task in self.tasks:
+                SolutionFactory(task=task, user=student.user, status=Solution.OK)
+
+        self.task = self.tasks[0]
+        self.user = self.students[0].user
+
+    def test_solutions_for_task_and_user_ordered_by_id(self):
+        self.assertUsesIndexes(
+            Solution.objects.filter(task=self.task, user=self.user).order_by('-id'),
+            index='education_solution_tu_id_idx'
+        )
+
+    def test_solutions_for_user_and_status(self):
+        self.assertUsesIndexes(
+            Solution.objects.filter(user=self.user, status=Solution.OK),
+            index='education_solution_us_idx'
+        )
+
+    def test_solutions_for_course_and_status(self):
+        self.assertUsesIndexes(
+            Solution.objects.filter(task__course=self.course, status=Solution.OK),
+            index='education_solution_ts_idx'
+        )
+
+    def test_course_assignments_for_student_and_course(self):
+        self.assertUsesIndexes(CourseAssignment.objects.filter(student=self.students[0], course=self.course))
+
+    def test_course_assignments_for_teacher_and_course(self):
+        self.assertUsesIndexes(CourseAssignment.objects.filter(teacher=self.teacher, course=self.course))
+
+    def test_course_assignments_for_user(self):
+        self.assertUsesIndexes(
+            CourseAssignment.objects.filter(Q(student_id=self.user.id) | Q(teacher_id=self.user.id))
+        )
@@ -0,0 +1,136 @@
+from datetime import timedelta
+
+from test_plus import TestCase
+
+from django.utils import timezone
+
+from ..factories import CourseFactory, IncludedTaskFactory, SolutionFactory, StudentFactory
+from ..leaderboards import Leaderboard, get_course_leaderboard
+from ..models import Solution, SolvedTask, LeaderboardEntry
+from ..services import enroll_students, rebuild_leaderboard
+
+
+def make_entry(user_id: int, solved_tasks_count: int, last_solved_at) -> dict:
+    return {
+        'user_id': user_id,
+        'user__profile__full_name': None,
+        'solved_tasks_count': solved_tasks_count,
+        'last_solved_at': last_solved_at,
+    }
+
+
+class TestLeaderboard(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.leaderboard = Leaderboard([
+            make_entry(1, 2, self.now),
+            make_entry(2, 5, self.now),
+            make_entry(3, 2, self.now - timedelta(hours=1)),
+            make_entry(4, 2, self.now),
+        ])
+
+    def test_ranks_by_solved_tasks_then_by_who_got_there_first(self):
+        self.assertEqual([2, 3, 1, 4], [entry['user_id'] for entry in self.leaderboard.entries])
+        self.assertEqual(1, self.leaderboard.get_rank(2))
+        self.assertEqual(2, self.leaderboard.get_rank(3))
+
+    def test_ties_share_a_rank(self):
+        self.assertEqual(3, self.leaderboard.get_rank(1))
+        self.assertEqual(3, self.leaderboard.get_rank(4))
+
+    def test_top_returns_the_first_entries_with_their_ranks(self):
+        self.assertEqual([(1, 2), (2, 3)], [(entry['rank'], entry['user_id']) for entry in self.leaderboard.top(2)])
+
+    def test_users_without_an_entry_have_no_rank(self):
+        self.assertIsNone(self.leaderboard.get_rank(5))
+        self.assertIsNone(self.leaderboard.get_entry(5))
+
+
+class TestGetCourseLeaderboard(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.task = IncludedTaskFactory(course=self.course, gradable=True)
+        self.student = StudentFactory()
+        enroll_students(course=self.course, user_ids=[self.student.id])
+
+    def test_leaderboard_is_kept_in_the_process_until_it_changes(self):
+        get_course_leaderboard(course_id=self.course.id)
+
+        with self.assertNumQueries(0):
+            leaderboard = get_course_leaderboard(course_id=self.course.id)
+
+        self.assertEqual(0, len(leaderboard))
+
+        SolutionFactory(task=self.task, user=self.student, status=Solution.OK)
+
+        leaderboard = get_course_leaderboard(course_id=self.course.id)
+        self.assertEqual(1, leaderboard.get_rank(self.student.id))
+
+
+class TestLeaderboardMaintenance(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.task, self.other_task = IncludedTaskFactory.create_batch(2, course=self.course, gradable=True)
+        self.student = StudentFactory()
+        enroll_students(course=self.course, user_ids=[self.student.id])
+
+    def get_entry(self):
+        return LeaderboardEntry.objects.filter(course=self.course, user=self.student).first()
+
+    def test_deleting_the_only_passing_solution_unsolves_the_task(self):
+        solution = SolutionFactory(task=self.task, user=self.student, status=Solution.OK)
+        other = SolutionFactory(task=self.other_task, user=self.student, status=Solution.OK)
+
+        solution.delete()
+
+        self.assertFalse(SolvedTask.objects.filter(task=self.task, user=self.student).exists())
+        entry = self.get_entry()
+        self.assertEqual((1, other.created_at), (entry.solved_tasks_count, entry.last_solved_at))
+
+    def test_deleting_the_first_passing_solution_moves_the_solve_to_the_next_one(self):
+        first = SolutionFactory(task=self.task, user=self.student, status=Solution.OK)
+        second = SolutionFactory(task=self.task, user=self.student, status=Solution.OK)
+        Solution.objects.filter(id=second.id).update(created_at=first.created_at + timedelta(hours=1))
+
+        first.delete()
+
+        self.assertEqual(
+            first.created_at + timedelta(hours=1),
+            SolvedTask.objects.get(task=self.task, user=self.student).solved_at
+        )
+        entry = self.get_entry()
+        self.assertEqual((1, first.created_at + timedelta(hours=1)), (entry.solved_tasks_count, entry.last_solved_at))
+
+    def test_regrading_the_only_passing_solution_removes_the_entry(self):
+        solution = SolutionFactory(task=self.task, user=self.student, status=Solution.OK)
+        get_course_leaderboard(course_id=self.course.id)
+
+        solution.status = Solution.NOT_OK
+        solution.save()
+
+        self.assertFalse(SolvedTask.objects.exists())
+        self.assertIsNone(self.get_entry())
+        self.assertEqual(0, len(get_course_leaderboard(course_id=self.course.id)))
+
+    def test_failing_solutions_leave_the_solved_task_alone(self):
+        SolutionFactory(task=self.task, user=self.student, status=Solution.OK)
+        failed = SolutionFactory(task=self.task, user=self.student, status=Solution.NOT_OK)
+
+        failed.delete()
+        SolutionFactory(task=self.task, user=self.student, status=Solution.NOT_OK).save()
+
+        self.assertEqual(1, self.get_entry().solved_tasks_count)
+
+    def test_removing_a_task_drops_it_from_the_counts(self):
+        SolutionFactory(task=self.task, user=self.student, status=Solution.OK)
+        other = SolutionFactory(task=self.other_task, user=self.student, status=Solution.OK)
+        other_student = StudentFactory()
+        enroll_students(course=self.course, user_ids=[other_student.id])
+        SolutionFactory(task=self.task, user=other_student, status=Solution.OK)
+
+        self.task.delete()
+
+        entry = self.get_entry()
+        self.assertEqual((1, other.created_at), (entry.solved_tasks_count, entry.last_solved_at))
+        self.assertFalse(LeaderboardEntry.objects.filter(course=self.course, user=other_student).exists())
+        self.assertEqual(0, rebuild_leaderboard(course=self.course))
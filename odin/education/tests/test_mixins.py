@@ -0,0 +1,66 @@
+from test_plus import TestCase
+
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory
+from django.views.generic import View
+
+from odin.users.factories import BaseUserFactory
+
+from ..factories import CourseFactory, IncludedTaskFactory, LectureFactory, SolutionFactory
+from ..mixins import CourseViewMixin
+from ..services import enroll_students
+
+
+class CourseHeaderView(CourseViewMixin, View):
+    def get(self, request, *args, **kwargs):
+        return HttpResponse()
+
+
+class CourseScheduleView(CourseHeaderView):
+    course_prefetch = {
+        'weeks__lectures': ('date', ),
+        'students': ('email', 'profile__full_name'),
+        'weeks': ('number', ),
+    }
+
+
+class TestCourseViewMixin(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.users = BaseUserFactory.create_batch(2)
+        enroll_students(course=self.course, user_ids=[user.id for user in self.users])
+        LectureFactory.create_batch(2, course=self.course)
+
+    def dispatch(self, view_class, **kwargs):
+        view = view_class()
+        view.kwargs = kwargs
+        view.dispatch(RequestFactory().get('/'), **kwargs)
+
+        return view.course
+
+    def test_loads_only_the_course_by_default(self):
+        task = IncludedTaskFactory(course=self.course)
+        SolutionFactory.create_batch(3, task=task, user=self.users[0])
+
+        with self.assertNumQueries(1):
+            course = self.dispatch(CourseHeaderView, course_id=self.course.id)
+            course.name
+
+        self.assertEqual(self.course, course)
+
+    def test_finds_the_course_by_slug(self):
+        self.assertEqual(self.course, self.dispatch(CourseHeaderView, course_slug=self.course.slug_url))
+
+    def test_raises_not_found_for_unknown_courses(self):
+        with self.assertRaises(Http404):
+            self.dispatch(CourseHeaderView, course_id=self.course.id + 1)
+
+    def test_prefetches_only_what_the_view_declares(self):
+        with self.assertNumQueries(4):
+            course = self.dispatch(CourseScheduleView, course_id=self.course.id)
+
+            students = {(student.email, student.profile.full_name) for student in course.students.all()}
+            lectures = [lecture.date for week in course.weeks.all() for lecture in week.lectures.all()]
+
+        self.assertEqual({(user.email, user.profile.full_name) for user in self.users}, students)
+        self.assertEqual(2, len(lectures))
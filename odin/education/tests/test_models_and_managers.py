@@ -16,9 +16,10 @@ from ..factories import (
     CourseFactory,
     IncludedTaskFactory,
     SolutionFactory,
-    WeekFactory
+    WeekFactory,
+    LectureFactory
 )
-from ..models import Student, Teacher, CourseAssignment, IncludedTask, Solution
+from ..models import Student, Teacher, CourseAssignment, IncludedTask, Solution, CodeBlob
 from ..services import add_student, add_teacher
 
 
@@ -174,6 +175,51 @@ class BaseUserToStudentAndTeacherTests(TestCase):
         self.assertEqual(user_count, BaseUser.objects.count())
 
 
+class BulkCreateFromUsersTests(TestCase):
+    def test_bulk_create_from_users_promotes_and_activates_users(self):
+        users = [BaseUserFactory() for _ in range(3)]
+        student = StudentFactory()
+        self.assertFalse(any(user.is_active for user in users))
+
+        students = Student.objects.bulk_create_from_users(users + [student.user])
+
+        self.assertEqual(sorted(user.id for user in users + [student]), [student.id for student in students])
+        self.assertTrue(all(isinstance(student, Student) for student in students))
+        self.assertFalse(BaseUser.objects.filter(id__in=[user.id for user in users], is_active=False).exists())
+
+    def test_bulk_create_from_users_leaves_existing_roles_alone(self):
+        teacher = TeacherFactory()
+        teacher_count = Teacher.objects.count()
+
+        teachers = Teacher.objects.bulk_create_from_users([teacher.user, teacher.user])
+
+        self.assertEqual([teacher.id], [teacher.id for teacher in teachers])
+        self.assertEqual(teacher_count, Teacher.objects.count())
+        self.assertFalse(BaseUser.objects.get(id=teacher.id).is_active)
+
+    def test_bulk_create_from_users_takes_the_same_queries_for_any_number_of_users(self):
+        one = [BaseUserFactory()]
+        many = [BaseUserFactory() for _ in range(10)]
+
+        with self.assertNumQueries(4):
+            Student.objects.bulk_create_from_users(one)
+
+        with self.assertNumQueries(4):
+            Student.objects.bulk_create_from_users(many)
+
+    def test_bulk_create_from_user_ids_returns_only_the_promoted_ids(self):
+        users = [BaseUserFactory() for _ in range(3)]
+        student = StudentFactory()
+        user_ids = [user.id for user in users] + [student.id]
+
+        with self.assertNumQueries(3):
+            promoted = Student.objects.bulk_create_from_user_ids(user_ids)
+
+        self.assertEqual(sorted(user.id for user in users), sorted(promoted))
+        self.assertEqual(4, Student.objects.filter(id__in=user_ids).count())
+        self.assertFalse(BaseUser.objects.filter(id__in=promoted, is_active=False).exists())
+
+
 class CourseAssignmentTests(TestCase):
     def test_creating_course_assignment_with_only_course_raises_validation_error(self):
         course = CourseFactory()
@@ -361,3 +407,72 @@ class SolutionTests(TestCase):
 
         queryset = Solution.objects.get_solved_solutions_for_student_and_course(self.student, self.course)
         self.assertEqual([], list(queryset))
+
+    def test_solution_code_is_read_back_from_its_blob(self):
+        code = faker.text()
+        solution = SolutionFactory(task=self.task, user=self.user, code=code)
+
+        solution = Solution.objects.get(id=solution.id)
+
+        self.assertEqual(code, solution.code)
+        self.assertEqual(CodeBlob.objects.get(solutions=solution), solution.code_blob)
+
+    def test_solutions_with_the_same_code_share_a_blob(self):
+        code = faker.text()
+
+        first = SolutionFactory(task=self.task, user=self.user, code=code)
+        second = SolutionFactory(task=self.task, user=self.user, code=code)
+
+        self.assertEqual(first.code_blob_id, second.code_blob_id)
+        self.assertEqual(1, CodeBlob.objects.filter(solutions__in=[first, second]).distinct().count())
+
+    def test_solution_code_can_be_changed_and_cleared(self):
+        solution = SolutionFactory(task=self.task, user=self.user)
+        code = 'print("changed")' * 100
+
+        solution.code = code
+        solution.save()
+        self.assertEqual(code, Solution.objects.get(id=solution.id).code)
+        self.assertTrue(solution.code_blob.compressed)
+
+        solution.code = None
+        solution.save()
+        self.assertIsNone(Solution.objects.get(id=solution.id).code)
+
+    def test_solution_code_is_saved_with_update_fields(self):
+        solution = SolutionFactory(task=self.task, user=self.user)
+        code = faker.text()
+
+        solution.code = code
+        solution.status = Solution.OK
+        solution.save(update_fields=['status'])
+
+        solution = Solution.objects.get(id=solution.id)
+        self.assertEqual(code, solution.code)
+        self.assertEqual(Solution.OK, solution.status)
+
+        solution.code = None
+        solution.save(update_fields=['code'])
+        self.assertIsNone(Solution.objects.get(id=solution.id).code)
+
+    def test_refresh_from_db_drops_the_unsaved_code(self):
+        code = faker.text()
+        solution = SolutionFactory(task=self.task, user=self.user, code=code)
+
+        solution.code = faker.text()
+        solution.refresh_from_db()
+
+        self.assertEqual(code, solution.code)
+
+
+class LectureTests(TestCase):
+    def test_not_present_students_are_the_course_students_missing_from_the_lecture(self):
+        course = CourseFactory()
+        present, absent = StudentFactory(), StudentFactory()
+        add_student(course=course, student=present)
+        add_student(course=course, student=absent)
+        lecture = LectureFactory(course=course)
+        lecture.present_students.add(present, StudentFactory())
+
+        with self.assertNumQueries(1):
+            self.assertEqual([absent.id], [student.id for student in lecture.not_present_students])
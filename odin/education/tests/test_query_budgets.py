@@ -0,0 +1,68 @@
+from test_plus import TestCase
+
+from odin.common.testing import QueryBudgetAssertionsMixin
+from odin.users.factories import BaseUserFactory
+
+from ..models import Student, Teacher, Solution
+from ..services import (
+    add_student,
+    add_teacher,
+    get_courses_for_user,
+    get_gradable_tasks_for_course,
+    get_user_solution_summaries,
+    get_all_student_solution_statistics,
+)
+from ..factories import CourseFactory, IncludedTaskFactory, SolutionFactory
+
+
+class TestEducationServiceQueryBudgets(QueryBudgetAssertionsMixin, TestCase):
+    """
+    Every service is measured on a small course and again after the course grew.
+    """
+    def setUp(self):
+        self.user = BaseUserFactory()
+        self.student = Student.objects.create_from_user(self.user)
+        self.teacher = Teacher.objects.create_from_user(self.user)
+        self.course = CourseFactory()
+        self.week = self.course.weeks.first()
+        add_student(course=self.course, student=self.student)
+        add_teacher(self.course, self.teacher)
+
+        self.task = IncludedTaskFactory(course=self.course, week=self.week, gradable=True)
+        SolutionFactory(task=self.task, user=self.user, status=Solution.OK, test_output={})
+
+    def grow_course(self, *, students=5, tasks=5):
+        users = [self.user]
+        for _ in range(students):
+            student = Student.objects.create_from_user(BaseUserFactory())
+            add_student(course=self.course, student=student)
+            users.append(student.user)
+
+        for _ in range(tasks):
+            task = IncludedTaskFactory(course=self.course, week=self.week, gradable=True)
+
+            for user in users:
+                SolutionFactory(task=task, user=user, status=Solution.OK, test_output={})
+                SolutionFactory(task=task, user=user, status=Solution.NOT_OK, test_output={})
+
+        add_student(course=CourseFactory(), student=self.student)
+
+    def assertServiceBudget(self, budget, func):
+        for grow in (False, True):
+            if grow:
+                self.grow_course()
+
+            with self.assertQueryBudget(budget):
+                func()
+
+    def test_get_courses_for_user(self):
+        self.assertServiceBudget(1, lambda: list(get_courses_for_user(user=self.user)))
+
+    def test_get_gradable_tasks_for_course(self):
+        self.assertServiceBudget(2, lambda: get_gradable_tasks_for_course(course=self.course, user=self.user))
+
+    def test_get_user_solution_summaries(self):
+        self.assertServiceBudget(3, lambda: get_user_solution_summaries(users=list(self.course.students.all())))
+
+    def test_get_all_student_solution_statistics(self):
+        self.assertServiceBudget(4, lambda: get_all_student_solution_statistics(task=self.task))
@@ -1,8 +1,16 @@
+from unittest import mock
+
+import factory
+import requests
+
 from test_plus import TestCase
 
+from celery.exceptions import Retry
+
 from dateutil import parser
 from datetime import timedelta
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
@@ -10,23 +18,45 @@ from django.db.models import Q
 
 from ..services import (
     create_course,
+    clone_course,
+    enroll_students,
+    get_course_attendance,
+    mark_attendance,
+    record_solved_task,
+    rebuild_leaderboard,
+    get_all_student_solution_statistics,
+    get_course_task_statistics,
+    count_course_task_statistics,
+    issue_certificates,
+    verify_certificate,
     create_included_material,
     create_included_task,
+    create_included_task_with_test,
+    fetch_task_description,
+    refresh_task_descriptions,
+    import_curriculum,
     create_test_for_task,
     create_gradable_solution,
     create_non_gradable_solution,
     create_lecture,
+    get_code_blob_storage_report,
 )
 from ..models import (
     Course,
+    CourseAssignment,
+    Student,
     Week,
     Material,
     IncludedMaterial,
     Task,
+    TaskDescription,
     IncludedTask,
     Solution,
     IncludedTest,
-    Lecture
+    Lecture,
+    SolvedTask,
+    LeaderboardEntry,
+    Certificate,
 )
 from ..factories import (
     CourseFactory,
@@ -35,9 +65,14 @@ from ..factories import (
     ProgrammingLanguageFactory,
     StudentFactory,
     BaseUserFactory,
+    SolutionFactory,
+    LectureFactory,
 )
+from ..cache import get_certificate_cache_key
+from ..tasks import fetch_description, TASK_DESCRIPTION_RETRY_COUNTDOWN
 
 from odin.common.faker import faker
+from odin.common.testing import QueryRecorder
 
 
 class TestCreateCourse(TestCase):
@@ -110,6 +145,128 @@ class TestCreateCourse(TestCase):
         self.assertEqual(0, week_one.start_date.weekday())
 
 
+class TestCloneCourse(TestCase):
+    def setUp(self):
+        self.course = CourseFactory(attendable=False)
+        self.weeks = list(self.course.weeks.all())
+        self.language = ProgrammingLanguageFactory()
+
+    def add_content(self, *, tasks):
+        for index in range(tasks):
+            week = self.weeks[index % len(self.weeks)]
+            create_included_material(
+                course=self.course,
+                week=week,
+                identifier=faker.word(),
+                url=faker.url(),
+                content=faker.text()
+            )
+            task = create_included_task(
+                course=self.course,
+                week=week,
+                name=faker.word(),
+                description=faker.text(),
+                gradable=True
+            )
+            create_test_for_task(task=task, language=self.language, code=faker.text())
+
+    def test_clone_course_shifts_weeks_and_includes_the_same_content(self):
+        self.add_content(tasks=3)
+        start_date = self.course.start_date + timedelta(weeks=52)
+
+        clone = clone_course(course=self.course, name=faker.word(), slug_url=faker.slug(), start_date=start_date)
+
+        self.assertEqual(start_date, clone.start_date)
+        self.assertEqual(self.course.end_date - self.course.start_date, clone.end_date - clone.start_date)
+        self.assertFalse(clone.attendable)
+        self.assertEqual(self.course.description.verbose, clone.description.verbose)
+        self.assertEqual(
+            [(week.number, week.start_date + timedelta(days=364)) for week in self.weeks],
+            [(week.number, week.start_date) for week in clone.weeks.all()]
+        )
+
+        self.assertEqual(
+            sorted(self.course.included_materials.values_list('week__number', 'identifier')),
+            sorted(clone.included_materials.values_list('week__number', 'identifier'))
+        )
+        self.assertEqual(
+            sorted(self.course.included_tasks.values_list('week__number', 'name')),
+            sorted(clone.included_tasks.values_list('week__number', 'name'))
+        )
+
+        self.assertEqual(
+            set(IncludedTest.objects.filter(task__course=self.course).values_list('test_id', 'code')),
+            set(IncludedTest.objects.filter(task__course=clone).values_list('test_id', 'code'))
+        )
+        self.assertEqual(
+            {task.task_id for task in self.course.included_tasks.all()},
+            {task.task_id for task in clone.included_tasks.all()}
+        )
+
+    def test_clone_course_takes_the_same_queries_for_any_course_size(self):
+        self.add_content(tasks=1)
+
+        with QueryRecorder() as small_queries:
+            clone_course(
+                course=self.course,
+                name=faker.word(),
+                slug_url=faker.slug(),
+                start_date=self.course.start_date
+            )
+
+        self.add_content(tasks=10)
+
+        with QueryRecorder() as large_queries:
+            clone_course(
+                course=self.course,
+                name=faker.word(),
+                slug_url=faker.slug(),
+                start_date=self.course.start_date
+            )
+
+        self.assertEqual(len(small_queries), len(large_queries))
+
+
+class TestEnrollStudents(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+
+    def test_enroll_students_promotes_activates_and_enrolls_users(self):
+        user = BaseUserFactory()
+        student = StudentFactory()
+        self.assertFalse(user.is_active)
+
+        enrolled = enroll_students(course=self.course, user_ids=[user.id, student.id])
+
+        user.refresh_from_db()
+        self.assertEqual(sorted([user.id, student.id]), sorted(enrolled))
+        self.assertTrue(user.is_active)
+        self.assertTrue(Student.objects.filter(id=user.id).exists())
+        self.assertEqual({user.id, student.id}, set(self.course.students.values_list('id', flat=True)))
+
+    def test_enroll_students_skips_users_already_in_the_course(self):
+        student = StudentFactory()
+        enroll_students(course=self.course, user_ids=[student.id])
+
+        enrolled = enroll_students(course=self.course, user_ids=[student.id, student.id])
+
+        self.assertEqual([], enrolled)
+        self.assertEqual(1, CourseAssignment.objects.filter(course=self.course, student=student).count())
+
+    def test_enroll_students_takes_the_same_queries_for_any_number_of_users(self):
+        user, = BaseUserFactory.create_bulk(1, is_active=False)
+
+        with QueryRecorder() as one:
+            enroll_students(course=self.course, user_ids=[user.id])
+
+        users = BaseUserFactory.create_bulk(20, is_active=False)
+
+        with QueryRecorder() as many:
+            enroll_students(course=self.course, user_ids=[user.id for user in users])
+
+        self.assertEqual(len(one), len(many))
+
+
 class TestCreateIncludedMaterial(TestCase):
     def setUp(self):
         self.course = CourseFactory()
@@ -168,6 +325,200 @@ class TestCreateIncludedTask(TestCase):
         self.assertEqual(current_included_task_count + 1, IncludedTask.objects.count())
 
 
+def _response(*, status_code=200, text='', etag=''):
+    response = mock.Mock(status_code=status_code, text=text, headers={'ETag': etag})
+    response.raise_for_status.return_value = None
+
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+
+    return response
+
+
+@mock.patch('odin.education.services.transaction.on_commit', side_effect=lambda func: func())
+@mock.patch('odin.education.services.requests.get')
+class TestTaskDescriptions(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.week = WeekFactory(course=self.course)
+        self.language = ProgrammingLanguageFactory()
+        self.url = 'https://github.com/HackSoftware/Odin/blob/master/README.md?raw=1'
+
+    def create_task(self):
+        return create_included_task_with_test(
+            course=self.course,
+            language=self.language,
+            week=self.week,
+            name=faker.word(),
+            code=faker.text(),
+            gradable=True,
+            description_url='https://github.com/HackSoftware/Odin/tree/master'
+        )
+
+    def test_create_included_task_with_test_fetches_the_description_after_commit(self, requests_get, on_commit):
+        requests_get.return_value = _response(text='# Task', etag='"v1"')
+
+        task = self.create_task()
+        task.refresh_from_db()
+
+        requests_get.assert_called_once_with(self.url, headers={}, timeout=mock.ANY)
+        self.assertEqual(self.url, task.description_url)
+        self.assertEqual('# Task', task.description)
+        self.assertEqual('# Task', Task.objects.get(id=task.task_id).description)
+        self.assertEqual('"v1"', TaskDescription.objects.get(url=self.url).etag)
+
+    def test_create_included_task_with_test_uses_the_cached_description(self, requests_get, on_commit):
+        TaskDescription.objects.create(url=self.url, etag='"v1"', markdown='# Cached')
+        on_commit.side_effect = None
+
+        task = self.create_task()
+
+        requests_get.assert_not_called()
+        self.assertEqual('# Cached', task.description)
+
+    def test_fetch_task_description_revalidates_the_cached_description(self, requests_get, on_commit):
+        TaskDescription.objects.create(url=self.url, etag='"v1"', markdown='# Cached')
+        task = IncludedTaskFactory(course=self.course, week=self.week, description=None, description_url=self.url)
+        requests_get.return_value = _response(status_code=304)
+
+        description = fetch_task_description(url=self.url)
+        task.refresh_from_db()
+
+        requests_get.assert_called_once_with(self.url, headers={'If-None-Match': '"v1"'}, timeout=mock.ANY)
+        self.assertEqual('"v1"', description.etag)
+        self.assertEqual('# Cached', task.description)
+
+    def test_fetch_task_description_updates_described_tasks_when_changed(self, requests_get, on_commit):
+        TaskDescription.objects.create(url=self.url, etag='"v1"', markdown='# Old')
+        task = IncludedTaskFactory(course=self.course, week=self.week, description='# Old', description_url=self.url)
+        requests_get.return_value = _response(text='# New', etag='"v2"')
+
+        description = fetch_task_description(url=self.url)
+        task.refresh_from_db()
+
+        self.assertEqual('"v2"', description.etag)
+        self.assertEqual('# New', task.description)
+
+    def test_refresh_task_descriptions_fetches_every_distinct_url_once(self, requests_get, on_commit):
+        other_url = 'https://github.com/HackSoftware/Odin/blob/master/docs/README.md?raw=1'
+        IncludedTaskFactory.create_batch(2, course=self.course, description_url=self.url)
+        IncludedTaskFactory(course=self.course, description_url=other_url)
+        IncludedTaskFactory(course=self.course, description_url=None)
+        requests_get.return_value = _response(text='# Task')
+
+        self.assertEqual(2, refresh_task_descriptions(course=self.course))
+        self.assertEqual(
+            {self.url, other_url},
+            {call[0][0] for call in requests_get.call_args_list}
+        )
+
+    def test_fetch_description_retries_server_errors_and_rate_limits(self, requests_get, on_commit):
+        for status_code in (500, 503, 429):
+            requests_get.return_value = _response(status_code=status_code)
+
+            with mock.patch.object(fetch_description, 'retry', side_effect=Retry()) as retry:
+                with self.assertRaises(Retry):
+                    fetch_description(self.url)
+
+            retry.assert_called_once_with(exc=mock.ANY, countdown=TASK_DESCRIPTION_RETRY_COUNTDOWN)
+
+    def test_fetch_description_does_not_retry_client_errors(self, requests_get, on_commit):
+        requests_get.return_value = _response(status_code=404)
+
+        with mock.patch.object(fetch_description, 'retry') as retry:
+            with self.assertRaises(requests.HTTPError):
+                fetch_description(self.url)
+
+        retry.assert_not_called()
+
+
+@mock.patch('odin.education.services.transaction.on_commit', side_effect=lambda func: func())
+@mock.patch('odin.education.services.requests.get')
+class TestImportCurriculum(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.language = ProgrammingLanguageFactory(name='Python')
+
+    def get_manifest(self, *, tasks_per_week, repository='Odin'):
+        return {
+            'weeks': [
+                {
+                    'number': number,
+                    'materials': [{'identifier': faker.word(), 'url': faker.url(), 'content': faker.text()}],
+                    'tasks': [
+                        {
+                            'name': f'Task {number}.{index}',
+                            'description_url': f'https://github.com/HackSoftware/{repository}/tree/{number}/{index}',
+                            'gradable': index % 2 == 0,
+                            'language': 'Python',
+                            'code': faker.text(),
+                        }
+                        for index in range(tasks_per_week)
+                    ],
+                }
+                for number in (1, 2)
+            ]
+        }
+
+    def test_import_curriculum_creates_everything_with_fetched_descriptions(self, requests_get, on_commit):
+        requests_get.return_value = _response(text='# Task', etag='"v1"')
+
+        imported = import_curriculum(course=self.course, manifest=self.get_manifest(tasks_per_week=3))
+
+        self.assertEqual({'materials': 2, 'tasks': 6, 'tests': 4}, imported)
+        self.assertEqual(2, IncludedMaterial.objects.filter(course=self.course).count())
+        self.assertEqual(4, IncludedTest.objects.filter(task__course=self.course, language=self.language).count())
+        self.assertEqual(
+            {'# Task'},
+            set(IncludedTask.objects.filter(course=self.course).values_list('description', flat=True))
+        )
+        self.assertEqual(6, TaskDescription.objects.count())
+        self.assertEqual(
+            {1: 3, 2: 3},
+            {week.number: week.included_tasks.count() for week in self.course.weeks.filter(number__in=(1, 2))}
+        )
+
+    def test_import_curriculum_takes_the_same_queries_for_any_curriculum_size(self, requests_get, on_commit):
+        requests_get.return_value = _response(text='# Task')
+
+        other_course = CourseFactory()
+
+        with QueryRecorder() as small:
+            import_curriculum(course=self.course, manifest=self.get_manifest(tasks_per_week=1))
+
+        with QueryRecorder() as large:
+            import_curriculum(course=other_course, manifest=self.get_manifest(tasks_per_week=20, repository='Other'))
+
+        self.assertEqual(len(small), len(large))
+
+    def test_import_curriculum_fetches_failed_descriptions_in_the_background(self, requests_get, on_commit):
+        requests_get.side_effect = [requests.Timeout()] * 2 + [_response(text='# Task')] * 2
+
+        import_curriculum(course=self.course, manifest=self.get_manifest(tasks_per_week=1))
+
+        self.assertEqual(4, requests_get.call_count)
+        self.assertEqual(
+            {'# Task'},
+            set(IncludedTask.objects.filter(course=self.course).values_list('description', flat=True))
+        )
+
+    def test_import_curriculum_rejects_unknown_weeks_and_languages(self, requests_get, on_commit):
+        task_count = Task.objects.count()
+        manifest = self.get_manifest(tasks_per_week=1)
+
+        manifest['weeks'][0]['number'] = self.course.duration_in_weeks + 1
+        with self.assertRaises(ValidationError):
+            import_curriculum(course=self.course, manifest=manifest)
+
+        manifest = self.get_manifest(tasks_per_week=1)
+        manifest['weeks'][0]['tasks'][0]['language'] = 'Brainfuck'
+        with self.assertRaises(ValidationError):
+            import_curriculum(course=self.course, manifest=manifest)
+
+        requests_get.assert_not_called()
+        self.assertEqual(task_count, Task.objects.count())
+
+
 class TestCreateTestForTask(TestCase):
 
     def setUp(self):
@@ -314,3 +665,379 @@ class TestCreateLecture(TestCase):
         invalid_date = self.course.end_date + timezone.timedelta(days=faker.pyint())
         with self.assertRaises(ValidationError):
             create_lecture(date=invalid_date, course=self.course)
+
+
+class TestGetCourseAttendance(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.students = StudentFactory.create_bulk(3)
+        enroll_students(course=self.course, user_ids=[student.id for student in self.students])
+        week = self.course.weeks.first()
+        self.lectures = [
+            LectureFactory(course=self.course, week=week, date=week.start_date + timedelta(days=day))
+            for day in (2, 0, 1)
+        ]
+
+    def test_get_course_attendance_returns_a_bitset_per_student_in_lecture_date_order(self):
+        first, second, third = sorted(self.lectures, key=lambda lecture: lecture.date)
+        first.present_students.add(self.students[0], self.students[1])
+        third.present_students.add(self.students[0])
+        left = StudentFactory()
+        first.present_students.add(left)
+
+        with self.assertNumQueries(3):
+            attendance = get_course_attendance(course=self.course)
+
+        self.assertEqual([first.id, second.id, third.id], [lecture['id'] for lecture in attendance['lectures']])
+        self.assertEqual(
+            [student.id for student in self.students],
+            [student['id'] for student in attendance['students']]
+        )
+        self.assertEqual(
+            {self.students[0].id: 0b101, self.students[1].id: 0b001, self.students[2].id: 0},
+            attendance['attendance']
+        )
+
+    def test_get_course_attendance_without_lectures(self):
+        course = CourseFactory()
+
+        attendance = get_course_attendance(course=course)
+
+        self.assertEqual({'lectures': [], 'students': [], 'attendance': {}}, attendance)
+
+
+class TestMarkAttendance(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.students = StudentFactory.create_bulk(4)
+        enroll_students(course=self.course, user_ids=[student.id for student in self.students])
+        self.lectures = LectureFactory.create_batch(2, course=self.course)
+
+    def test_mark_attendance_syncs_the_present_students_of_every_lecture(self):
+        first, second = self.lectures
+        first.present_students.add(self.students[0], self.students[1])
+        other_lecture = LectureFactory(course=self.course)
+        other_lecture.present_students.add(self.students[0])
+
+        result = mark_attendance(
+            course=self.course,
+            attendance={
+                first.id: [self.students[1].id, self.students[2].id],
+                second.id: [self.students[3].id],
+            }
+        )
+
+        self.assertEqual({'added': 2, 'removed': 1}, result)
+        self.assertEqual({self.students[1], self.students[2]}, set(first.present_students.all()))
+        self.assertEqual({self.students[3]}, set(second.present_students.all()))
+        self.assertEqual({self.students[0]}, set(other_lecture.present_students.all()))
+
+    def test_mark_attendance_without_replace_only_adds_students(self):
+        first, _ = self.lectures
+        first.present_students.add(self.students[0])
+
+        result = mark_attendance(course=self.course, attendance={first.id: [self.students[1].id]}, replace=False)
+
+        self.assertEqual({'added': 1, 'removed': 0}, result)
+        self.assertEqual({self.students[0], self.students[1]}, set(first.present_students.all()))
+
+    def test_mark_attendance_makes_the_same_queries_for_any_number_of_students(self):
+        first, second = self.lectures
+
+        with QueryRecorder() as small:
+            mark_attendance(course=self.course, attendance={first.id: [self.students[0].id]})
+
+        with QueryRecorder() as large:
+            mark_attendance(
+                course=self.course,
+                attendance={lecture.id: [student.id for student in self.students] for lecture in self.lectures}
+            )
+
+        self.assertEqual(len(small), len(large), large.format())
+
+    def test_mark_attendance_rejects_lectures_of_other_courses(self):
+        other_lecture = LectureFactory()
+
+        with self.assertRaises(ValidationError):
+            mark_attendance(course=self.course, attendance={other_lecture.id: [self.students[0].id]})
+
+        self.assertFalse(other_lecture.present_students.exists())
+
+    def test_mark_attendance_rejects_students_outside_of_the_course(self):
+        outsider = StudentFactory()
+
+        with self.assertRaises(ValidationError):
+            mark_attendance(course=self.course, attendance={self.lectures[0].id: [outsider.id]})
+
+        self.assertFalse(self.lectures[0].present_students.exists())
+
+
+class TestGetCourseTaskStatistics(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        week = self.course.weeks.first()
+        self.gradable_task = IncludedTaskFactory(course=self.course, week=week, gradable=True)
+        self.non_gradable_task = IncludedTaskFactory(course=self.course, week=week, gradable=False)
+        self.students = StudentFactory.create_bulk(3)
+        enroll_students(course=self.course, user_ids=[student.id for student in self.students])
+
+        SolutionFactory(task=self.gradable_task, user=self.students[0], status=Solution.OK)
+        SolutionFactory(task=self.gradable_task, user=self.students[0], status=Solution.NOT_OK)
+        SolutionFactory(task=self.gradable_task, user=self.students[1], status=Solution.NOT_OK)
+        SolutionFactory(
+            task=self.non_gradable_task,
+            user=self.students[2],
+            status=Solution.SUBMITTED_WITHOUT_GRADING
+        )
+        # Solutions of users outside of the course are not counted.
+        SolutionFactory(task=self.gradable_task, user=BaseUserFactory(), status=Solution.OK)
+
+    def test_get_course_task_statistics_matches_the_statistics_of_each_task(self):
+        statistics = get_course_task_statistics(course=self.course)
+
+        self.assertEqual([self.gradable_task.id, self.non_gradable_task.id], [task['id'] for task in statistics])
+        for task, task_statistics in zip([self.gradable_task, self.non_gradable_task], statistics):
+            expected = get_all_student_solution_statistics(task=task)
+            self.assertEqual(expected, {key: task_statistics[key] for key in expected})
+
+    def test_count_course_task_statistics_takes_a_single_query_for_any_number_of_tasks(self):
+        IncludedTaskFactory.create_batch(5, course=self.course)
+
+        with self.assertNumQueries(1):
+            statistics = count_course_task_statistics(course_id=self.course.id)
+
+        self.assertEqual(7, len(statistics))
+
+    def test_get_course_task_statistics_is_cached_until_a_solution_changes(self):
+        get_course_task_statistics(course=self.course)
+
+        with self.assertNumQueries(0):
+            get_course_task_statistics(course=self.course)
+
+        SolutionFactory(task=self.gradable_task, user=self.students[1], status=Solution.OK)
+
+        statistics = get_course_task_statistics(course=self.course)
+        self.assertEqual(2, statistics[0]['students_with_a_passing_solution_count'])
+
+
+class TestIssueCertificates(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.tasks = IncludedTaskFactory.create_batch(4, course=self.course, gradable=True)
+
+    def enroll_students_passing(self, *, tasks_count, students_count=1):
+        students = StudentFactory.create_bulk(students_count)
+        enroll_students(course=self.course, user_ids=[student.id for student in students])
+        SolutionFactory.create_bulk(
+            tasks_count * students_count,
+            task=factory.Iterator(self.tasks[:tasks_count]),
+            user=factory.Iterator([student for student in students for _ in range(tasks_count)]),
+            status=Solution.OK
+        )
+
+        return students
+
+    def test_issue_certificates_to_students_that_passed_enough_tasks(self):
+        completed, = self.enroll_students_passing(tasks_count=2)
+        self.enroll_students_passing(tasks_count=1)
+        self.enroll_students_passing(tasks_count=0)
+
+        certificates = issue_certificates(course=self.course, min_completion=0.5)
+
+        self.assertEqual(
+            [completed.id],
+            [certificate.assignment.student_id for certificate in certificates]
+        )
+
+    def test_issue_certificates_skips_students_whose_passing_solutions_were_deleted(self):
+        student, = self.enroll_students_passing(tasks_count=2)
+        Solution.objects.filter(user=student, task=self.tasks[0]).delete()
+
+        self.assertEqual([], issue_certificates(course=self.course, min_completion=0.5))
+
+    def test_issue_certificates_skips_students_whose_solutions_were_regraded(self):
+        student, = self.enroll_students_passing(tasks_count=2)
+        solution = Solution.objects.get(user=student, task=self.tasks[0])
+        solution.status = Solution.NOT_OK
+        solution.save()
+
+        self.assertEqual([], issue_certificates(course=self.course, min_completion=0.5))
+
+    def test_issue_certificates_skips_students_that_already_have_one(self):
+        self.enroll_students_passing(tasks_count=4)
+        issue_certificates(course=self.course)
+
+        self.assertEqual([], issue_certificates(course=self.course))
+        self.assertEqual(1, Certificate.objects.count())
+
+    def test_issue_certificates_makes_the_same_queries_for_any_number_of_students(self):
+        self.enroll_students_passing(tasks_count=4)
+
+        with QueryRecorder() as one:
+            issue_certificates(course=self.course)
+
+        self.enroll_students_passing(tasks_count=4, students_count=10)
+
+        with QueryRecorder() as many:
+            certificates = issue_certificates(course=self.course)
+
+        self.assertEqual(10, len(certificates))
+        self.assertEqual(len(one), len(many), many.format())
+
+    def test_issue_certificates_after_the_certificates_period(self):
+        start_date = timezone.now().date() - timedelta(days=60)
+        course = CourseFactory(start_date=start_date, end_date=start_date + timedelta(days=30))
+
+        with self.assertRaises(ValidationError):
+            issue_certificates(course=course)
+
+
+class TestVerifyCertificate(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.student = BaseUserFactory()
+        enroll_students(course=self.course, user_ids=[self.student.id])
+        self.certificate = Certificate.objects.create(
+            assignment=CourseAssignment.objects.get(course=self.course, student=self.student)
+        )
+
+    def test_verify_certificate_returns_the_course_and_the_student_from_the_cache(self):
+        verify_certificate(token=self.certificate.token)
+
+        with self.assertNumQueries(0):
+            data = verify_certificate(token=self.certificate.token)
+
+        self.assertEqual(self.course.name, data['course'])
+        self.assertEqual(self.student.profile.full_name, data['student'])
+
+    def test_verify_certificate_does_not_cache_unknown_tokens(self):
+        token = faker.uuid4()
+
+        self.assertIsNone(verify_certificate(token=token))
+        self.assertIsNone(cache.get(get_certificate_cache_key(token=token)))
+
+    @mock.patch('odin.education.services.transaction.on_commit', side_effect=lambda func: func())
+    def test_verify_certificate_answers_issued_certificates_from_the_cache(self, on_commit):
+        student = BaseUserFactory()
+        enroll_students(course=self.course, user_ids=[student.id])
+        SolutionFactory(task=IncludedTaskFactory(course=self.course, gradable=True), user=student, status=Solution.OK)
+        certificate, = issue_certificates(course=self.course)
+
+        with self.assertNumQueries(0):
+            data = verify_certificate(token=certificate.token)
+
+        self.assertEqual(student.profile.full_name, data['student'])
+
+    def test_verify_certificate_picks_up_renamed_courses_and_students(self):
+        verify_certificate(token=self.certificate.token)
+
+        self.course.name = faker.word()
+        self.course.save()
+        self.student.profile.full_name = faker.name()
+        self.student.profile.save()
+
+        data = verify_certificate(token=self.certificate.token)
+
+        self.assertEqual(self.course.name, data['course'])
+        self.assertEqual(self.student.profile.full_name, data['student'])
+
+    def test_verify_certificate_forgets_deleted_certificates(self):
+        verify_certificate(token=self.certificate.token)
+
+        self.certificate.delete()
+
+        self.assertIsNone(verify_certificate(token=self.certificate.token))
+
+
+class TestRecordSolvedTask(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.gradable_task = IncludedTaskFactory(course=self.course, gradable=True)
+        self.non_gradable_task = IncludedTaskFactory(course=self.course, gradable=False)
+        self.student = StudentFactory()
+
+    def test_first_passing_solution_of_each_task_is_counted(self):
+        solution = SolutionFactory(task=self.gradable_task, user=self.student, status=Solution.OK)
+        SolutionFactory(task=self.gradable_task, user=self.student, status=Solution.OK)
+        SolutionFactory(
+            task=self.non_gradable_task,
+            user=self.student,
+            status=Solution.SUBMITTED_WITHOUT_GRADING
+        )
+
+        entry = LeaderboardEntry.objects.get(course=self.course, user=self.student)
+        self.assertEqual(2, entry.solved_tasks_count)
+        self.assertEqual(
+            solution.created_at,
+            SolvedTask.objects.get(task=self.gradable_task, user=self.student).solved_at
+        )
+
+    def test_solutions_that_do_not_pass_are_not_counted(self):
+        SolutionFactory(task=self.gradable_task, user=self.student, status=Solution.NOT_OK)
+        SolutionFactory(task=self.gradable_task, user=self.student, status=Solution.SUBMITTED_WITHOUT_GRADING)
+
+        self.assertFalse(LeaderboardEntry.objects.exists())
+
+    def test_graded_solution_is_counted_when_it_passes(self):
+        solution = SolutionFactory(task=self.gradable_task, user=self.student, status=Solution.PENDING)
+
+        solution.status = Solution.OK
+        solution.save()
+
+        self.assertEqual(1, LeaderboardEntry.objects.get(course=self.course, user=self.student).solved_tasks_count)
+
+    def test_record_solved_task_takes_a_single_query(self):
+        solution = SolutionFactory(task=self.gradable_task, user=self.student, status=Solution.NOT_OK)
+        solution.status = Solution.OK
+
+        with self.assertNumQueries(1):
+            self.assertTrue(record_solved_task(solution=solution))
+
+        with self.assertNumQueries(1):
+            self.assertFalse(record_solved_task(solution=solution))
+
+
+class TestRebuildLeaderboard(TestCase):
+    def setUp(self):
+        self.course = CourseFactory()
+        self.tasks = IncludedTaskFactory.create_batch(3, course=self.course, gradable=True)
+        self.students = StudentFactory.create_batch(2)
+        for task in self.tasks:
+            SolutionFactory(task=task, user=self.students[0], status=Solution.OK)
+        SolutionFactory(task=self.tasks[0], user=self.students[1], status=Solution.OK)
+
+    def test_rebuild_leaderboard_changes_nothing_when_it_is_up_to_date(self):
+        entries = set(LeaderboardEntry.objects.values_list('user_id', 'solved_tasks_count', 'last_solved_at'))
+
+        self.assertEqual(0, rebuild_leaderboard(course=self.course))
+        self.assertEqual(
+            entries,
+            set(LeaderboardEntry.objects.values_list('user_id', 'solved_tasks_count', 'last_solved_at'))
+        )
+
+    def test_rebuild_leaderboard_recounts_entries_that_drifted(self):
+        # `update` skips the signal that keeps the leaderboard up to date.
+        Solution.objects.filter(user=self.students[1]).update(status=Solution.NOT_OK)
+        LeaderboardEntry.objects.filter(user=self.students[0]).update(solved_tasks_count=1)
+
+        self.assertEqual(2, rebuild_leaderboard(course=self.course))
+        self.assertEqual(
+            {self.students[0].id: 3},
+            dict(LeaderboardEntry.objects.values_list('user_id', 'solved_tasks_count'))
+        )
+
+
+class TestGetCodeBlobStorageReport(TestCase):
+    def test_report_counts_duplicated_code_once(self):
+        code = 'print("Hello, world!")\n' * 50
+        for _ in range(3):
+            SolutionFactory(code=code)
+
+        report = get_code_blob_storage_report()
+
+        self.assertEqual(3, report['solutions'])
+        self.assertEqual(1, report['blobs'])
+        self.assertEqual(3 * len(code), report['logical_bytes'])
+        self.assertEqual(len(code), report['unique_bytes'])
+        self.assertLess(report['stored_bytes'], len(code))
+        self.assertEqual(report['logical_bytes'] - report['stored_bytes'], report['saved_bytes'])
@@ -14,70 +14,61 @@ from ..factories import (
 from ..models import Solution
 from ..services import add_student
 from ..utils import (
-    get_passed_and_failed_tasks,
-    get_solution_data,
+    get_task_results,
     get_all_solved_student_solution_count_for_course,
 )
 
 
-class TestGetPassedAndFailedTasks(TestCase):
+class TestGetTaskResults(TestCase):
     def setUp(self):
         self.course = CourseFactory()
         self.week = WeekFactory(course=self.course)
         self.gradable_task = IncludedTaskFactory(course=self.course, week=self.week, gradable=True)
         self.non_gradable_task = IncludedTaskFactory(course=self.course, week=self.week, gradable=False)
         self.user = BaseUserFactory()
-        self.student = StudentFactory()
-        add_student(course=self.course, student=self.student)
 
     def test_returns_task_passed_when_there_is_passing_solution_for_it(self):
-        passing_gradable_solution = SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.OK)
-        passing_non_gradable_solution = SolutionFactory(
-            user=self.user, task=self.non_gradable_task, status=Solution.SUBMITTED_WITHOUT_GRADING
-        )
+        SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.NOT_OK)
+        SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.OK)
+        SolutionFactory(user=self.user, task=self.non_gradable_task, status=Solution.SUBMITTED_WITHOUT_GRADING)
 
-        solution_data = {
-            self.gradable_task: [passing_gradable_solution],
-            self.non_gradable_task: [passing_non_gradable_solution]
-        }
-        result = get_passed_and_failed_tasks(solution_data)
-        self.assertEqual(settings.TASK_PASSED, result.get(self.gradable_task.name))
-        self.assertEqual(settings.TASK_PASSED, result.get(self.non_gradable_task.name))
+        results = get_task_results(self.course, [self.user.id])[self.user.id]
+
+        self.assertEqual(
+            {'name': self.gradable_task.name, 'status': settings.TASK_PASSED, 'solutions_count': 2},
+            results[self.gradable_task.id]
+        )
+        self.assertEqual(settings.TASK_PASSED, results[self.non_gradable_task.id]['status'])
 
     def test_returns_task_failed_when_there_are_only_failing_solutions_for_it(self):
-        failing_solution = SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.NOT_OK)
-        solution_data = {
-            self.gradable_task: [failing_solution]
-        }
-        result = get_passed_and_failed_tasks(solution_data)
-        self.assertEqual(settings.TASK_FAILED, result.get(self.gradable_task.name))
+        SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.NOT_OK)
+        SolutionFactory(user=self.user, task=self.non_gradable_task, status=Solution.NOT_OK)
 
+        results = get_task_results(self.course, [self.user.id])[self.user.id]
 
-class TestGetSolutionData(TestCase):
-    def setUp(self):
-        self.course = CourseFactory()
-        self.week = WeekFactory(course=self.course)
-        self.gradable_task = IncludedTaskFactory(course=self.course, week=self.week, gradable=True)
-        self.non_gradable_task = IncludedTaskFactory(course=self.course, week=self.week, gradable=False)
-        self.student = StudentFactory()
-        self.user = BaseUserFactory()
-        add_student(course=self.course, student=self.student)
+        self.assertEqual(settings.TASK_FAILED, results[self.gradable_task.id]['status'])
+        self.assertEqual(settings.TASK_FAILED, results[self.non_gradable_task.id]['status'])
 
-    def test_solutions_to_tasks_are_added_successfully_to_solution_data(self):
-        gradable_solution = SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.OK)
-        non_gradable_solution = SolutionFactory(
-            user=self.user, task=self.non_gradable_task, status=Solution.SUBMITTED_WITHOUT_GRADING
-        )
+    def test_task_is_left_out_if_there_are_no_solutions_for_it(self):
+        SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.OK)
+
+        results = get_task_results(self.course, [self.user.id])
 
-        solution_data, _ = get_solution_data(course=self.course, user=self.user)
+        self.assertEqual([self.gradable_task.id], list(results[self.user.id]))
 
-        self.assertEqual([gradable_solution], solution_data.get(self.gradable_task))
-        self.assertEqual([non_gradable_solution], solution_data.get(self.non_gradable_task))
+    def test_returns_the_results_of_many_users_in_a_single_query(self):
+        users = BaseUserFactory.create_bulk(3)
+        for user in users:
+            SolutionFactory(user=user, task=self.gradable_task, status=Solution.OK)
+        SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.NOT_OK)
+        SolutionFactory(task=IncludedTaskFactory(), user=self.user, status=Solution.OK)
 
-    def test_task_is_not_added_as_key_if_no_solutions_for_it(self):
-        solution_data, _ = get_solution_data(course=self.course, user=self.user)
+        with self.assertNumQueries(1):
+            results = get_task_results(self.course, [user.id for user in users] + [self.user.id])
 
-        self.assertIsNone(solution_data.get(self.gradable_task))
+        self.assertEqual({user.id for user in users} | {self.user.id}, set(results))
+        self.assertEqual(settings.TASK_FAILED, results[self.user.id][self.gradable_task.id]['status'])
+        self.assertEqual(1, len(results[self.user.id]))
 
 
 class TestGetAllSolvedStudentSolutionCountForCourse(TestCase):
@@ -110,3 +101,16 @@ class TestGetAllSolvedStudentSolutionCountForCourse(TestCase):
         students_passed_solution_count = get_all_solved_student_solution_count_for_course(course=self.course)
 
         self.assertIsNone(students_passed_solution_count.get(self.user.email))
+
+    def test_every_student_gets_the_count_of_their_own_passed_tasks(self):
+        other_user = BaseUserFactory()
+        SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.OK)
+        SolutionFactory(user=self.user, task=self.gradable_task, status=Solution.OK)
+        SolutionFactory(user=other_user, task=self.gradable_task, status=Solution.OK)
+        SolutionFactory(
+            user=other_user, task=self.non_gradable_task, status=Solution.SUBMITTED_WITHOUT_GRADING
+        )
+
+        students_passed_solution_count = get_all_solved_student_solution_count_for_course(course=self.course)
+
+        self.assertEqual({self.user.email: 1, other_user.email: 2}, students_passed_solution_count)
@@ -1,54 +1,39 @@
-from typing import Dict, Set
+from typing import Dict, Iterable, Set
 
-from django.db.models import Q
 from django.conf import settings
+from django.db.models import Q, Sum, Case, When, Count, IntegerField
 
 from .models import Solution, Course, Week
 
-from odin.users.models import BaseUser
 
-
-def get_passed_and_failed_tasks(solution_data: Dict) -> Dict:
+def get_task_results(course: Course, user_ids: Iterable[int]) -> Dict[int, Dict[int, Dict]]:
     """
-    Fills up a dictionary with the status of tasks:
-        "Passed" when a task has a passing solution, i.e. when a solution's status is Solution.OK
-        "Failed" when a task has no passing solution
+    For every user in `user_ids` and every task of `course` they submitted, in a single query:
+        "status" is settings.TASK_PASSED when one of the solutions passed, i.e. Solution.OK for gradable tasks
+        and Solution.SUBMITTED_WITHOUT_GRADING for the rest, settings.TASK_FAILED otherwise
+        "solutions_count" is the number of solutions
+    Tasks without solutions are left out.
     """
-    passed_or_failed = {}
-    for task, solutions in solution_data.items():
-        if task.gradable:
-            for solution in solutions:
-                if solution.status == Solution.OK:
-                    passed_or_failed[task.name] = settings.TASK_PASSED
-            if not passed_or_failed.get(task.name):
-                passed_or_failed[task.name] = settings.TASK_FAILED
-        else:
-            for solution in solutions:
-                if solution.status == Solution.SUBMITTED_WITHOUT_GRADING:
-                    passed_or_failed[task.name] = settings.TASK_PASSED
-            if not passed_or_failed[task.name]:
-                passed_or_failed[task.name] = settings.TASK_FAILED
-
-    return passed_or_failed
-
+    passed = Q(task__gradable=True, status=Solution.OK) \
+        | Q(task__gradable=False, status=Solution.SUBMITTED_WITHOUT_GRADING)
 
-def get_solution_data(course: Course, user: BaseUser) -> (Dict, Dict):
-    """
-    Fetch all of `user` solutions for `course` tasks and group them by task
-    Get passed and failed tasks and then return the data
-    """
-    all_solutions = user.solutions.filter(task__course=course).prefetch_related('task')
-    solution_data = {}
-    for solution in all_solutions:
-        task_solutions = solution_data.get(solution.task)
-        if task_solutions:
-            solution_data[solution.task].append(solution)
-        else:
-            solution_data[solution.task] = [solution]
+    rows = Solution.objects.filter(
+        task__course=course,
+        user_id__in=list(user_ids)
+    ).order_by().values('user_id', 'task_id', 'task__name').annotate(
+        solutions_count=Count('id'),
+        passed_count=Sum(Case(When(passed, then=1), default=0, output_field=IntegerField()))
+    )
 
-    passed_and_failed = get_passed_and_failed_tasks(solution_data)
+    results = {}
+    for row in rows:
+        results.setdefault(row['user_id'], {})[row['task_id']] = {
+            'name': row['task__name'],
+            'status': settings.TASK_PASSED if row['passed_count'] else settings.TASK_FAILED,
+            'solutions_count': row['solutions_count'],
+        }
 
-    return solution_data, passed_and_failed
+    return results
 
 
 def map_lecture_dates_to_week_days(course: Course) -> (Set, Dict):
@@ -59,7 +44,7 @@ def map_lecture_dates_to_week_days(course: Course) -> (Set, Dict):
         schedule[week.number] = {}
         lectures = week.lectures.all()
 
-        if not lectures.exists():
+        if not lectures:
             continue
 
         for lecture in lectures:
@@ -75,17 +60,7 @@ def map_lecture_dates_to_week_days(course: Course) -> (Set, Dict):
 
 
 def get_all_solved_student_solution_count_for_course(course: Course) -> Dict:
-    q_expression = Q(task__gradable=True, status=2) | Q(task__gradable=False, status=6)
-    all_passed_solutions = Solution.objects.filter(
-        q_expression, task__course=course
-    ).order_by('task').distinct('task').prefetch_related('user')
-
-    students_passed_solutions_count = {}
-    for solution in all_passed_solutions:
-        solutions_for_student = students_passed_solutions_count.get(solution.user.email)
-        if solutions_for_student:
-            students_passed_solutions_count[solution.user.email] += 1
-        else:
-            students_passed_solutions_count[solution.user.email] = 1
-
-    return students_passed_solutions_count
+    """
+    The number of passed tasks of `course` for every user that passed at least one, by email.
+    """
+    return dict(course.leaderboard_entries.values_list('user__email', 'solved_tasks_count'))
@@ -0,0 +1,50 @@
+from datetime import time
+
+from django.utils import timezone
+
+from odin.common.benchmarks import benchmark
+from odin.common.faker import faker
+from odin.users.factories import BaseUserFactory
+from odin.education.factories import CourseFactory
+from odin.applications.factories import ApplicationInfoFactory, ApplicationFactory
+
+from .models import Interviewer, InterviewerFreeTime
+from .services import generate_interview_slots
+
+
+@benchmark('interviews.generate_interview_slots')
+def interview_slots(runner, *, interviewers_count=50, days_count=5, applications_count=1000):
+    today = timezone.now().date()
+    application_info = ApplicationInfoFactory(
+        course=CourseFactory(start_date=today + timezone.timedelta(days=30)),
+        start_date=today - timezone.timedelta(days=10),
+        end_date=today - timezone.timedelta(days=5),
+        start_interview_date=today - timezone.timedelta(days=1),
+        end_interview_date=today + timezone.timedelta(days=days_count + 1)
+    )
+
+    for _ in range(runner.scaled(interviewers_count)):
+        interviewer = Interviewer.objects.create_from_user(BaseUserFactory())
+        interviewer.courses_to_interview.add(application_info)
+        interviewer.profile.skype = faker.word()
+        interviewer.profile.save()
+
+        InterviewerFreeTime.objects.bulk_create([
+            InterviewerFreeTime(
+                interviewer=interviewer,
+                date=today + timezone.timedelta(days=day),
+                start_time=time(hour=10),
+                end_time=time(hour=18)
+            )
+            for day in range(1, days_count + 1)
+        ])
+
+    for _ in range(runner.scaled(applications_count)):
+        ApplicationFactory(application_info=application_info)
+
+    runner.measure(
+        f'{runner.scaled(interviewers_count)} interviewers, {runner.scaled(applications_count)} applications',
+        generate_interview_slots,
+        repeat=max(1, runner.repeat // 4),
+        rollback=True
+    )
@@ -0,0 +1,104 @@
+from datetime import datetime, time, timedelta
+from typing import Dict, List
+
+import factory
+
+from django.db.models import TextField, Value
+from django.db.models.functions import Cast, Concat
+from django.utils import timezone
+
+from odin.users.models import Profile
+from odin.users.factories import BaseUserFactory
+from odin.applications.models import Application
+from odin.applications.factories import ApplicationInfoFactory, ApplicationFactory
+from odin.education.models import Course
+
+from .models import Interviewer
+from .factories import InterviewerFactory, InterviewerFreeTimeFactory, InterviewFactory
+
+
+def generate_interviews_dataset(
+    *,
+    courses: List[Course],
+    applications_count: int=5000,
+    interviewers_count: int=50,
+    days_count: int=5,
+    password: str=None
+) -> Dict:
+    """
+    Opens `courses` for interviews and generates applications for them,
+    interviewers with a working day of free time for each of the next `days_count` days
+    and the interview slots of that free time, filled with as many applications as fit.
+
+    Everything is inserted in bulk, see `BulkCreateFactoryMixin`.
+    """
+    today = timezone.now().date()
+    user_kwargs = {} if password is None else {'password': password}
+
+    application_infos = ApplicationInfoFactory.create_bulk(
+        len(courses),
+        course=factory.Iterator(courses, cycle=False),
+        start_date=today - timedelta(days=20),
+        end_date=today - timedelta(days=10),
+        start_interview_date=today - timedelta(days=1),
+        end_interview_date=today + timedelta(days=days_count + 1)
+    )
+
+    applications = ApplicationFactory.create_bulk(
+        applications_count,
+        user=factory.Iterator(BaseUserFactory.create_bulk(applications_count, **user_kwargs), cycle=False),
+        application_info=factory.Iterator(application_infos)
+    )
+
+    interviewers = InterviewerFactory.create_bulk(interviewers_count, **user_kwargs)
+    # Interviewers without skype block the interview generation.
+    Profile.objects.filter(user__in=interviewers).update(
+        skype=Concat(Value('interviewer.'), Cast('user_id', TextField()))
+    )
+
+    Interviewer.courses_to_interview.through.objects.bulk_create([
+        Interviewer.courses_to_interview.through(interviewer=interviewer, applicationinfo=application_info)
+        for interviewer in interviewers
+        for application_info in application_infos
+    ])
+
+    start_time, free_minutes, interview_time_length, break_time = time(hour=10), 8 * 60, 20, 10
+    free_time_slots = InterviewerFreeTimeFactory.create_bulk(
+        interviewers_count * days_count,
+        interviewer=factory.Iterator([interviewer for interviewer in interviewers for _ in range(days_count)]),
+        date=factory.Iterator([today + timedelta(days=day) for day in range(1, days_count + 1)]),
+        start_time=start_time,
+        end_time=(datetime.combine(today, start_time) + timedelta(minutes=free_minutes)).time(),
+        interview_time_length=interview_time_length,
+        break_time=break_time
+    )
+
+    # The slots `GenerateInterviewSlots` makes out of the free time
+    slots = [
+        (free_time, (datetime.combine(free_time.date, start_time) + timedelta(minutes=minutes)).time())
+        for free_time in free_time_slots
+        for minutes in range(0, free_minutes - interview_time_length + 1, interview_time_length + break_time)
+    ]
+    slot_applications = applications[:len(slots)] + [None] * (len(slots) - len(applications))
+
+    interviews = InterviewFactory.create_bulk(
+        len(slots),
+        interviewer=factory.Iterator([free_time.interviewer for free_time, _ in slots], cycle=False),
+        interviewer_time_slot=factory.Iterator([free_time for free_time, _ in slots], cycle=False),
+        date=factory.Iterator([free_time.date for free_time, _ in slots], cycle=False),
+        start_time=factory.Iterator([slot_start for _, slot_start in slots], cycle=False),
+        end_time=None,
+        application=factory.Iterator(slot_applications, cycle=False),
+        interviewer_comment=None
+    )
+
+    Application.objects.filter(
+        id__in=[application.id for application in slot_applications if application is not None]
+    ).update(has_interview_date=True)
+
+    return {
+        'application_infos': application_infos,
+        'applications': applications,
+        'interviewers': interviewers,
+        'interviews': interviews,
+    }
@@ -3,6 +3,7 @@ import factory
 from django.utils import timezone
 
 from odin.common.faker import faker
+from odin.common.factories import BulkCreateFactoryMixin
 from odin.applications.factories import ApplicationFactory
 from odin.users.factories import BaseUserFactory
 
@@ -15,8 +16,12 @@ class InterviewerFactory(BaseUserFactory):
     class Meta:
         model = Interviewer
 
+    @classmethod
+    def create_bulk(cls, size, **kwargs):
+        return Interviewer.objects.bulk_create_from_users(BaseUserFactory.create_bulk(size, **kwargs))
 
-class InterviewerFreeTimeFactory(factory.DjangoModelFactory):
+
+class InterviewerFreeTimeFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     interviewer = factory.SubFactory(InterviewerFactory)
     date = factory.LazyAttribute(lambda _:  timezone.now().date() + timezone.timedelta(days=faker.pyint()))
     start_time = factory.LazyAttribute(lambda _: timezone.now().time())
@@ -26,7 +31,7 @@ class InterviewerFreeTimeFactory(factory.DjangoModelFactory):
         model = InterviewerFreeTime
 
 
-class InterviewFactory(factory.DjangoModelFactory):
+class InterviewFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     interviewer = factory.SubFactory(InterviewerFactory)
     application = factory.SubFactory(ApplicationFactory)
     date = factory.LazyAttribute(lambda _: faker.date_object())
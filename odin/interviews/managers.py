@@ -2,12 +2,15 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from django.apps import apps
 
+from odin.users.managers import RoleManagerMixin
 from odin.users.models import BaseUser
 
 from .query import InterviewQuerySet
 
 
-class InterviewerManager(models.Manager):
+class InterviewerManager(RoleManagerMixin, models.Manager):
+    role_user_fields = {'is_active': True, 'is_staff': True}
+
     def create_from_user(self, user: BaseUser):
         Interviewer = apps.get_model('interviews', 'Interviewer')
         if user.downcast(Interviewer) is not None:
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Free interview slots are always looked up per interviewer with `application IS NULL`.
+    Django 1.11 indexes cannot have a condition, hence the raw SQL.
+    """
+
+    dependencies = [
+        ('interviews', '0003_auto_20170822_1357'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX interviews_interview_free_slots_idx '
+                'ON interviews_interview (interviewer_id) WHERE application_id IS NULL;',
+            reverse_sql='DROP INDEX interviews_interview_free_slots_idx;',
+        ),
+    ]
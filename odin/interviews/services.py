@@ -9,10 +9,10 @@ from django.db.models import QuerySet
 
 from odin.common.services import send_email
 from odin.applications.models import Application, ApplicationInfo
-from odin.education.models import Course, Student, CourseAssignment
+from odin.education.models import Course
 from .models import Interview, Interviewer, InterviewerFreeTime
 from .helpers.interviews import GenerateInterviews, GenerateInterviewSlots
-from odin.education.services import add_student
+from odin.education.services import enroll_students
 
 
 def create_new_interview_for_application(*,
@@ -149,12 +149,7 @@ def send_interview_confirmation_emails():
 def assign_accepted_users_to_courses():
     active_application_infos = ApplicationInfo.objects.get_open_for_interview()
     for info in active_application_infos:
-        accepted = info.accepted_applicants
-        for application in accepted:
-            if not application.user.is_student():
-                student = Student.objects.create_from_user(application.user)
-            else:
-                student = application.user.student
-
-            if not CourseAssignment.objects.filter(course=info.course, student=student):
-                add_student(course=info.course, student=student)
+        enroll_students(
+            course=info.course,
+            user_ids=info.applications.filter(is_accepted=True).values_list('user_id', flat=True)
+        )
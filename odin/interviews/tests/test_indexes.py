@@ -0,0 +1,21 @@
+from test_plus import TestCase
+
+from odin.common.testing import QueryPlanAssertionsMixin
+
+from ..factories import InterviewFactory, InterviewerFactory
+from ..models import Interview
+
+
+class TestHotQueryIndexes(QueryPlanAssertionsMixin, TestCase):
+    def setUp(self):
+        self.interviewer = InterviewerFactory()
+
+        for _ in range(3):
+            InterviewFactory(interviewer=self.interviewer, application=None)
+            InterviewFactory(interviewer=self.interviewer)
+
+    def test_free_slots_for_interviewer(self):
+        self.assertUsesIndexes(
+            Interview.objects.get_free_slots().filter(interviewer=self.interviewer),
+            index='interviews_interview_free_slots_idx'
+        )
@@ -4,7 +4,7 @@ from odin.applications.factories import ApplicationFactory, ApplicationInfoFacto
 from odin.users.factories import BaseUserFactory
 from odin.education.factories import CourseFactory
 
-from ..models import Interview
+from ..models import Interview, Interviewer
 from ..factories import InterviewFactory
 
 
@@ -39,3 +39,13 @@ class TestInterviews(TestCase):
 
         self.assertEqual(confirmed_interviews_for_user + 1,
                          Interview.objects.confirmed_interviews_on(self.user).count())
+
+
+class TestInterviewerManager(TestCase):
+    def test_bulk_create_from_users_makes_staff_interviewers(self):
+        users = [BaseUserFactory() for _ in range(2)]
+
+        interviewers = Interviewer.objects.bulk_create_from_users(users)
+
+        self.assertEqual([user.id for user in users], [interviewer.id for interviewer in interviewers])
+        self.assertTrue(all(interviewer.is_staff and interviewer.is_active for interviewer in interviewers))
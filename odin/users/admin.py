@@ -5,6 +5,20 @@ from odin.users.models import (
     Profile,
     PasswordResetToken
 )
+from odin.education.models import Student, Teacher
+from odin.interviews.models import Interviewer
+
+
+def make_role_action(model):
+    def promote(modeladmin, request, queryset):
+        promoted = model.objects.bulk_create_from_users(queryset)
+
+        modeladmin.message_user(request, f'{len(promoted)} users are {model._meta.verbose_name_plural} now')
+
+    promote.__name__ = f'make_{model._meta.model_name}s'
+    promote.short_description = f'Make the selected users {model._meta.verbose_name_plural}'
+
+    return promote
 
 
 @admin.register(BaseUser)
@@ -12,6 +26,7 @@ class BaseUserAdmin(admin.ModelAdmin):
     list_display = ('email', 'is_student', 'is_teacher', 'is_superuser')
     search_fields = ('email',)
     ordering = ('id',)
+    actions = [make_role_action(Student), make_role_action(Teacher), make_role_action(Interviewer)]
 
 
 @admin.register(Profile)
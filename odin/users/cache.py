@@ -0,0 +1,81 @@
+from typing import List
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+USER_PRINCIPAL_CACHE_KEY = 'users:principal:{user_id}'
+
+
+def get_user_principal_cache_key(*, user_id: int) -> str:
+    return USER_PRINCIPAL_CACHE_KEY.format(user_id=user_id)
+
+
+def get_cached_user(*, user_id: int):
+    """
+    Returns the `BaseUser` with the given id, reading it from the cache when possible.
+
+    Populates with `cache.add` so a request that read the row before a concurrent
+    `invalidate_cached_user` committed cannot overwrite the refreshed entry.
+    Raises `BaseUser.DoesNotExist` if there is no such user.
+    """
+    BaseUser = apps.get_model('users', 'BaseUser')
+    key = get_user_principal_cache_key(user_id=user_id)
+
+    user = cache.get(key)
+
+    if user is None:
+        user = BaseUser.objects.get(id=user_id)
+        cache.add(key, user, settings.USER_PRINCIPAL_CACHE_TIMEOUT)
+
+    return user
+
+
+def _refresh_cached_user(*, user_id: int):
+    BaseUser = apps.get_model('users', 'BaseUser')
+    key = get_user_principal_cache_key(user_id=user_id)
+
+    user = BaseUser.objects.filter(id=user_id).first()
+
+    if user is None:
+        cache.delete(key)
+    else:
+        cache.set(key, user, settings.USER_PRINCIPAL_CACHE_TIMEOUT)
+
+
+def invalidate_cached_user(*, user_id: int):
+    """
+    Drops the cached principal right away and replaces it with the committed row
+    once the surrounding transaction commits.
+    """
+    cache.delete(get_user_principal_cache_key(user_id=user_id))
+
+    transaction.on_commit(lambda: _refresh_cached_user(user_id=user_id))
+
+
+def _refresh_cached_users(*, user_ids: List[int]):
+    BaseUser = apps.get_model('users', 'BaseUser')
+
+    users = {user.id: user for user in BaseUser.objects.filter(id__in=user_ids)}
+
+    cache.delete_many([get_user_principal_cache_key(user_id=user_id) for user_id in user_ids if user_id not in users])
+    cache.set_many(
+        {get_user_principal_cache_key(user_id=user_id): user for user_id, user in users.items()},
+        settings.USER_PRINCIPAL_CACHE_TIMEOUT
+    )
+
+
+def invalidate_cached_users(*, user_ids: List[int]):
+    """
+    `invalidate_cached_user` for many users, for writes that skip `BaseUser.save` like `update`.
+    """
+    user_ids = list(user_ids)
+
+    if not user_ids:
+        return
+
+    cache.delete_many([get_user_principal_cache_key(user_id=user_id) for user_id in user_ids])
+
+    transaction.on_commit(lambda: _refresh_cached_users(user_ids=user_ids))
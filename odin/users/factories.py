@@ -1,17 +1,47 @@
 import factory
 import uuid
+
+from django.contrib.auth.hashers import make_password
+
 from odin.common.faker import faker
+from odin.common.factories import BulkCreateFactoryMixin
 
 from .models import Profile, BaseUser, PasswordResetToken
 
 
-class BaseUserFactory(factory.DjangoModelFactory):
+class ProfileFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
+    full_name = factory.LazyAttribute(lambda _: faker.name())
+    description = factory.LazyAttribute(lambda _: faker.text())
+
+    class Meta:
+        model = Profile
+
+
+class BaseUserFactory(BulkCreateFactoryMixin, factory.DjangoModelFactory):
     class Meta:
         model = BaseUser
 
     email = factory.Sequence(lambda n: '{}{}'.format(n, faker.email()))
     password = faker.password()
 
+    @classmethod
+    def _before_create_bulk(cls, users):
+        if any(user.is_superuser for user in users):
+            raise ValueError('Superusers become teachers in every course, create them one by one.')
+
+        # Hashing is slow on purpose, so every distinct password is hashed once.
+        hashed = {}
+        for user in users:
+            if user.password not in hashed:
+                hashed[user.password] = make_password(user.password)
+
+            user.password = hashed[user.password]
+
+    @classmethod
+    def _after_create_bulk(cls, users):
+        # Replaces `create_profile_upon_user_creation`
+        ProfileFactory.create_bulk(len(users), user=factory.Iterator(users, cycle=False))
+
 
 class SuperUserFactory(BaseUserFactory):
     """
@@ -25,14 +55,6 @@ class SuperUserFactory(BaseUserFactory):
         return manager.create_superuser(*args, **kwargs)
 
 
-class ProfileFactory(factory.DjangoModelFactory):
-    full_name = factory.LazyAttribute(lambda _: faker.name())
-    description = factory.LazyAttribute(lambda _: faker.text())
-
-    class Meta:
-        model = Profile
-
-
 class PasswordResetTokenFactory(factory.DjangoModelFactory):
     class Meta:
         model = PasswordResetToken
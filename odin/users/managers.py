@@ -1,4 +1,13 @@
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable, List
+
+from django.apps import apps
 from django.contrib.auth.models import BaseUserManager
+from django.db import connection
+from django.db.models import Q
+
+from .cache import invalidate_cached_users
 
 
 class UserManager(BaseUserManager):
@@ -45,3 +54,58 @@ class UserManager(BaseUserManager):
         Important to have this to get factories working by default
         """
         return self.create_user(**kwargs)
+
+
+class RoleManagerMixin:
+    """
+    For managers of the `BaseUser` subclasses that give users a role, like `Student`.
+    """
+    role_user_fields: Dict = {'is_active': True}
+
+    def bulk_create_from_users(self, users: Iterable) -> List:
+        """
+        `create_from_user` for many users at once.
+        Users that already have the role are left as they are.
+        Returns the typed instances of all `users`, ordered by id.
+        """
+        user_ids = sorted({user.id for user in users})
+
+        if not user_ids:
+            return []
+
+        self.bulk_create_from_user_ids(user_ids)
+
+        return list(self.filter(id__in=user_ids).order_by('id'))
+
+    def bulk_create_from_user_ids(self, user_ids: Iterable[int]) -> List[int]:
+        """
+        `bulk_create_from_users` for callers that only have the ids, without loading any user.
+        Inserts the missing role rows in one statement and sets `role_user_fields`
+        on the newly promoted users in one update.
+        Returns the ids of the newly promoted users.
+        """
+        BaseUser = apps.get_model('users', 'BaseUser')
+        user_ids = sorted(set(user_ids))
+
+        if not user_ids:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {self.model._meta.db_table} ({self.model._meta.pk.column})
+                SELECT unnest(%s::integer[])
+                    ON CONFLICT DO NOTHING
+             RETURNING {self.model._meta.pk.column}
+                """,
+                [user_ids]
+            )
+            promoted = [user_id for user_id, in cursor.fetchall()]
+
+        differs = reduce(or_, [~Q(**{field: value}) for field, value in self.role_user_fields.items()])
+        changed = list(BaseUser.objects.filter(differs, id__in=promoted).values_list('id', flat=True))
+        BaseUser.objects.filter(id__in=changed).update(**self.role_user_fields)
+        # `update` skips `BaseUser.save`, which keeps the cached principals fresh.
+        invalidate_cached_users(user_ids=changed)
+
+        return promoted
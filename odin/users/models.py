@@ -15,6 +15,7 @@ from odin.common.models import (
 )
 
 from .managers import UserManager
+from .cache import invalidate_cached_user
 
 
 class BaseUser(PermissionsMixin,
@@ -35,6 +36,16 @@ class BaseUser(PermissionsMixin,
         self.full_clean()
         super().save(*args, **kwargs)
 
+        invalidate_cached_user(user_id=self.id)
+
+    def delete(self, *args, **kwargs):
+        user_id = self.id
+        result = super().delete(*args, **kwargs)
+
+        invalidate_cached_user(user_id=user_id)
+
+        return result
+
     def downcast(self, t):
         """
         Since we don't know if the given field is present,
@@ -91,6 +102,10 @@ class BaseUser(PermissionsMixin,
         return hasattr(self, 'interviewer')
 
     def rotate_secret_key(self):
+        """
+        Invalidates every JWT issued so far.
+        `save` drops the cached principal, so the old key stops verifying immediately.
+        """
         self.secret_key = uuid.uuid4()
         self.save()
 
@@ -4,7 +4,7 @@ from django.dispatch import receiver
 from .models import BaseUser, Profile
 
 from odin.education.models import Teacher, Course
-from odin.education.services import add_teacher
+from odin.education.services import add_teachers_to_courses
 
 
 @receiver(post_save, sender=BaseUser)
@@ -18,6 +18,8 @@ def make_new_superuser_teacher(sender, instance, created, **kwargs):
     if created:
         if instance.is_superuser:
             teacher = Teacher.objects.create_from_user(instance)
-            teacher.save()
-            for course in Course.objects.all():
-                add_teacher(course, teacher, hidden=True)
+            add_teachers_to_courses(
+                teacher_ids=[teacher.id],
+                course_ids=Course.objects.values_list('id', flat=True),
+                hidden=True
+            )